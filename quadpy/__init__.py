@@ -1,32 +1,5 @@
-from . import (
-    ball,
-    circle,
-    disk,
-    e1r,
-    e1r2,
-    e2r,
-    e2r2,
-    e3r,
-    e3r2,
-    enr,
-    enr2,
-    helpers,
-    hexahedron,
-    line_segment,
-    nball,
-    ncube,
-    nsimplex,
-    pyramid,
-    quadrilateral,
-    sphere,
-    tetrahedron,
-    tools,
-    triangle,
-    wedge,
-)
 from .__about__ import __version__
-from ._scipy_compat import quad
-from .tanh_sinh import tanh_sinh, tanh_sinh_lr
+from ._lazy import lazy_import
 
 __all__ = [
     "__version__",
@@ -52,9 +25,53 @@ __all__ = [
     "sphere",
     "tanh_sinh",
     "tanh_sinh_lr",
+    "tanh_sinh_vec",
+    "exp_sinh",
+    "sinh_sinh",
     "triangle",
     "tetrahedron",
     "wedge",
     "tools",
     "quad",
+    "quad_vec",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    submodules=[
+        "ball",
+        "circle",
+        "disk",
+        "e1r",
+        "e1r2",
+        "e2r",
+        "e2r2",
+        "e3r",
+        "e3r2",
+        "enr",
+        "enr2",
+        "helpers",
+        "hexahedron",
+        "line_segment",
+        "nball",
+        "ncube",
+        "nsimplex",
+        "pyramid",
+        "quadrilateral",
+        "sphere",
+        "tetrahedron",
+        "tools",
+        "triangle",
+        "wedge",
+    ],
+    attributes={
+        "._scipy_compat": ["quad", "quad_vec"],
+        "._tanh_sinh": [
+            "exp_sinh",
+            "sinh_sinh",
+            "tanh_sinh",
+            "tanh_sinh_lr",
+            "tanh_sinh_vec",
+        ],
+    },
+)
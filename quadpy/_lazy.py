@@ -0,0 +1,47 @@
+import importlib
+import sys
+
+
+def lazy_import(package, submodules=(), attributes=None):
+    """Returns module-level `__getattr__` and `__dir__` functions (PEP 562) for the
+    package `package` which import subpackages and attributes only when they are first
+    accessed. This keeps `import quadpy` cheap; sympy, mpmath etc. are only imported
+    once a scheme that needs them is requested.
+
+    `submodules` lists (relative) submodules which are exposed as attributes.
+    `attributes` maps (relative) module names to the lists of names they provide;
+    `(name, alias)` tuples provide `name` as `alias`.
+    """
+    if attributes is None:
+        attributes = {}
+
+    # alias -> module name
+    origin = {name: "." + name for name in submodules}
+    # module name -> list of (name, alias)
+    provides = {"." + name: [] for name in submodules}
+    for module_name, names in attributes.items():
+        provides[module_name] = []
+        for name in names:
+            name, alias = name if isinstance(name, tuple) else (name, name)
+            origin[alias] = module_name
+            provides[module_name].append((name, alias))
+
+    def __getattr__(name):
+        try:
+            module_name = origin[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        module = importlib.import_module(module_name, package)
+        # Store all attributes of the module in the package namespace so that
+        # __getattr__ isn't called for them again.
+        namespace = vars(sys.modules[package])
+        if name in submodules:
+            namespace[name] = module
+        for orig, alias in provides[module_name]:
+            namespace[alias] = getattr(module, orig)
+        return namespace[name]
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(origin))
+
+    return __getattr__, __dir__
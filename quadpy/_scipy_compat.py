@@ -1,13 +1,119 @@
 import numpy
 
+from ._tanh_sinh import exp_sinh, sinh_sinh, tanh_sinh
+from .helpers.stats import instrument
 from .line_segment import integrate_adaptive
 
 
 # compatibility for scipy.quad
 # https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.quad.html
-def quad(f, a, b, args=(), epsabs=1.49e-08, epsrel=1.49e-08, limit=50):
+@instrument(coordinate_axis=False)
+def quad(
+    f,
+    a,
+    b,
+    args=(),
+    epsabs=1.49e-08,
+    epsrel=1.49e-08,
+    limit=50,
+    extrapolate=True,
+    method="gauss_kronrod",
+):
+    """Adaptive Gauss-Kronrod integration of `f` over [a, b] where the limits may be
+    infinite. Like QUADPACK's QAGS, this uses a global adaptive strategy and, unless
+    `extrapolate=False`, Wynn's epsilon algorithm for accelerating the convergence
+    towards singularities.
+
+    With `method="double_exponential"`, the integral is computed with `tanh_sinh`,
+    `exp_sinh` or `sinh_sinh` instead, depending on which limits are infinite, with
+    the absolute tolerance `epsabs`. This is often much faster for slowly decaying
+    integrands on infinite intervals.
+    """
     assert a <= b
+    assert method in [
+        "gauss_kronrod",
+        "double_exponential",
+    ], f"Illegal method {method}."
+    if method == "double_exponential":
+        return _quad_de(f, a, b, args, epsabs)
+
+    g, a, b = _transform(f, a, b, args)
+    return integrate_adaptive(
+        g,
+        [a, b],
+        eps_abs=epsabs,
+        eps_rel=epsrel,
+        max_num_subintervals=limit,
+        strategy="global",
+        extrapolate=extrapolate,
+    )
+
+
+# compatibility for scipy.quad_vec
+# https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.quad_vec.html
+@instrument(coordinate_axis=False)
+def quad_vec(
+    f,
+    a,
+    b,
+    args=(),
+    epsabs=1.0e-200,
+    epsrel=1.0e-08,
+    norm="2",
+    limit=10000,
+    extrapolate=False,
+    full_output=False,
+):
+    """Adaptive integration of the array-valued `f` over [a, b]. `f(x, *args)` must
+    accept an array `x` of points and return an array of shape `range_shape + x.shape`.
+
+    `a` and `b` can also be arrays of (finite) limits; then all integrals are computed
+    at once and the results have the shape `range_shape + a.shape`. `epsabs` and
+    `epsrel` can be arrays of shape `range_shape` for per-component tolerances. `norm`
+    (`"max"` or `"2"`) determines how the component errors are combined for the
+    convergence check. Only the intervals of integrals that haven't converged yet are
+    refined. `limit` is the maximum number of subintervals per integral.
+
+    If `full_output` is True, a dictionary with the number of function evaluations and
+    subintervals per integral is returned as third value.
+    """
+    if numpy.ndim(a) == 0 and numpy.ndim(b) == 0:
+        assert a <= b
+        g, a, b = _transform(f, a, b, args)
+    else:
+        a, b = numpy.broadcast_arrays(a, b)
+        assert numpy.all(numpy.isfinite(a)) and numpy.all(numpy.isfinite(b))
+        assert numpy.all(a <= b)
+
+        def g(x):
+            return f(x, *args)
 
+    return integrate_adaptive(
+        g,
+        [a, b],
+        eps_abs=epsabs,
+        eps_rel=epsrel,
+        max_num_subintervals=limit,
+        domain_shape=(),
+        strategy="global",
+        extrapolate=extrapolate,
+        norm=norm,
+        full_output=full_output,
+    )
+
+
+def _quad_de(f, a, b, args, eps):
+    if a == -numpy.inf and b == numpy.inf:
+        return sinh_sinh(lambda x: f(x, *args), eps)
+    elif b == numpy.inf:
+        return exp_sinh(lambda x: f(x, *args), a, eps)
+    elif a == -numpy.inf:
+        # x -> -x
+        return exp_sinh(lambda x: f(-x, *args), -b, eps)
+    return tanh_sinh(lambda x: f(x, *args), a, b, eps)
+
+
+def _transform(f, a, b, args):
     # See <https://www.gnu.org/software/gsl/doc/html/integration.html> for the
     # variable transformations
     if a == -numpy.inf and b == numpy.inf:
@@ -17,7 +123,7 @@ def quad(f, a, b, args=(), epsabs=1.49e-08, epsrel=1.49e-08, limit=50):
         b = 1.0
 
         def g(t):
-            return (f((1 - t) / t, *args) + f(-(1 - t) / t)) / t ** 2
+            return (f((1 - t) / t, *args) + f(-(1 - t) / t, *args)) / t ** 2
 
     elif b == numpy.inf:
         a_orig = a
@@ -40,6 +146,4 @@ def quad(f, a, b, args=(), epsabs=1.49e-08, epsrel=1.49e-08, limit=50):
         def g(x):
             return f(x, *args)
 
-    return integrate_adaptive(
-        g, [a, b], eps_abs=epsabs, eps_rel=epsrel, max_num_subintervals=limit
-    )
+    return g, a, b
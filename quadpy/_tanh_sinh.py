@@ -0,0 +1,938 @@
+import concurrent.futures
+import functools
+import math
+import os
+import types
+import warnings
+
+import mpmath
+import numpy
+import scipy.special
+
+from .helpers.cache import SchemeCache
+from .helpers.stats import instrument, record_levels
+
+
+@instrument(coordinate_axis=False)
+def tanh_sinh(
+    f,
+    a,
+    b,
+    eps,
+    max_steps=10,
+    f_derivatives=None,
+    mode="numpy",
+    workers=1,
+    ctx=None,
+    executor=None,
+):
+    """Integrate a function `f` between `a` and `b` with accuracy `eps`. See
+    `tanh_sinh_lr()` for `workers`, `ctx` and `executor`.
+
+    For more details, see
+
+    Hidetosi Takahasi, Masatake Mori,
+    Double Exponential Formulas for Numerical Integration,
+    PM. RIMS, Kyoto Univ., 9 (1974), 721-741
+
+    and
+
+    Mori, Masatake
+    Discovery of the double exponential transformation and its developments,
+    Publications of the Research Institute for Mathematical Sciences,
+    41 (4): 897–935, ISSN 0034-5318,
+    doi:10.2977/prims/1145474600,
+    <http://www.kurims.kyoto-u.ac.jp/~okamoto/paper/Publ_RIMS_DE/41-4-38.pdf>.
+    """
+    if f_derivatives is None:
+        f_derivatives = {}
+
+    if mode == "mpmath":
+        # `ctx` itself is passed on, tanh_sinh_lr() tells if it was given.
+        kernel, _ = _get_context(eps, ctx)
+        alpha = kernel.convert(b) - kernel.convert(a)
+    else:
+        alpha = b - a
+
+    # partials instead of lambdas, so they can be sent to worker processes
+    f_left = {0: functools.partial(_shift, f, a)}
+    if 1 in f_derivatives:
+        f_left[1] = functools.partial(_shift, f_derivatives[1], a)
+    if 2 in f_derivatives:
+        f_left[2] = functools.partial(_shift, f_derivatives[2], a)
+
+    f_right = {0: functools.partial(_mirror, f, b)}
+    if 1 in f_derivatives:
+        f_right[1] = functools.partial(_mirror_negated, f_derivatives[1], b)
+    if 2 in f_derivatives:
+        f_right[2] = functools.partial(_mirror, f_derivatives[2], b)
+
+    value_estimate, error_estimate = tanh_sinh_lr(
+        f_left,
+        f_right,
+        alpha,
+        eps,
+        max_steps=max_steps,
+        mode=mode,
+        workers=workers,
+        ctx=ctx,
+        executor=executor,
+    )
+    return value_estimate, error_estimate
+
+
+# `s` comes first in the sums, so they are computed in its context.
+def _shift(f, a, s):
+    return f(s + a)
+
+
+def _mirror(f, b, s):
+    return f(-s + b)
+
+
+def _mirror_negated(f, b, s):
+    return -f(-s + b)
+
+
+@instrument(coordinate_axis=False, functions=("f_left", "f_right"))
+def tanh_sinh_lr(
+    f_left,
+    f_right,
+    alpha,
+    eps,
+    max_steps=10,
+    mode="numpy",
+    workers=1,
+    ctx=None,
+    executor=None,
+):
+    """Integrate a function `f` between `a` and `b` with accuracy `eps`. The function
+    `f` is given in terms of two functions
+
+        * `f_left(s) = f(a + s)`, i.e., `f` linearly scaled such that `f_left(0) =
+          f(a)`, `f_left(b-a) = f(b)`,
+
+        * `f_right(s) = f(b - s)`, i.e., `f` linearly scaled such that `f_right(0) =
+          f(b)`, `f_right(b-a) = f(a)`.
+
+    Implemented are Bailey's enhancements plus a few more tricks.
+
+    David H. Bailey, Karthik Jeyabalan, and Xiaoye S. Li,
+    Error function quadrature,
+    Experiment. Math., Volume 14, Issue 3 (2005), 317-329,
+    <https://projecteuclid.org/euclid.em/1128371757>.
+
+    David H. Bailey,
+    Tanh-Sinh High-Precision Quadrature,
+    2006,
+    <https://www.davidhbailey.com/dhbpapers/dhb-tanh-sinh.pdf>.
+
+    In mpmath mode, all computations run in the mpmath context `ctx` at its
+    precision. The functions are called with numbers of `ctx`; for full precision,
+    they should compute with those (or with the functions of `ctx`), not with `mp` at
+    the global precision. Passing the same context to several calls reuses its
+    precision. By default, `ctx` is a new context with `-log10(eps) + 1` digits, and
+    the functions are evaluated with the global `mp` temporarily set to that
+    precision, too, so integrands written with `mp.exp` etc. work as they are; for
+    concurrent integrations, give a `ctx`. If the tolerance isn't reached after
+    `max_steps` steps, a warning is shown.
+
+    In mpmath mode, `workers > 1` (-1: all CPUs) evaluates the nodes and the
+    integrand (and its derivatives) in that many worker processes, at the precision of
+    the caller. The functions must then be picklable. The values come back in the
+    order of the nodes, so the results are identical to the serial ones. Instead of
+    `workers`, a `concurrent.futures.ProcessPoolExecutor` can be given as `executor`,
+    e.g., to reuse its processes for many integrations.
+    """
+    if mode == "mpmath":
+        ctx, global_prec = _get_context(eps, ctx)
+        alpha = ctx.convert(alpha)
+    else:
+        assert mode == "numpy"
+        assert (
+            workers == 1 and executor is None
+        ), "workers are only supported in mpmath mode."
+        ctx = None
+        global_prec = None
+
+    if executor is not None:
+        assert workers == 1, "Give either workers or executor."
+        return _tanh_sinh_lr(
+            f_left, f_right, alpha, eps, max_steps, mode, ctx, global_prec, executor
+        )
+
+    workers = os.cpu_count() if workers == -1 else workers
+    if workers <= 1:
+        return _tanh_sinh_lr(
+            f_left, f_right, alpha, eps, max_steps, mode, ctx, global_prec, None
+        )
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        return _tanh_sinh_lr(
+            f_left, f_right, alpha, eps, max_steps, mode, ctx, global_prec, executor
+        )
+
+
+def _get_context(eps, ctx):
+    """The context for the computations and the precision of the global `mp` for the
+    evaluations of the integrand. A private context, so concurrent integrations (and
+    other mpmath code) don't interfere through the global precision. If none is given,
+    integrands which compute with `mp` need it at the same precision, see `_map_mp()`;
+    otherwise, the global precision is left alone (None).
+    """
+    if ctx is not None:
+        return ctx, None
+    ctx = mpmath.MPContext()
+    ctx.dps = int(-ctx.log10(eps) + 1)
+    return ctx, ctx.prec
+
+
+def _warn_not_converged(eps, max_steps, error_estimate, mode, global_prec):
+    hint = ""
+    if mode == "mpmath" and global_prec is None:
+        hint = " Does the integrand compute at the precision of ctx?"
+    warnings.warn(
+        f"Tolerance {eps} not reached after {max_steps} steps "
+        f"(error estimate: {error_estimate}).{hint}"
+    )
+
+
+def _tanh_sinh_lr(
+    f_left, f_right, alpha, eps, max_steps, mode, ctx, global_prec, executor
+):
+    fsum = ctx.fsum if mode == "mpmath" else math.fsum
+    prec = ctx.prec if mode == "mpmath" else None
+    alpha2 = alpha / 2
+
+    last_error_estimate = None
+
+    success = False
+    for level in range(max_steps + 1):
+        # The nodes and weights only depend on `eps` and the level; they are computed
+        # once for alpha = 2 and scaled here.
+        table = _get_level(level, eps, mode, prec=prec, executor=executor)
+        h = table.h if ctx is None else ctx.convert(table.h)
+        sinh_t = table.sinh_t
+        cosh_t = table.cosh_t
+        cosh_sinh_t = table.cosh_sinh_t
+
+        y0 = alpha2 * table.y0
+        y1 = alpha2 * table.y1
+
+        weights = -h * y1
+
+        if mode == "mpmath":
+            fly = _map_mp(f_left[0], y0, ctx, executor, global_prec)
+            fry = _map_mp(f_right[0], y0, ctx, executor, global_prec)
+        else:
+            assert mode == "numpy"
+            fly = f_left[0](y0)
+            fry = f_right[0](y0)
+
+        lsummands = fly * weights
+        rsummands = fry * weights
+
+        # Perform the integration.
+        if level == 0:
+            # The root level only contains one node, the midpoint; function values of
+            # f_left and f_right are equal here. Deliberately take lsummands here.
+            value_estimates = list(lsummands)
+        else:
+            value_estimates.append(
+                # Take the estimation from the previous step and half the step size.
+                # Fill the gaps with the sum of the values of the current step.
+                value_estimates[-1] / 2
+                + fsum(lsummands)
+                + fsum(rsummands)
+            )
+
+        # error estimation
+        if 1 in f_left and 2 in f_left:
+            assert 1 in f_right and 2 in f_right
+            error_estimate = _error_estimate1(
+                h,
+                sinh_t,
+                cosh_t,
+                cosh_sinh_t,
+                y0,
+                y1,
+                fly,
+                fry,
+                f_left,
+                f_right,
+                alpha,
+                last_error_estimate,
+                mode,
+                ctx,
+                executor,
+                global_prec,
+            )
+            last_error_estimate = error_estimate
+        else:
+            error_estimate = _error_estimate2(
+                eps, value_estimates, lsummands, rsummands, ctx
+            )
+
+        if abs(error_estimate) < eps:
+            success = True
+            break
+
+    record_levels(level)
+    if not success:
+        _warn_not_converged(eps, max_steps, error_estimate, mode, global_prec)
+    return value_estimates[-1], error_estimate
+
+
+@instrument(coordinate_axis=False)
+def tanh_sinh_vec(f, a, b, eps, max_steps=10, full_output=False):
+    """Tanh-sinh integration of `f` over many intervals [a, b] at once; `a` and `b` are
+    arrays (broadcast against each other) of finite limits. In each step, `f` is called
+    once with the points of all integrals that haven't converged yet, `x` of shape
+    `(k, m)` (k integrals, m points), and must return an array of shape `range_shape +
+    x.shape`. Integrals are retired individually as soon as the error estimate (after
+    Bailey) of all components is below `eps`.
+
+    Returns the values and error estimates of shape `range_shape + a.shape`. If
+    `full_output` is True, a dictionary with the number of function evaluations and
+    levels per integral is returned as third value.
+    """
+    a, b = numpy.broadcast_arrays(numpy.asarray(a, dtype=float), b)
+    integrals_shape = a.shape
+    a = a.reshape(-1)
+    b = b.reshape(-1)
+    alpha2 = (b - a) / 2
+    num_integrals = a.shape[0]
+
+    # the value estimates of the first and the last three levels
+    first = None
+    last = []
+    err = None
+    idx = numpy.arange(num_integrals)
+    num_evaluations = numpy.zeros(num_integrals, dtype=int)
+    levels = numpy.zeros(num_integrals, dtype=int)
+
+    for level in range(max_steps + 1):
+        table = _get_level(level, eps, "numpy")
+        y0 = numpy.multiply.outer(alpha2[idx], table.y0)
+        weights = numpy.multiply.outer(alpha2[idx], -table.h * table.y1)
+
+        if level == 0:
+            # The root level only contains the midpoint.
+            x = a[idx, None] + y0
+        else:
+            x = numpy.concatenate([a[idx, None] + y0, b[idx, None] - y0], axis=-1)
+        fx = numpy.asarray(f(x))
+        num_evaluations[idx] += x.shape[1]
+        levels[idx] = level
+
+        m = y0.shape[1]
+        lsummands = fx[..., :m] * weights
+        if level == 0:
+            val = lsummands[..., 0]
+            first = numpy.zeros(fx.shape[:-2] + (num_integrals,), dtype=val.dtype)
+            first[..., idx] = val
+            last = [first.copy()]
+            err = numpy.ones(first.shape)
+            continue
+
+        rsummands = fx[..., m:] * weights
+        val = (
+            last[-1][..., idx] / 2
+            + numpy.sum(lsummands, axis=-1)
+            + numpy.sum(rsummands, axis=-1)
+        )
+        last.append(last[-1].copy())
+        last[-1][..., idx] = val
+        del last[:-3]
+        if len(last) < 3:
+            continue
+
+        # Bailey's error estimate, cf. _error_estimate2()
+        e1 = numpy.abs(val - last[-2][..., idx])
+        e2 = numpy.abs(val - last[-3][..., idx])
+        with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            e12 = numpy.where(e2 > 0.0, e1 ** (numpy.log(e1) / numpy.log(e2)), e1)
+        e12 = numpy.where(e1 > 0.0, e12, 0.0)
+        e3 = eps * numpy.maximum(
+            numpy.max(numpy.abs(lsummands), axis=-1),
+            numpy.max(numpy.abs(rsummands), axis=-1),
+        )
+        e4 = numpy.maximum(numpy.abs(lsummands[..., -1]), numpy.abs(rsummands[..., -1]))
+        e = numpy.maximum(numpy.maximum(e12, e1 ** 2), numpy.maximum(e3, e4))
+        e = numpy.where(val == first[..., idx], 0.0, e)
+        err[..., idx] = e
+
+        is_done = numpy.all(e < eps, axis=tuple(range(e.ndim - 1)))
+        idx = idx[~is_done]
+        if len(idx) == 0:
+            break
+
+    record_levels(numpy.max(levels))
+    if len(idx) > 0:
+        warnings.warn(
+            f"Tolerance {eps} not reached for {len(idx)} of {num_integrals} integrals "
+            f"after {max_steps} steps."
+        )
+
+    range_shape = err.shape[:-1]
+    val = last[-1].reshape(range_shape + integrals_shape)
+    err = err.reshape(range_shape + integrals_shape)
+    if full_output:
+        info = {
+            "num_evaluations": num_evaluations.reshape(integrals_shape),
+            "levels": levels.reshape(integrals_shape),
+        }
+        return val, err, info
+    return val, err
+
+
+@instrument(coordinate_axis=False)
+def exp_sinh(f, a, eps, max_steps=10, mode="numpy", ctx=None):
+    """Integrate a function `f` over [a, inf) with accuracy `eps` using the
+    double-exponential substitution x = a + exp(pi/2 * sinh(t)). For integrands which
+    decay slowly, e.g., like x**-1.1, the nodes reach out further than the default
+    x = a + 1/eps**3, up to about 1/eps**30 (1e150 in numpy mode). Singularities at `a`
+    are fine as long as `f(a + x)` can be evaluated for tiny x, e.g., for a = 0. If
+    the tolerance isn't reached after `max_steps` steps, a warning is shown. See
+    `tanh_sinh_lr()` for `ctx`.
+
+    Masatake Mori, Masaaki Sugihara,
+    The double-exponential transformation in numerical analysis,
+    Journal of Computational and Applied Mathematics 127 (2001), 287-296,
+    <https://doi.org/10.1016/S0377-0427(00)00501-X>.
+    """
+    return _integrate_de(f, a, "exp_sinh", eps, max_steps, mode, ctx)
+
+
+@instrument(coordinate_axis=False)
+def sinh_sinh(f, eps, max_steps=10, mode="numpy", ctx=None):
+    """Integrate a function `f` over (-inf, inf) with accuracy `eps` using the
+    double-exponential substitution x = sinh(pi/2 * sinh(t)). As for `exp_sinh()`, the
+    nodes reach out further than |x| = 1/eps**3 if `f` decays slowly. See
+    `tanh_sinh_lr()` for `ctx`.
+    """
+    return _integrate_de(f, 0, "sinh_sinh", eps, max_steps, mode, ctx)
+
+
+def _integrate_de(f, a, rule, eps, max_steps, mode, ctx):
+    # The level-halving loop of tanh_sinh_lr() for the rules on infinite intervals.
+    # The nodes are split into those with t < 0 (left) and t >= 0 (right).
+    if mode == "mpmath":
+        ctx, global_prec = _get_context(eps, ctx)
+        a = ctx.convert(a)
+        fsum = ctx.fsum
+        prec = ctx.prec
+    else:
+        assert mode == "numpy"
+        ctx = None
+        global_prec = None
+        fsum = math.fsum
+        prec = None
+
+    def evaluate(table):
+        if mode == "mpmath":
+            fl = _map_mp(f, [a + x for x in table.x_left], ctx, None, global_prec)
+            fr = _map_mp(f, [a + x for x in table.x_right], ctx, None, global_prec)
+        else:
+            assert mode == "numpy"
+            fl = f(a + table.x_left)
+            fr = f(a + table.x_right)
+        return fl * table.w_left, fr * table.w_right
+
+    # The number of steps of t by which the nodes reach out beyond the default range;
+    # it is found on level 0 and used on all levels. If the outermost summand is still
+    # too large then, it is a lower bound for the error.
+    num_extra = 0
+    tail = 0
+    success = False
+    for level in range(max_steps + 1):
+        table = _get_level(level, eps, mode, rule, prec=prec, num_extra=num_extra)
+        lsummands, rsummands = evaluate(table)
+
+        # Integrands that decay slowly get more nodes until the outermost summands are
+        # negligible. (For exp-sinh, the left ones are those at x -> 0.)
+        while level == 0:
+            tail = abs(rsummands[-1])
+            if rule == "sinh_sinh":
+                tail = max(tail, abs(lsummands[-1]))
+            if tail < eps or not table.is_extendable:
+                break
+            num_extra += 1
+            table = _get_level(0, eps, mode, rule, prec=prec, num_extra=num_extra)
+            lsummands, rsummands = evaluate(table)
+
+        value = fsum(lsummands) + fsum(rsummands)
+        if level == 0:
+            value_estimates = [value]
+        else:
+            # Take the estimation from the previous step and half the step size.
+            value_estimates.append(value_estimates[-1] / 2 + value)
+
+        error_estimate = _error_estimate2(
+            eps, value_estimates, lsummands, rsummands, ctx
+        )
+        if level > 0:
+            # Bailey's estimate relies on quadratic convergence of the levels which is
+            # too optimistic for some integrands on infinite intervals; the difference
+            # to the previous level is a safe bound.
+            error_estimate = max(
+                error_estimate, abs(value_estimates[-1] - value_estimates[-2])
+            )
+        error_estimate = max(error_estimate, tail)
+        if abs(error_estimate) < eps:
+            success = True
+            break
+
+    record_levels(level)
+    if not success:
+        _warn_not_converged(eps, max_steps, error_estimate, mode, global_prec)
+    return value_estimates[-1], error_estimate
+
+
+# For the logarithms in the error estimates in numpy mode, independent of the global
+# mpmath precision
+_numpy_ctx = mpmath.MPContext()
+
+# The levels of all rules for all values of `eps` (and precisions) used so far
+_tables = SchemeCache(maxsize=1024)
+
+
+def _get_level(
+    level, eps, mode, rule="tanh_sinh", prec=None, executor=None, num_extra=0
+):
+    """The step size, nodes and weights of level `level` of the double-exponential
+    `rule` for the tolerance `eps`; for tanh-sinh on the interval length alpha = 2.
+    Every level only holds the nodes which are not already part of the previous ones.
+    For exp-sinh and sinh-sinh, `num_extra` extends the range of the nodes, see
+    `_create_de_level()`. The levels are cached. In mpmath mode, they are computed in a
+    context of their own with precision `prec` which is never changed afterwards.
+    """
+    if rule == "tanh_sinh":
+        create = functools.partial(_create_level, executor=executor)
+    else:
+        create = functools.partial(_create_de_level, rule=rule, num_extra=num_extra)
+    return _tables.get(
+        (rule, mode, prec, eps, level, num_extra),
+        lambda: create(level, eps, mode, prec),
+    )
+
+
+def _get_kernel(mode, prec=None):
+    if mode == "mpmath":
+        ctx = mpmath.MPContext()
+        ctx.prec = prec
+        return ctx, ctx.lambertw, ctx.ln
+
+    assert mode == "numpy"
+
+    def lambertw(x, k):
+        out = scipy.special.lambertw(x, k)
+        assert abs(out.imag) < 1.0e-15
+        return scipy.special.lambertw(x, k).real
+
+    return numpy, lambertw, numpy.log
+
+
+def _initial_step(eps, mode, kernel, ln):
+    # What's a good initial step size `h`?
+    # The larger `h` is chosen, the fewer points will be part of the evaluation.
+    # However, we don't want to choose the step size too large since that means less
+    # accuracy for the quadrature overall. The idea would then be too choose `h` such
+    # that it is just large enough for the first tanh-sinh-step to contain only one
+    # point, the midpoint. The expression
+    #
+    #    j = mp.ln(-2/mp.pi * mp.lambertw(-tau/h/2, -1)) / h
+    #
+    # hence needs to just smaller than 1. (Ideally, one would actually like to get `j`
+    # from the full tanh-sinh formula, but the above approximation is good enough.) One
+    # gets
+    #
+    #    0 = pi/2 * exp(h) - h - ln(h) - ln(pi/tau)
+    #
+    # for which there is no analytic solution. One can, however, approximate it. Since
+    # pi/2 * exp(h) >> h >> ln(h) (for `h` large enough), one can either forget about
+    # both h and ln(h) to get
+    #
+    #     h0 = ln(2/pi * ln(pi/tau))
+    #
+    # or just scratch ln(h) to get
+    #
+    #     h1 = ln(tau/pi) - W_{-1}(-tau/2).
+    #
+    # Both of these suggestions underestimate and `j` will be too large. An
+    # approximation that overestimates is obtained by replacing `ln(h)` by `h`,
+    #
+    #     h2 = 1/2 - log(sqrt(pi/tau)) - W_{-1}(-sqrt(exp(1)*pi*tau) / 4).
+    #
+    # Application of Newton's method will improve all of these approximations and will
+    # also always overestimate such that `j` won't exceed 1 in the first step. Nice!
+    # TODO since we're doing Newton iterations anyways, use a more accurate
+    #      representation for j, and consequently for h
+    tol = 1.0e-10
+    if mode == "mpmath":
+        num_digits = int(-kernel.log10(tol) + 1)
+        with kernel.workdps(max(kernel.dps, num_digits)):
+            return _solve_expx_x_logx(eps ** 2, tol, kernel, ln)
+
+    return _solve_expx_x_logx(eps ** 2, tol, kernel, ln)
+
+
+def _create_level(level, eps, mode, prec=None, executor=None):
+    kernel, lambertw, ln = _get_kernel(mode, prec)
+
+    if level == 0:
+        h = _initial_step(eps, mode, kernel, ln)
+    else:
+        h = _get_level(0, eps, mode, prec=prec).h / 2 ** level
+
+    # We would like to calculate the weights until they are smaller than tau, i.e.,
+    #
+    #     h * pi/2 * cosh(h*j) / cosh(pi/2 * sinh(h*j))**2 < tau.
+    #
+    # (TODO Newton on this expression to find tau?)
+    #
+    # To streamline the computation, j is estimated in advance. The only assumption
+    # we're making is that h*j >> 1 such that exp(-h*j) can be neglected. With this,
+    # the above becomes
+    #
+    #     tau > h * pi/2 * exp(h*j)/2 / cosh(pi/2 * exp(h*j)/2)**2
+    #
+    # and further
+    #
+    #     tau > h * pi * exp(h*j) / exp(pi/2 * exp(h*j)).
+    #
+    # Calling z = - pi/2 * exp(h*j), one gets
+    #
+    #     tau > -2*h*z * exp(z)
+    #
+    # This inequality is fulfilled exactly if z = W(-tau/h/2) with W being the
+    # (-1)-branch of the Lambert-W function IF exp(1)*tau < 2*h (which we can assume
+    # since `tau` will generally be small). We finally get
+    #
+    #     j > ln(-2/pi * W(-tau/h/2)) / h.
+    #
+    # We do require j to be positive, so -2/pi * W(-tau/h/2) > 1. This translates to
+    # the slightly stricter requirement
+    #
+    #     tau * exp(pi/2) < pi * h,
+    #
+    # i.e., h needs to be about 1.531 times larger than tau (not only 1.359 times as
+    # the previous bound suggested).
+    #
+    # Note further that h*j is ever decreasing as h decreases.
+    assert eps ** 2 * kernel.exp(kernel.pi / 2) < kernel.pi * h
+    j = int(ln(-2 / kernel.pi * lambertw(-(eps ** 2) / h / 2, -1)) / h)
+
+    # At level 0, one only takes the midpoint, for all greater levels every other
+    # point. The value estimation is later completed with the estimation from the
+    # previous level which.
+    if level == 0:
+        t = [0]
+    else:
+        t = h * numpy.arange(1, j + 1, 2)
+
+    if mode == "mpmath":
+        t = [kernel.convert(v) for v in t]
+        nodes = _map_mp(_tanh_sinh_node, t, kernel, executor)
+        sinh_t, cosh_t, cosh_sinh_t, exp_sinh_t = (
+            numpy.array([node[k] for node in nodes]) for k in range(4)
+        )
+    else:
+        assert mode == "numpy"
+        sinh_t = numpy.pi / 2 * numpy.sinh(t)
+        cosh_t = numpy.pi / 2 * numpy.cosh(t)
+        cosh_sinh_t = numpy.cosh(sinh_t)
+        # y = alpha/2 * (1 - x)
+        # x = [mp.tanh(v) for v in u2]
+        exp_sinh_t = numpy.exp(sinh_t)
+
+    return types.SimpleNamespace(
+        h=h,
+        sinh_t=sinh_t,
+        cosh_t=cosh_t,
+        cosh_sinh_t=cosh_sinh_t,
+        y0=1 / exp_sinh_t / cosh_sinh_t,
+        y1=-cosh_t / cosh_sinh_t ** 2,
+    )
+
+
+def _tanh_sinh_node(t):
+    ctx = t.context
+    sinh_t = ctx.pi / 2 * ctx.sinh(t)
+    cosh_t = ctx.pi / 2 * ctx.cosh(t)
+    # y = alpha/2 * (1 - x)
+    # x = [mp.tanh(v) for v in u2]
+    return sinh_t, cosh_t, ctx.cosh(sinh_t), ctx.exp(sinh_t)
+
+
+def _map_mp(fun, values, ctx, executor, global_prec=None):
+    """`numpy.array([fun(v) for v in values])`, in mpmath mode, with the resulting
+    mpmath numbers converted to `ctx`. If `global_prec` is given, the global `mp` is
+    set to that precision for the evaluations. With an `executor`, chunks of the values
+    are evaluated in the worker processes, with the values at the precision of `ctx`;
+    the results keep their order.
+    """
+    if executor is None:
+        if global_prec is None:
+            out = [fun(v) for v in values]
+        else:
+            with mpmath.mp.workprec(global_prec):
+                out = [fun(v) for v in values]
+    else:
+        if global_prec is None:
+            global_prec = mpmath.mp.prec
+        # Numbers of private contexts can't be pickled, so the raw values are sent.
+        values = [ctx.convert(v)._mpf_ for v in values]
+        # a few chunks per worker, for load balancing
+        num_workers = getattr(executor, "_max_workers", None) or os.cpu_count()
+        size = -(-len(values) // (4 * num_workers))
+        futures = [
+            executor.submit(
+                _map_chunk, fun, values[k : k + size], ctx.prec, global_prec
+            )
+            for k in range(0, len(values), size)
+        ]
+        out = [y for future in futures for y in future.result()]
+    return numpy.array([_convert(ctx, y) for y in out])
+
+
+def _map_chunk(fun, values, prec, global_prec):
+    # Evaluate like the caller does: the values in a context with precision `prec`,
+    # the global context (which most integrands use) at the caller's precision. A
+    # worker process runs one chunk at a time, so the latter can be set here. The
+    # results are returned as numbers of the global context which, unlike those of
+    # private contexts, can be pickled.
+    ctx = mpmath.MPContext()
+    ctx.prec = prec
+    mpmath.mp.prec = global_prec
+    return [_convert(mpmath.mp, fun(ctx.make_mpf(v))) for v in values]
+
+
+def _convert(ctx, y):
+    if isinstance(y, tuple):
+        return tuple(_convert(ctx, z) for z in y)
+    if hasattr(y, "_mpf_") or hasattr(y, "_mpc_"):
+        return ctx.convert(y)
+    return y
+
+
+def _create_de_level(level, eps, mode, prec, rule, num_extra=0):
+    # Level 0 has the nodes t = k for all integers k, level l the odd multiples of
+    # h = 2**-l. For exp-sinh, the nodes are cut off where x falls below eps**4, i.e.,
+    # at pi/2 * sinh(t) = ln(1/eps**4). (Cutting off small weights instead would lose
+    # too much of singularities at x = 0.) Where f decays, they end at about |x| =
+    # 1/eps**3 (enough for f decaying like x**-1.5) plus `num_extra` steps in t, but
+    # not beyond |x| = 1/eps**30 (or 1e150 in numpy mode, so x**2 doesn't overflow).
+    kernel, _, ln = _get_kernel(mode, prec)
+    h = kernel.mpf(1) / 2 ** level if mode == "mpmath" else 1.0 / 2 ** level
+    log_eps = float(ln(eps))
+    t_small = math.asinh(2 / math.pi * -4 * log_eps)
+    log_x_limit = -30 * log_eps if mode == "mpmath" else min(-30 * log_eps, 345.0)
+    t_limit = math.asinh(2 / math.pi * log_x_limit)
+    t_large = math.asinh(2 / math.pi * -3 * log_eps) + num_extra
+    is_extendable = t_large < t_limit
+    t_large = min(t_large, t_limit)
+    t_left = t_small if rule == "exp_sinh" else t_large
+
+    k = numpy.arange(
+        0 if level == 0 else 1,
+        int(max(t_left, t_large) * 2 ** level) + 1,
+        1 if level == 0 else 2,
+    )
+    t = h * k
+
+    if mode == "mpmath":
+        sinh_t = kernel.pi / 2 * numpy.array(list(map(kernel.sinh, t)))
+        cosh_t = kernel.pi / 2 * numpy.array(list(map(kernel.cosh, t)))
+        exp = numpy.frompyfunc(kernel.exp, 1, 1)
+        sinh = numpy.frompyfunc(kernel.sinh, 1, 1)
+        cosh = numpy.frompyfunc(kernel.cosh, 1, 1)
+    else:
+        assert mode == "numpy"
+        sinh_t = numpy.pi / 2 * numpy.sinh(t)
+        cosh_t = numpy.pi / 2 * numpy.cosh(t)
+        exp, sinh, cosh = numpy.exp, numpy.sinh, numpy.cosh
+
+    if rule == "exp_sinh":
+        x_right = exp(sinh_t)
+        x_left = exp(-sinh_t)
+        w_right = h * cosh_t * x_right
+        w_left = h * cosh_t * x_left
+    else:
+        assert rule == "sinh_sinh"
+        x_right = sinh(sinh_t)
+        x_left = -x_right
+        w_right = h * cosh_t * cosh(sinh_t)
+        w_left = w_right
+
+    # t = 0 is a right node only
+    left = (k > 0) & (k <= t_left * 2 ** level)
+    right = k <= t_large * 2 ** level
+    return types.SimpleNamespace(
+        h=h,
+        x_left=x_left[left],
+        w_left=w_left[left],
+        x_right=x_right[right],
+        w_right=w_right[right],
+        is_extendable=is_extendable,
+    )
+
+
+def _error_estimate1(
+    h,
+    sinh_t,
+    cosh_t,
+    cosh_sinh_t,
+    y0,
+    y1,
+    fly,
+    fry,
+    f_left,
+    f_right,
+    alpha,
+    last_estimate,
+    mode,
+    ctx=None,
+    executor=None,
+    global_prec=None,
+):
+    """
+    A pretty accurate error estimation is
+
+      E(h) = h * (h/2/pi)**2 * sum_{-N}^{+N} F''(h*j)
+
+    with
+
+      F(t) = f(g(t)) * g'(t),
+      g(t) = tanh(pi/2 sinh(t)).
+    """
+    alpha2 = alpha / 2
+
+    if mode == "mpmath":
+        sinh_sinh_t = numpy.array(list(map(ctx.sinh, sinh_t)))
+    else:
+        assert mode == "numpy"
+        sinh_sinh_t = numpy.sinh(sinh_t)
+
+    tanh_sinh_t = sinh_sinh_t / cosh_sinh_t
+
+    # More derivatives of y = 1-g(t).
+    y2 = -alpha2 * (sinh_t - 2 * cosh_t ** 2 * tanh_sinh_t) / cosh_sinh_t ** 2
+    y3 = (
+        -alpha2
+        * cosh_t
+        * (
+            +cosh_sinh_t
+            - 4 * cosh_t ** 2 / cosh_sinh_t
+            + 2 * cosh_t ** 2 * cosh_sinh_t
+            + 2 * cosh_t ** 2 * tanh_sinh_t * sinh_sinh_t
+            - 6 * sinh_t * sinh_sinh_t
+        )
+        / cosh_sinh_t ** 3
+    )
+
+    if mode == "mpmath":
+        fl1_y = _map_mp(f_left[1], y0, ctx, executor, global_prec)
+        fl2_y = _map_mp(f_left[2], y0, ctx, executor, global_prec)
+        fr1_y = _map_mp(f_right[1], y0, ctx, executor, global_prec)
+        fr2_y = _map_mp(f_right[2], y0, ctx, executor, global_prec)
+    else:
+        assert mode == "numpy"
+        fl1_y = f_left[1](y0)
+        fl2_y = f_left[2](y0)
+        fr1_y = f_right[1](y0)
+        fr2_y = f_right[2](y0)
+
+    # Second derivative of F(t) = f(g(t)) * g'(t).
+    summands = numpy.concatenate(
+        [
+            y3 * fly + 3 * y1 * y2 * fl1_y + y1 ** 3 * fl2_y,
+            y3 * fry + 3 * y1 * y2 * fr1_y + y1 ** 3 * fr2_y,
+        ]
+    )
+
+    if mode == "mpmath":
+        fsum = ctx.fsum
+        pi = ctx.pi
+    else:
+        assert mode == "numpy"
+        fsum = math.fsum
+        pi = math.pi
+
+    val = h * (h / 2 / pi) ** 2 * fsum(summands)
+    if last_estimate is None:
+        # Root level: The midpoint is counted twice in the above sum.
+        out = val / 2
+    else:
+        out = last_estimate / 8 + val
+
+    return out
+
+
+def _error_estimate2(eps, value_estimates, left_summands, right_summands, ctx=None):
+    # "less formal" error estimation after Bailey,
+    # <https://www.davidhbailey.com/dhbpapers/dhb-tanh-sinh.pdf>
+    if ctx is None:
+        ctx = _numpy_ctx
+    if len(value_estimates) < 3:
+        error_estimate = 1
+    elif value_estimates[0] == value_estimates[-1]:
+        error_estimate = 0
+    else:
+        # d1 = mp.log10(abs(value_estimates[-1] - value_estimates[-2]))
+        # d2 = mp.log10(abs(value_estimates[-1] - value_estimates[-3]))
+        # d3 = mp.log10(eps * max([abs(x) for x in summands]))
+        # d4 = mp.log10(max(abs(summands[0]), abs(summands[-1])))
+        # d = max(d1**2 / d2, 2*d1, d3, d4)
+        # error_estimate = 10**d
+        e1 = abs(value_estimates[-1] - value_estimates[-2])
+        e2 = abs(value_estimates[-1] - value_estimates[-3])
+        e3 = eps * max(max(abs(left_summands)), max(abs(right_summands)))
+        e4 = max(abs(left_summands[-1]), abs(right_summands[-1]))
+        if e1 == 0:
+            e12 = 0
+        elif e2 == 0:
+            e12 = e1
+        else:
+            e12 = e1 ** (ctx.log(e1) / ctx.log(e2))
+        error_estimate = max(e12, e1 ** 2, e3, e4)
+
+    return error_estimate
+
+
+def _solve_expx_x_logx(tau, tol, kernel, ln, max_steps=10):
+    """Solves the equation
+
+    log(pi/tau) = pi/2 * exp(x) - x - log(x)
+
+    approximately using Newton's method. The approximate solution is guaranteed
+    to overestimate.
+    """
+    # Initial guess
+    x = kernel.log(2 / kernel.pi * ln(kernel.pi / tau))
+    # x = ln(tau / kernel.pi) - kernel.lambertw(-tau / 2, -1)
+    # x = (
+    #     mp.mpf(1) / 2
+    #     - mp.log(mp.sqrt(mp.pi / tau))
+    #     - mp.lambertw(-mp.sqrt(mp.exp(1) * mp.pi * tau) / 4, -1)
+    # )
+
+    def f0(x):
+        return kernel.pi / 2 * kernel.exp(x) - x - kernel.log(x * kernel.pi / tau)
+
+    def f1(x):
+        return kernel.pi / 2 * kernel.exp(x) - 1 - 1 / x
+
+    f0x = f0(x)
+    success = False
+    # At least one step is performed. This is required for the guarantee of
+    # overestimation.
+    for _ in range(max_steps):
+        x -= f0x / f1(x)
+        f0x = f0(x)
+        if abs(f0x) < tol:
+            success = True
+            break
+
+    assert success
+    return x
@@ -1,23 +1,4 @@
-from ._ditkin import ditkin_1, ditkin_2, ditkin_3
-from ._hammer_stroud import (
-    hammer_stroud_11_3,
-    hammer_stroud_12_3,
-    hammer_stroud_14_3,
-    hammer_stroud_15_3a,
-    hammer_stroud_15_3b,
-)
-from ._mysovskih import mysovskih
-from ._stroud import (
-    stroud_3_1,
-    stroud_5_1,
-    stroud_5_2,
-    stroud_7_1a,
-    stroud_7_1b,
-    stroud_7_2,
-    stroud_7_3,
-    stroud_7_4,
-    stroud_14_1,
-)
+from .._lazy import lazy_import
 
 __all__ = [
     "ditkin_1",
@@ -39,3 +20,29 @@ __all__ = [
     "stroud_7_4",
     "stroud_14_1",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._ditkin": ["ditkin_1", "ditkin_2", "ditkin_3"],
+        "._hammer_stroud": [
+            "hammer_stroud_11_3",
+            "hammer_stroud_12_3",
+            "hammer_stroud_14_3",
+            "hammer_stroud_15_3a",
+            "hammer_stroud_15_3b",
+        ],
+        "._mysovskih": ["mysovskih"],
+        "._stroud": [
+            "stroud_3_1",
+            "stroud_5_1",
+            "stroud_5_2",
+            "stroud_7_1a",
+            "stroud_7_1b",
+            "stroud_7_2",
+            "stroud_7_3",
+            "stroud_7_4",
+            "stroud_14_1",
+        ],
+    },
+)
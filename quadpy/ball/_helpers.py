@@ -3,6 +3,7 @@ from math import pi
 import numpy
 
 from .. import helpers
+from ..helpers.stats import instrument
 
 
 class BallScheme:
@@ -40,6 +41,7 @@ class BallScheme:
         )
         return
 
+    @instrument()
     def integrate(self, f, center, radius, dot=numpy.dot):
         center = numpy.asarray(center)
         rr = numpy.multiply.outer(radius, self.points)
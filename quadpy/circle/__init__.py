@@ -1,3 +1,5 @@
-from ._krylov import krylov
+from .._lazy import lazy_import
 
 __all__ = ["krylov"]
+
+__getattr__, __dir__ = lazy_import(__name__, attributes={"._krylov": ["krylov"]})
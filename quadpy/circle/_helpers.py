@@ -1,6 +1,7 @@
 import numpy
 
 from .. import helpers
+from ..helpers.stats import instrument
 
 
 class CircleScheme:
@@ -54,6 +55,7 @@ class CircleScheme:
         helpers.plot_disks(plt, self.points, self.weights, total_area)
         return
 
+    @instrument()
     def integrate(self, f, center, radius, dot=numpy.dot):
         center = numpy.array(center)
         rr = numpy.multiply.outer(radius, self.points)
@@ -1,71 +1,7 @@
-from ._albrecht import (
-    albrecht_1,
-    albrecht_2,
-    albrecht_3,
-    albrecht_4,
-    albrecht_5,
-    albrecht_6,
-    albrecht_7,
-    albrecht_8,
-)
-from ._albrecht_collatz import albrecht_collatz
-from ._cools_haegemans import cools_haegemans_1, cools_haegemans_2, cools_haegemans_3
-from ._cools_kim import cools_kim_1, cools_kim_2, cools_kim_3
-from ._haegemans_piessens import haegemans_piessens
-from ._hammer_stroud import (
-    hammer_stroud_11_2,
-    hammer_stroud_12_2,
-    hammer_stroud_13_2,
-    hammer_stroud_17,
-    hammer_stroud_18,
-    hammer_stroud_19,
-    hammer_stroud_20,
-    hammer_stroud_21,
-)
-from ._lether import lether
-from ._mysovskih import mysovskih_1, mysovskih_2, mysovskih_3
-from ._peirce_1956 import peirce_1956_1, peirce_1956_2, peirce_1956_3
-from ._peirce_1957 import peirce_1957
-from ._piessens_haegemans import piessens_haegemans
-from ._rabinowitz_richter import (
-    rabinowitz_richter_1,
-    rabinowitz_richter_2,
-    rabinowitz_richter_3,
-    rabinowitz_richter_4,
-    rabinowitz_richter_5,
-    rabinowitz_richter_6,
-)
-from ._radon import radon
-from ._stroud import (
-    stroud_s2_3_1,
-    stroud_s2_3_2,
-    stroud_s2_4_1,
-    stroud_s2_5_1,
-    stroud_s2_5_2,
-    stroud_s2_7_1,
-    stroud_s2_7_2,
-    stroud_s2_9_1,
-    stroud_s2_9_2,
-    stroud_s2_9_3,
-    stroud_s2_9_4,
-    stroud_s2_9_5,
-    stroud_s2_11_1,
-    stroud_s2_11_2,
-    stroud_s2_11_3,
-    stroud_s2_11_4,
-    stroud_s2_13_1,
-    stroud_s2_13_2,
-    stroud_s2_15_1,
-    stroud_s2_15_2,
-    stroud_s2_17_1,
-)
-from ._wissmann_becker import (
-    wissmann_becker_6_1,
-    wissmann_becker_6_2,
-    wissmann_becker_8_1,
-)
+from .._lazy import lazy_import
 
 __all__ = [
+    "get_good_scheme",
     "albrecht_1",
     "albrecht_2",
     "albrecht_3",
@@ -131,3 +67,80 @@ __all__ = [
     "wissmann_becker_6_2",
     "wissmann_becker_8_1",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._helpers": ["get_good_scheme"],
+        "._albrecht": [
+            "albrecht_1",
+            "albrecht_2",
+            "albrecht_3",
+            "albrecht_4",
+            "albrecht_5",
+            "albrecht_6",
+            "albrecht_7",
+            "albrecht_8",
+        ],
+        "._albrecht_collatz": ["albrecht_collatz"],
+        "._cools_haegemans": [
+            "cools_haegemans_1",
+            "cools_haegemans_2",
+            "cools_haegemans_3",
+        ],
+        "._cools_kim": ["cools_kim_1", "cools_kim_2", "cools_kim_3"],
+        "._haegemans_piessens": ["haegemans_piessens"],
+        "._hammer_stroud": [
+            "hammer_stroud_11_2",
+            "hammer_stroud_12_2",
+            "hammer_stroud_13_2",
+            "hammer_stroud_17",
+            "hammer_stroud_18",
+            "hammer_stroud_19",
+            "hammer_stroud_20",
+            "hammer_stroud_21",
+        ],
+        "._lether": ["lether"],
+        "._mysovskih": ["mysovskih_1", "mysovskih_2", "mysovskih_3"],
+        "._peirce_1956": ["peirce_1956_1", "peirce_1956_2", "peirce_1956_3"],
+        "._peirce_1957": ["peirce_1957"],
+        "._piessens_haegemans": ["piessens_haegemans"],
+        "._rabinowitz_richter": [
+            "rabinowitz_richter_1",
+            "rabinowitz_richter_2",
+            "rabinowitz_richter_3",
+            "rabinowitz_richter_4",
+            "rabinowitz_richter_5",
+            "rabinowitz_richter_6",
+        ],
+        "._radon": ["radon"],
+        "._stroud": [
+            "stroud_s2_3_1",
+            "stroud_s2_3_2",
+            "stroud_s2_4_1",
+            "stroud_s2_5_1",
+            "stroud_s2_5_2",
+            "stroud_s2_7_1",
+            "stroud_s2_7_2",
+            "stroud_s2_9_1",
+            "stroud_s2_9_2",
+            "stroud_s2_9_3",
+            "stroud_s2_9_4",
+            "stroud_s2_9_5",
+            "stroud_s2_11_1",
+            "stroud_s2_11_2",
+            "stroud_s2_11_3",
+            "stroud_s2_11_4",
+            "stroud_s2_13_1",
+            "stroud_s2_13_2",
+            "stroud_s2_15_1",
+            "stroud_s2_15_2",
+            "stroud_s2_17_1",
+        ],
+        "._wissmann_becker": [
+            "wissmann_becker_6_1",
+            "wissmann_becker_6_2",
+            "wissmann_becker_8_1",
+        ],
+    },
+)
@@ -1,6 +1,8 @@
 import numpy
 
+from .. import helpers
 from ..helpers import plot_disks
+from ..helpers.stats import instrument
 
 
 class DiskScheme:
@@ -51,6 +53,7 @@ class DiskScheme:
         plot_disks(plt, self.points, self.weights, numpy.pi)
         return
 
+    @instrument()
     def integrate(self, f, center, radius, dot=numpy.dot):
         center = numpy.array(center)
         rr = numpy.multiply.outer(radius, self.points)
@@ -87,3 +90,10 @@ def _pmx(x):
 
 def _pmy(y):
     return numpy.array([[0, +y], [0, -y]])
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("disk", degree)
@@ -1,6 +1,6 @@
 import numpy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._helpers import DiskScheme
 
 _citation = article(
@@ -16,6 +16,7 @@ _citation = article(
 )
 
 
+@cached_scheme
 def lether(n):
     assert n >= 1
     p, w = numpy.polynomial.legendre.leggauss(n)
@@ -1,3 +1,7 @@
-from ._gauss_laguerre import gauss_laguerre
+from .._lazy import lazy_import
 
 __all__ = ["gauss_laguerre"]
+
+__getattr__, __dir__ = lazy_import(
+    __name__, attributes={"._gauss_laguerre": ["gauss_laguerre"]}
+)
@@ -1,9 +1,11 @@
 import orthopy
 
+from ..helpers import cached_scheme
 from ..tools import scheme_from_rc
 from ._helpers import E1rScheme
 
 
+@cached_scheme
 def gauss_laguerre(n, alpha=0, mode="numpy"):
     """
     Gauss-Laguerre quadrature for integrals of the form
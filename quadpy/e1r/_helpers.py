@@ -1,6 +1,7 @@
 import numpy
 
 from ..helpers import plot_disks_1d
+from ..helpers.stats import instrument
 
 
 class E1rScheme:
@@ -11,6 +12,7 @@ class E1rScheme:
         self.degree = degree
         return
 
+    @instrument()
     def integrate(self, f, dot=numpy.dot):
         x = numpy.array([self.points.T])
         fx = numpy.asarray(f(x))
@@ -1,4 +1,11 @@
-from ._gauss_hermite import gauss_hermite
-from ._genz_keister import genz_keister
+from .._lazy import lazy_import
 
 __all__ = ["gauss_hermite", "genz_keister"]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._gauss_hermite": ["gauss_hermite"],
+        "._genz_keister": ["genz_keister"],
+    },
+)
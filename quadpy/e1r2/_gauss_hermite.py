@@ -2,10 +2,12 @@ import numpy
 
 import orthopy
 
+from ..helpers import cached_scheme
 from ..tools import scheme_from_rc
 from ._helpers import E1r2Scheme
 
 
+@cached_scheme
 def gauss_hermite(n, mode="numpy"):
     """
     Gauss-Hermite quadrature for integrals of the form
@@ -1,6 +1,6 @@
 import numpy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._helpers import E1r2Scheme
 
 citation = article(
@@ -81,6 +81,7 @@ _points_7 = _points_3 + [
 ]
 
 
+@cached_scheme
 def genz_keister(n):
     assert n >= 0
 
@@ -1,6 +1,7 @@
 import numpy
 
 from ..helpers import plot_disks_1d
+from ..helpers.stats import instrument
 
 
 class E1r2Scheme:
@@ -12,6 +13,7 @@ class E1r2Scheme:
         self.citation = citation
         return
 
+    @instrument()
     def integrate(self, f, dot=numpy.dot):
         x = numpy.array([self.points.T])
         fx = numpy.asarray(f(x))
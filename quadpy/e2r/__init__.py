@@ -1,20 +1,4 @@
-from ._haegemans_piessens import haegemans_piessens_a, haegemans_piessens_b
-from ._rabinowitz_richter import (  # rabinowitz_richter_4,
-    rabinowitz_richter_1,
-    rabinowitz_richter_2,
-    rabinowitz_richter_3,
-    rabinowitz_richter_5,
-)
-from ._stroud import (
-    stroud_4_1,
-    stroud_5_1,
-    stroud_7_1,
-    stroud_9_1,
-    stroud_11_1,
-    stroud_11_2,
-    stroud_15_1,
-)
-from ._stroud_secrest import stroud_secrest_5, stroud_secrest_6
+from .._lazy import lazy_import
 
 __all__ = [
     "haegemans_piessens_a",
@@ -34,3 +18,26 @@ __all__ = [
     "stroud_secrest_5",
     "stroud_secrest_6",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._haegemans_piessens": ["haegemans_piessens_a", "haegemans_piessens_b"],
+        "._rabinowitz_richter": [
+            "rabinowitz_richter_1",
+            "rabinowitz_richter_2",
+            "rabinowitz_richter_3",
+            "rabinowitz_richter_5",
+        ],
+        "._stroud": [
+            "stroud_4_1",
+            "stroud_5_1",
+            "stroud_7_1",
+            "stroud_9_1",
+            "stroud_11_1",
+            "stroud_11_2",
+            "stroud_15_1",
+        ],
+        "._stroud_secrest": ["stroud_secrest_5", "stroud_secrest_6"],
+    },
+)
@@ -3,6 +3,7 @@ import math
 import numpy
 
 from ..helpers import plot_disks
+from ..helpers.stats import instrument
 
 
 class E2r2Scheme:
@@ -48,6 +49,7 @@ class E2r2Scheme:
         plot_disks(plt, self.points, self.weights, I0)
         return
 
+    @instrument()
     def integrate(self, f, dot=numpy.dot):
         flt = numpy.vectorize(float)
         return dot(f(flt(self.points).T), flt(self.weights))
@@ -1,17 +1,4 @@
-from ._stroud import (
-    stroud_e3r_5_1,
-    stroud_e3r_5_2,
-    stroud_e3r_5_3,
-    stroud_e3r_7_1,
-    stroud_e3r_7_2,
-)
-from ._stroud_secrest import (
-    stroud_secrest_07,
-    stroud_secrest_08,
-    stroud_secrest_09,
-    stroud_secrest_10,
-    stroud_secrest_11,
-)
+from .._lazy import lazy_import
 
 __all__ = [
     "stroud_e3r_5_1",
@@ -25,3 +12,23 @@ __all__ = [
     "stroud_secrest_10",
     "stroud_secrest_11",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._stroud": [
+            "stroud_e3r_5_1",
+            "stroud_e3r_5_2",
+            "stroud_e3r_5_3",
+            "stroud_e3r_7_1",
+            "stroud_e3r_7_2",
+        ],
+        "._stroud_secrest": [
+            "stroud_secrest_07",
+            "stroud_secrest_08",
+            "stroud_secrest_09",
+            "stroud_secrest_10",
+            "stroud_secrest_11",
+        ],
+    },
+)
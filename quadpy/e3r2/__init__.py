@@ -1,24 +1,4 @@
-from ._stroud import (
-    stroud_e3r2_5_1,
-    stroud_e3r2_5_2a,
-    stroud_e3r2_5_2b,
-    stroud_e3r2_5_3,
-    stroud_e3r2_7_1a,
-    stroud_e3r2_7_1b,
-    stroud_e3r2_7_2a,
-    stroud_e3r2_7_2b,
-    stroud_e3r2_14_1,
-)
-from ._stroud_secrest import (
-    stroud_secrest_07,
-    stroud_secrest_08a,
-    stroud_secrest_08b,
-    stroud_secrest_09,
-    stroud_secrest_10a,
-    stroud_secrest_10b,
-    stroud_secrest_11a,
-    stroud_secrest_11b,
-)
+from .._lazy import lazy_import
 
 __all__ = [
     "stroud_e3r2_5_1",
@@ -39,3 +19,30 @@ __all__ = [
     "stroud_secrest_11a",
     "stroud_secrest_11b",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._stroud": [
+            "stroud_e3r2_5_1",
+            "stroud_e3r2_5_2a",
+            "stroud_e3r2_5_2b",
+            "stroud_e3r2_5_3",
+            "stroud_e3r2_7_1a",
+            "stroud_e3r2_7_1b",
+            "stroud_e3r2_7_2a",
+            "stroud_e3r2_7_2b",
+            "stroud_e3r2_14_1",
+        ],
+        "._stroud_secrest": [
+            "stroud_secrest_07",
+            "stroud_secrest_08a",
+            "stroud_secrest_08b",
+            "stroud_secrest_09",
+            "stroud_secrest_10a",
+            "stroud_secrest_10b",
+            "stroud_secrest_11a",
+            "stroud_secrest_11b",
+        ],
+    },
+)
@@ -1,6 +1,7 @@
 import numpy
 
 from ..helpers import backend_to_function
+from ..helpers.stats import instrument
 
 
 class E3r2Scheme:
@@ -24,6 +25,7 @@ class E3r2Scheme:
             self.points_symbolic = points
         return
 
+    @instrument()
     def integrate(self, f, dot=numpy.dot):
         flt = numpy.vectorize(float)
         return dot(f(flt(self.points).T), flt(self.weights))
@@ -1,16 +1,4 @@
-from ._stroud import (
-    stroud_enr_3_1,
-    stroud_enr_3_2,
-    stroud_enr_5_1,
-    stroud_enr_5_3,
-    stroud_enr_5_4,
-)
-from ._stroud_secrest import (
-    stroud_secrest_1,
-    stroud_secrest_2,
-    stroud_secrest_3,
-    stroud_secrest_4,
-)
+from .._lazy import lazy_import
 
 __all__ = [
     "stroud_enr_3_1",
@@ -23,3 +11,22 @@ __all__ = [
     "stroud_secrest_3",
     "stroud_secrest_4",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._stroud": [
+            "stroud_enr_3_1",
+            "stroud_enr_3_2",
+            "stroud_enr_5_1",
+            "stroud_enr_5_3",
+            "stroud_enr_5_4",
+        ],
+        "._stroud_secrest": [
+            "stroud_secrest_1",
+            "stroud_secrest_2",
+            "stroud_secrest_3",
+            "stroud_secrest_4",
+        ],
+    },
+)
@@ -1,8 +1,9 @@
+import math
+
 import numpy
-from sympy import Rational as frac
-from sympy import gamma, pi, sqrt
+import sympy
 
-from ..helpers import book, fsd, pm_array0, untangle
+from ..helpers import book, fsd, get_kernel, pm_array0, untangle
 from ._helpers import EnrScheme
 from ._stroud_secrest import stroud_secrest_2 as stroud_enr_3_1
 from ._stroud_secrest import stroud_secrest_3 as stroud_enr_3_2
@@ -34,7 +35,10 @@ citation = book(
 #     return 5, data
 
 
-def stroud_enr_5_3(n):
+def stroud_enr_5_3(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
     """Spherical product Lobatto formula.
     """
     data = []
@@ -52,7 +56,10 @@ def stroud_enr_5_3(n):
     return EnrScheme("Stroud Enr 5-3", n, weights, points, 5, citation)
 
 
-def stroud_enr_5_4(n):
+def stroud_enr_5_4(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
     r = sqrt(((n + 2) * (n + 3) + (n - 1) * (n + 3) * sqrt(2 * (n + 2))) / n)
     s = sqrt(((n + 2) * (n + 3) - (n + 3) * sqrt(2 * (n + 2))) / n)
     A = frac(4 * n + 6, (n + 2) * (n + 3))
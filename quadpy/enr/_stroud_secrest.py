@@ -1,9 +1,10 @@
+import math
+
 import numpy
-from sympy import Rational as frac
-from sympy import gamma, pi, sqrt
+import sympy
 
 from ..enr2._stroud_secrest import _nsimplex
-from ..helpers import article, fsd, pm, untangle
+from ..helpers import article, fsd, get_kernel, pm, untangle
 from ._helpers import EnrScheme
 
 citation = article(
@@ -17,14 +18,20 @@ citation = article(
 )
 
 
-def stroud_secrest_1(n):
-    data = [(frac(1, n + 1), sqrt(n + 1) * _nsimplex(n))]
+def stroud_secrest_1(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
+    data = [(frac(1, n + 1), sqrt(n + 1) * _nsimplex(n, symbolic))]
     points, weights = untangle(data)
     weights *= 2 * sqrt(pi) ** n * gamma(n) / gamma(frac(n, 2))
     return EnrScheme("Stroud-Secrest I", n, weights, points, 2, citation)
 
 
-def stroud_secrest_2(n):
+def stroud_secrest_2(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
     nu = sqrt(n * (n + 1))
     data = [(frac(1, 2 * n), fsd(n, (nu, 1)))]
     points, weights = untangle(data)
@@ -32,7 +39,10 @@ def stroud_secrest_2(n):
     return EnrScheme("Stroud-Secrest II", n, weights, points, 3, citation)
 
 
-def stroud_secrest_3(n):
+def stroud_secrest_3(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
     nu = sqrt(n + 1)
     data = [(frac(1, 2 ** n), pm(n, nu))]
     points, weights = untangle(data)
@@ -40,7 +50,10 @@ def stroud_secrest_3(n):
     return EnrScheme("Stroud-Secrest III", n, weights, points, 3, citation)
 
 
-def stroud_secrest_4(n):
+def stroud_secrest_4(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
     nu = sqrt((n + 2) * (n + 3))
     xi = sqrt(frac((n + 2) * (n + 3), 2))
     A = frac(2 * (2 * n + 3), (n + 2) * (n + 3))
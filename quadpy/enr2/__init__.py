@@ -1,40 +1,4 @@
-from ._stenger import (
-    stenger_7a,
-    stenger_7b,
-    stenger_9a,
-    stenger_9b,
-    stenger_11a,
-    stenger_11b,
-)
-from ._stroud import (
-    stroud_enr2_3_1,
-    stroud_enr2_3_2,
-    stroud_enr2_5_1a,
-    stroud_enr2_5_1b,
-    stroud_enr2_5_2,
-    stroud_enr2_5_3,
-    stroud_enr2_5_4,
-    stroud_enr2_5_5a,
-    stroud_enr2_5_5b,
-    stroud_enr2_5_6,
-    stroud_enr2_7_1a,
-    stroud_enr2_7_1b,
-    stroud_enr2_7_2,
-    stroud_enr2_7_3a,
-    stroud_enr2_7_3b,
-    stroud_enr2_9_1a,
-    stroud_enr2_9_1b,
-    stroud_enr2_11_1a,
-    stroud_enr2_11_1b,
-)
-from ._stroud_1967_5 import stroud_1967_5_a, stroud_1967_5_b
-from ._stroud_1967_7 import stroud_1967_7_2a, stroud_1967_7_2b, stroud_1967_7_4
-from ._stroud_secrest import (
-    stroud_secrest_1,
-    stroud_secrest_2,
-    stroud_secrest_3,
-    stroud_secrest_4,
-)
+from .._lazy import lazy_import
 
 __all__ = [
     "stenger_7a",
@@ -72,3 +36,46 @@ __all__ = [
     "stroud_secrest_3",
     "stroud_secrest_4",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._stenger": [
+            "stenger_7a",
+            "stenger_7b",
+            "stenger_9a",
+            "stenger_9b",
+            "stenger_11a",
+            "stenger_11b",
+        ],
+        "._stroud": [
+            "stroud_enr2_3_1",
+            "stroud_enr2_3_2",
+            "stroud_enr2_5_1a",
+            "stroud_enr2_5_1b",
+            "stroud_enr2_5_2",
+            "stroud_enr2_5_3",
+            "stroud_enr2_5_4",
+            "stroud_enr2_5_5a",
+            "stroud_enr2_5_5b",
+            "stroud_enr2_5_6",
+            "stroud_enr2_7_1a",
+            "stroud_enr2_7_1b",
+            "stroud_enr2_7_2",
+            "stroud_enr2_7_3a",
+            "stroud_enr2_7_3b",
+            "stroud_enr2_9_1a",
+            "stroud_enr2_9_1b",
+            "stroud_enr2_11_1a",
+            "stroud_enr2_11_1b",
+        ],
+        "._stroud_1967_5": ["stroud_1967_5_a", "stroud_1967_5_b"],
+        "._stroud_1967_7": ["stroud_1967_7_2a", "stroud_1967_7_2b", "stroud_1967_7_4"],
+        "._stroud_secrest": [
+            "stroud_secrest_1",
+            "stroud_secrest_2",
+            "stroud_secrest_3",
+            "stroud_secrest_4",
+        ],
+    },
+)
@@ -1,5 +1,7 @@
 import numpy
 
+from ..helpers.stats import instrument
+
 
 class Enr2Scheme:
     def __init__(self, name, dim, weights, points, degree, citation):
@@ -23,6 +25,7 @@ class Enr2Scheme:
             self.points_symbolic = points
         return
 
+    @instrument()
     def integrate(self, f, dot=numpy.dot):
         flt = numpy.vectorize(float)
         return dot(f(flt(self.points).T), flt(self.weights))
@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import pi, sqrt
-
-from ..helpers import book, fsd, pm, pm_array0, untangle
+from ..helpers import book, fsd, get_kernel, pm, pm_array0, untangle
 from ._helpers import Enr2Scheme
 from ._stenger import stenger_7a as stroud_enr2_7_3a
 from ._stenger import stenger_7b as stroud_enr2_7_3b
@@ -26,7 +23,9 @@ citation = book(
 )
 
 
-def stroud_enr2_5_3(n):
+def stroud_enr2_5_3(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+
     assert n > 2
 
     r = sqrt(frac(n + 2, 4))
@@ -40,7 +39,9 @@ def stroud_enr2_5_3(n):
     return Enr2Scheme("Stroud Enr2 5-3", n, weights, points, 5, citation)
 
 
-def stroud_enr2_5_4(n):
+def stroud_enr2_5_4(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+
     # Spherical product Lobatto
     B0 = frac(2, (n + 2))
     data = [(B0, [n * [0]])]
@@ -57,10 +58,13 @@ def stroud_enr2_5_4(n):
     return Enr2Scheme("Stroud Enr2 5-4", n, weights, points, 5, citation)
 
 
-def _stroud_5_5(n, variant_a):
-    p_m = +1 if variant_a else -1
+def _stroud_5_5(n, variant_a, symbolic):
+    frac, sqrt, pi = get_kernel(symbolic)
 
     # r is complex-valued for n >= 3
+    assert variant_a or n == 2, f"Variant b only works for n = 2, not n = {n}"
+    p_m = +1 if variant_a else -1
+
     r = sqrt((n + 2 + p_m * (n - 1) * sqrt(2 * (n + 2))) / (2 * n))
     s = sqrt((n + 2 - p_m * sqrt(2 * (n + 2))) / (2 * n))
     A = frac(2, n + 2)
@@ -74,15 +78,17 @@ def _stroud_5_5(n, variant_a):
     return Enr2Scheme(name, n, weights, points, 5, citation)
 
 
-def stroud_enr2_5_5a(n):
-    return _stroud_5_5(n, True)
+def stroud_enr2_5_5a(n, symbolic=False):
+    return _stroud_5_5(n, True, symbolic)
+
 
+def stroud_enr2_5_5b(n, symbolic=False):
+    return _stroud_5_5(n, False, symbolic)
 
-def stroud_enr2_5_5b(n):
-    return _stroud_5_5(n, False)
 
+def stroud_enr2_5_6(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
 
-def stroud_enr2_5_6(n):
     assert n >= 5
 
     sqrt2 = sqrt(2)
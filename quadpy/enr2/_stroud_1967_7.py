@@ -1,9 +1,10 @@
+import math
+
 import numpy
-from sympy import Rational as frac
-from sympy import gamma, pi, sqrt
+import sympy
 
 from .. import nsphere
-from ..helpers import article, fsd, pm, untangle
+from ..helpers import article, fsd, get_kernel, pm, untangle
 from ._helpers import Enr2Scheme
 
 citation = article(
@@ -17,7 +18,9 @@ citation = article(
 )
 
 
-def _stroud_1967_7_2(n, variant_a=True):
+def _stroud_1967_7_2(n, variant_a, symbolic):
+    _, sqrt, pi = get_kernel(symbolic)
+
     if variant_a:
         # the points/weights are complex-valued for n >= 9; one could permit that
         assert n in [2, 3, 4, 6, 7]
@@ -54,15 +57,18 @@ def _stroud_1967_7_2(n, variant_a=True):
     return Enr2Scheme(name, n, weights, points, 7, citation)
 
 
-def stroud_1967_7_2a(n):
-    return _stroud_1967_7_2(n, True)
+def stroud_1967_7_2a(n, symbolic=False):
+    return _stroud_1967_7_2(n, True, symbolic)
+
 
+def stroud_1967_7_2b(n, symbolic=False):
+    return _stroud_1967_7_2(n, False, symbolic)
 
-def stroud_1967_7_2b(n):
-    return _stroud_1967_7_2(n, False)
 
+def stroud_1967_7_4(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
 
-def stroud_1967_7_4(n):
     assert n >= 3
 
     sqrt2n2 = sqrt(2 * (n + 2))
@@ -70,7 +76,7 @@ def stroud_1967_7_4(n):
     g = gamma(frac(n, 2))
     A1, A2 = [(n + 2 + p_m * sqrt2n2) / 4 / (n + 2) * g for p_m in [+1, -1]]
 
-    s = nsphere.stroud_1967(n)
+    s = nsphere.stroud_1967(n, symbolic)
 
     points = numpy.concatenate([r1 * s.points, r2 * s.points])
     weights = numpy.concatenate([A1 * s.weights, A2 * s.weights])
@@ -1,8 +1,6 @@
 import numpy
-from sympy import Rational as frac
-from sympy import pi, sqrt
 
-from ..helpers import article, fsd, pm, untangle
+from ..helpers import article, fsd, get_kernel, pm, untangle
 from ._helpers import Enr2Scheme
 
 citation = article(
@@ -16,14 +14,18 @@ citation = article(
 )
 
 
-def stroud_secrest_1(n):
-    data = [(frac(1, n + 1), sqrt(frac(1, 2)) * _nsimplex(n))]
+def stroud_secrest_1(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+
+    data = [(frac(1, n + 1), sqrt(frac(1, 2)) * _nsimplex(n, symbolic))]
     points, weights = untangle(data)
     weights *= sqrt(pi) ** n
     return Enr2Scheme("Stroud-Secrest I", n, weights, points, 2, citation)
 
 
-def stroud_secrest_2(n):
+def stroud_secrest_2(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+
     nu = sqrt(frac(n, 2))
     data = [(frac(1, 2 * n), fsd(n, (nu, 1)))]
     points, weights = untangle(data)
@@ -31,7 +33,9 @@ def stroud_secrest_2(n):
     return Enr2Scheme("Stroud-Secrest II", n, weights, points, 3, citation)
 
 
-def stroud_secrest_3(n):
+def stroud_secrest_3(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+
     nu = sqrt(frac(1, 2))
     data = [(frac(1, 2 ** n), pm(n, nu))]
     points, weights = untangle(data)
@@ -39,7 +43,9 @@ def stroud_secrest_3(n):
     return Enr2Scheme("Stroud-Secrest III", n, weights, points, 3, citation)
 
 
-def stroud_secrest_4(n):
+def stroud_secrest_4(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+
     nu = sqrt(frac(n + 2, 2))
     xi = sqrt(frac(n + 2, 4))
     A = frac(2, n + 2)
@@ -52,7 +58,9 @@ def stroud_secrest_4(n):
     return Enr2Scheme("Stroud-Secrest IV", n, weights, points, 5, citation)
 
 
-def _nsimplex(n):
+def _nsimplex(n, symbolic):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     # construct the regular n-simplex points with 0 center
     return numpy.array(
         [
@@ -1,26 +1,4 @@
-from .combinatorics import (
-    combine,
-    fs_array,
-    fsd,
-    get_all_exponents,
-    pm,
-    pm_array,
-    pm_array0,
-    pm_roll,
-    rd,
-    z,
-)
-from .misc import (
-    article,
-    book,
-    compute_dobrodeev,
-    n_outer,
-    online,
-    phdthesis,
-    techreport,
-    untangle,
-)
-from .plot import backend_to_function, plot_disks, plot_disks_1d, show_mpl, show_vtk
+from .._lazy import lazy_import
 
 __all__ = [
     "z",
@@ -36,6 +14,7 @@ __all__ = [
     "untangle",
     "n_outer",
     "compute_dobrodeev",
+    "get_kernel",
     "article",
     "book",
     "techreport",
@@ -46,4 +25,57 @@ __all__ = [
     "show_mpl",
     "show_vtk",
     "backend_to_function",
+    "cached_scheme",
+    "scheme_cache",
+    "SchemeCache",
+    "CacheInfo",
+    "read_table",
+    "get_good_scheme",
+    "integrate_mesh",
+    "MappedScheme",
+    "collect_stats",
+    "IntegrationStats",
+    "IntegrationRecord",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        ".cache": ["CacheInfo", "SchemeCache", "cached_scheme", "scheme_cache"],
+        ".combinatorics": [
+            "combine",
+            "fs_array",
+            "fsd",
+            "get_all_exponents",
+            "pm",
+            "pm_array",
+            "pm_array0",
+            "pm_roll",
+            "rd",
+            "z",
+        ],
+        ".misc": [
+            "article",
+            "book",
+            "compute_dobrodeev",
+            "get_kernel",
+            "n_outer",
+            "online",
+            "phdthesis",
+            "techreport",
+            "untangle",
+        ],
+        ".plot": [
+            "backend_to_function",
+            "plot_disks",
+            "plot_disks_1d",
+            "show_mpl",
+            "show_vtk",
+        ],
+        ".good_schemes": ["get_good_scheme"],
+        ".mapped": ["MappedScheme"],
+        ".mesh": ["integrate_mesh"],
+        ".stats": ["IntegrationRecord", "IntegrationStats", "collect_stats"],
+        ".store": ["read_table"],
+    },
+)
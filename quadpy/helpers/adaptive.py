@@ -0,0 +1,134 @@
+import warnings
+
+import numpy
+
+from ..line_segment._tools import _scatter_add
+from .stats import record_levels
+
+
+def integrate_cells(
+    integrate,
+    refine,
+    cells,
+    cells_shape,
+    eps,
+    minimum_volume,
+    minimum_fraction,
+    num_points,
+    name,
+    full_output,
+):
+    """The bookkeeping of the adaptive integrators for n-cubes and tetrahedra: every
+    cell of `cells` (the cell index is on axis -2) is refined on its own until the
+    summed error estimate of its pieces is at most `eps` (given per cell); in each step,
+    the pieces with an error estimate of at least a quarter of the largest one in the
+    cell are split.
+
+    `integrate(pieces)` returns the integrals, the error estimates and the volumes of
+    the pieces, plus data for `refine` (or None); it evaluates `f` in `num_points`
+    points per piece. `refine(pieces, data)` returns the children and, for every child,
+    the index of its parent.
+
+    A cell whose pieces would get smaller than `minimum_volume` (by default
+    `minimum_fraction` times the cell volume) isn't refined further; its value and error
+    estimate are those of its current pieces. If that happens, a warning is shown,
+    unless `full_output` is True; then a dictionary with the number of function
+    evaluations, the number of pieces (`"num_" + name`), the refinement depth and
+    whether the tolerance was met (`converged`) per cell is returned as third value.
+    """
+    num_cells = cells.shape[-2]
+    val, err, vol, data = integrate(cells)
+    eps = numpy.broadcast_to(eps, cells_shape).reshape(-1)
+    if minimum_volume is None:
+        minimum_volume = minimum_fraction * vol
+    minimum_volume = numpy.broadcast_to(minimum_volume, (num_cells,))
+
+    # The pieces of all cells which aren't done yet; `idx` is the index of the cell that
+    # a piece belongs to.
+    pieces = cells
+    idx = numpy.arange(num_cells)
+    level = numpy.zeros(num_cells, dtype=int)
+
+    total_val = numpy.zeros(val.shape, dtype=val.dtype)
+    total_err = numpy.zeros(err.shape)
+    num_evaluations = numpy.full(num_cells, num_points)
+    num_pieces = numpy.zeros(num_cells, dtype=int)
+    depth = numpy.zeros(num_cells, dtype=int)
+    converged = numpy.ones(num_cells, dtype=bool)
+
+    while True:
+        # the error estimate of a piece is the max over all components of f
+        err_max = numpy.max(err, axis=tuple(range(err.ndim - 1)))
+        cell_err = numpy.bincount(idx, weights=err_max, minlength=num_cells)
+        is_done = (cell_err[idx] <= eps[idx]) | ~converged[idx]
+        _scatter_add(total_val, idx[is_done], val[..., is_done])
+        _scatter_add(total_err, idx[is_done], err[..., is_done])
+        num_pieces += numpy.bincount(idx[is_done], minlength=num_cells)
+        numpy.maximum.at(depth, idx[is_done], level[is_done])
+
+        keep = ~is_done
+        if not numpy.any(keep):
+            break
+        pieces = pieces[..., keep, :]
+        idx, level, val, err, err_max = (
+            idx[keep],
+            level[keep],
+            val[..., keep],
+            err[..., keep],
+            err_max[keep],
+        )
+        if data is not None:
+            data = data[keep]
+
+        # Split the pieces with the largest error estimates in every cell.
+        cell_max = numpy.zeros(num_cells)
+        numpy.maximum.at(cell_max, idx, err_max)
+        is_bad = err_max >= 0.25 * cell_max[idx]
+
+        children, parent = refine(
+            pieces[..., is_bad, :], None if data is None else data[is_bad]
+        )
+        child_idx = idx[is_bad][parent]
+        child_level = level[is_bad][parent] + 1
+        child_val, child_err, child_vol, child_data = integrate(children)
+        num_evaluations += numpy.bincount(child_idx, minlength=num_cells) * num_points
+
+        # Cells with too small children give up and keep their current pieces.
+        is_small = child_vol < minimum_volume[child_idx]
+        if numpy.any(is_small):
+            converged[child_idx[is_small]] = False
+            is_valid = converged[child_idx]
+            children = children[..., is_valid, :]
+            child_idx, child_level = child_idx[is_valid], child_level[is_valid]
+            child_val, child_err = child_val[..., is_valid], child_err[..., is_valid]
+            if child_data is not None:
+                child_data = child_data[is_valid]
+            is_bad &= converged[idx]
+
+        pieces = numpy.concatenate([pieces[..., ~is_bad, :], children], axis=-2)
+        idx = numpy.concatenate([idx[~is_bad], child_idx])
+        level = numpy.concatenate([level[~is_bad], child_level])
+        val = numpy.concatenate([val[..., ~is_bad], child_val], axis=-1)
+        err = numpy.concatenate([err[..., ~is_bad], child_err], axis=-1)
+        if data is not None:
+            data = numpy.concatenate([data[~is_bad], child_data])
+
+    record_levels(numpy.max(depth))
+    total_val = total_val.reshape(total_val.shape[:-1] + cells_shape)
+    total_err = total_err.reshape(total_err.shape[:-1] + cells_shape)
+    if full_output:
+        info = {
+            "num_evaluations": num_evaluations.reshape(cells_shape),
+            "num_" + name: num_pieces.reshape(cells_shape),
+            "depth": depth.reshape(cells_shape),
+            "converged": converged.reshape(cells_shape),
+        }
+        return total_val, total_err, info
+    if not numpy.all(converged):
+        warnings.warn(
+            f"Tolerance not reached in {numpy.count_nonzero(~converged)} of "
+            f"{num_cells} cells, the {name} would get smaller than the minimum volume "
+            f"(largest error estimate: {numpy.max(total_err)}). "
+            "Use full_output=True for the details per cell."
+        )
+    return total_val, total_err
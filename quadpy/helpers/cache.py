@@ -0,0 +1,163 @@
+import functools
+import inspect
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class SchemeCache:
+    """Process-wide LRU cache for schemes created by parametrized constructors like
+    `line_segment.gauss_legendre(n)` or `nsimplex.grundmann_moeller(n, s)`.
+
+    Entries are keyed on the constructor and its (normalized) arguments, including
+    defaults such as `mode`, and, for modes other than "numpy", the current mpmath
+    precision. The cached schemes are shared between all callers, so they are read-only:
+    their numpy array attributes can't be written to, and assigning or deleting
+    attributes raises an AttributeError. `copy.copy()` gives a modifiable scheme.
+    `maxsize=None` means the cache is unbounded, `maxsize=0` disables it.
+    """
+
+    def __init__(self, maxsize=256):
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        assert value is None or value >= 0
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def clear(self):
+        """Remove all entries and reset the hit/miss statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key, create):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        # Don't hold the lock while constructing; schemes can take a while to build.
+        scheme = _freeze(create())
+
+        with self._lock:
+            if self._maxsize != 0:
+                self._data[key] = scheme
+                self._data.move_to_end(key)
+                self._evict()
+        return scheme
+
+    def _evict(self):
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+scheme_cache = SchemeCache()
+
+
+def _freeze(scheme):
+    for value in vars(scheme).values():
+        if isinstance(value, numpy.ndarray):
+            value.flags.writeable = False
+    # Block attribute assignment with a subclass; the object stays an instance of its
+    # class. (Objects of built-in types, e.g., the SimpleNamespace levels of
+    # tanh_sinh, can't change their class; they are internal.)
+    try:
+        scheme.__class__ = _frozen_class(type(scheme))
+    except TypeError:
+        pass
+    return scheme
+
+
+@functools.lru_cache(maxsize=None)
+def _frozen_class(cls):
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"Cached {cls.__name__} objects are shared and read-only; "
+            "use copy.copy() for a modifiable one."
+        )
+
+    def __delattr__(self, name):
+        __setattr__(self, name, None)
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles (e.g., for worker processes) are ordinary objects
+        return _thaw, (cls, vars(self).copy())
+
+    return type(
+        cls.__name__,
+        (cls,),
+        {
+            "__setattr__": __setattr__,
+            "__delattr__": __delattr__,
+            "__reduce_ex__": __reduce_ex__,
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+        },
+    )
+
+
+def _thaw(cls, state):
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def _hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def cached_scheme(fun):
+    """Decorator for scheme constructors; routes all calls through `scheme_cache`.
+    Calls with unhashable arguments (e.g., arrays) bypass the cache. Schemes built in
+    mpmath (or sympy) mode depend on `mp.prec`, which is part of their key.
+    """
+    signature = inspect.signature(fun)
+    name = f"{fun.__module__}.{fun.__qualname__}"
+
+    @functools.wraps(fun)
+    def wrapped(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (name, _hashable(tuple(bound.arguments.items())))
+        if bound.arguments.get("mode", "numpy") != "numpy":
+            # not at the top, mpmath is only loaded when needed
+            from mpmath import mp
+
+            key += (mp.prec,)
+        try:
+            hash(key)
+        except TypeError:
+            return fun(*args, **kwargs)
+        return scheme_cache.get(key, lambda: fun(*args, **kwargs))
+
+    return wrapped
@@ -61,21 +61,27 @@ def combine(*elems):
     """
     # https://stackoverflow.com/a/45321972/353337
 
-    # Could be replaced by Knuth's "Algorithm L"; see, e.g.,
-    # <https://stackoverflow.com/a/4250183/353337>.
+    # Knuth's "Algorithm L", see, e.g., <https://stackoverflow.com/a/4250183/353337>:
+    # All distinct permutations of the group indices in lexicographic order. This is
+    # much faster than a recursive generator for large n.
     def partitions(*sizes):
-        if not sizes or all(s <= 0 for s in sizes):
-            yield ()
-        for i_size, size in enumerate(sizes):
-            if size <= 0:
-                continue
-            next_sizes = sizes[:i_size] + (sizes[i_size] - 1,) + sizes[i_size + 1 :]
-            for p in partitions(*next_sizes):
-                yield (i_size,) + p
+        a = [i for i, size in enumerate(sizes) for _ in range(size)]
+        while True:
+            yield tuple(a)
+            j = len(a) - 2
+            while j >= 0 and a[j] >= a[j + 1]:
+                j -= 1
+            if j < 0:
+                return
+            k = len(a) - 1
+            while a[j] >= a[k]:
+                k -= 1
+            a[j], a[k] = a[k], a[j]
+            a[j + 1 :] = a[:j:-1]
 
     values, sizes = zip(*elems)
     templates = partitions(*sizes)
-    prod = [itertools.product(*(values[ti] for ti in t)) for t in templates]
+    prod = [itertools.product(*map(values.__getitem__, t)) for t in templates]
     out = numpy.array(list(itertools.chain.from_iterable(prod)))
     return out
 
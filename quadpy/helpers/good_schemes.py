@@ -0,0 +1,187 @@
+import functools
+import importlib
+import inspect
+import json
+import os
+import warnings
+
+import numpy
+
+_quadpy_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_index_file = os.path.join(_quadpy_dir, "_good_schemes.json")
+
+_tol = 1.0e-12
+
+
+def _in_simplex(points):
+    # barycentric coordinates
+    return numpy.all(points >= -_tol)
+
+
+def _in_cube(points):
+    return numpy.all(numpy.abs(points) <= 1 + _tol)
+
+
+def _in_disk(points):
+    return numpy.all(numpy.einsum("ij,ij->i", points, points) <= 1 + _tol)
+
+
+def _in_wedge(points):
+    x, y, z = points.T
+    return _in_cube(z) and numpy.all((x >= -_tol) & (y >= -_tol) & (x + y <= 1 + _tol))
+
+
+def _in_pyramid(points):
+    # base [-1, 1]^2 at z = -1, apex at z = 1
+    x, y, z = points.T
+    r = (1 - z) / 2 + _tol
+    return _in_cube(z) and numpy.all((numpy.abs(x) <= r) & (numpy.abs(y) <= r))
+
+
+def _on_sphere(points):
+    return True
+
+
+# All domains with a scheme index and their "points inside" predicates
+_domains = {
+    "disk": _in_disk,
+    "hexahedron": _in_cube,
+    "ncube": _in_cube,
+    "nsimplex": _in_simplex,
+    "pyramid": _in_pyramid,
+    "quadrilateral": _in_cube,
+    "sphere": _on_sphere,
+    "tetrahedron": _in_simplex,
+    "triangle": _in_simplex,
+    "wedge": _in_wedge,
+}
+# Domains of arbitrary dimension; the prebuilt index covers these dimensions.
+_dim_domains = ["ncube", "nsimplex"]
+_dims = range(2, 7)
+
+
+def get_good_scheme(domain, degree, n=None):
+    """Returns the scheme of `domain` (of dimension `n` for ncube/nsimplex) with
+    degree at least `degree` that has the fewest points; schemes with positive weights
+    and all points inside the domain are preferred. Returns None if there is no such
+    scheme.
+
+    This is a lookup in the index which is built with the package (see setup.py, also
+    for editable installs) or by `tools/build_scheme_store.py` (`make store`). No
+    schemes are constructed other than the one returned. If the index is missing or doesn't
+    cover the domain (e.g., other dimensions of ncube/nsimplex), an error is raised;
+    `build_index()` then computes the table explicitly.
+    """
+    table = _get_index(domain, n)
+    degree = max(degree, 0)
+    if degree >= len(table):
+        return None
+    name, args = table[degree]
+    return getattr(importlib.import_module(f"quadpy.{domain}"), name)(*args)
+
+
+def _get_index(domain, n):
+    assert domain in _domains, f"Unknown domain {domain}."
+    assert (n is not None) == (domain in _dim_domains)
+    index = _load_index()
+    if index is None:
+        raise FileNotFoundError(
+            f"The scheme index {_index_file} doesn't exist. "
+            "Install quadpy (pip install .) or build it with "
+            "tools/build_scheme_store.py (make store)."
+        )
+    if str(n) not in index.get(domain, {}):
+        raise ValueError(
+            f"The scheme index doesn't cover {domain}"
+            + ("" if n is None else f" of dimension {n}")
+            + ". Use build_index() for it."
+        )
+    return index[domain][str(n)]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_index():
+    if not os.path.exists(_index_file):
+        return None
+    with open(_index_file, "r") as f:
+        return json.load(f)
+
+
+def _candidates(domain, n):
+    # All scheme constructors of the domain with their arguments. For ncube/nsimplex,
+    # these are the constructors which take the dimension as their only argument.
+    module = importlib.import_module(f"quadpy.{domain}")
+    for name in module.__all__:
+        fun = getattr(module, name)
+        # skip classes and tools like transform(), get_vol()
+        if not inspect.isfunction(fun) or fun.__module__.endswith(
+            ("_helpers", "_tools")
+        ):
+            continue
+        required = [
+            p
+            for p in inspect.signature(fun).parameters.values()
+            if p.default is p.empty and p.kind == p.POSITIONAL_OR_KEYWORD
+        ]
+        if n is None and not required:
+            yield name, []
+        elif n is not None and len(required) == 1:
+            yield name, [n]
+    if domain == "nsimplex":
+        for s in range(6):
+            yield "grundmann_moeller", [n, s]
+
+
+@functools.lru_cache(maxsize=None)
+def build_index(domain, n=None):
+    """Constructs all schemes of `domain` and returns a list which holds, for every
+    degree, the name and arguments of the best scheme of at least that degree.
+    Schemes of ncube/nsimplex which can't be constructed in dimension `n` are skipped.
+    """
+    module = importlib.import_module(f"quadpy.{domain}")
+    is_inside = _domains[domain]
+    entries = []
+    skipped = []
+    for name, args in _candidates(domain, n):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                scheme = getattr(module, name)(*args)
+            except Exception as e:
+                if n is None:
+                    raise
+                # Many ncube/nsimplex schemes only exist for some dimensions; they
+                # assert that. Other errors are reported.
+                if not isinstance(e, AssertionError):
+                    skipped.append(f"{name}{tuple(args)}: {e!r}")
+                continue
+        if not hasattr(scheme, "degree") or not hasattr(scheme, "weights"):
+            continue
+        weights = numpy.asarray(scheme.weights)
+        points = numpy.asarray(scheme.points)
+        is_good = bool(numpy.all(weights > 0) and is_inside(points))
+        key = (not is_good, len(weights), -scheme.degree)
+        entries.append((key, scheme.degree, name, args))
+
+    if skipped:
+        warnings.warn("Skipped schemes:\n" + "\n".join(skipped))
+
+    table = []
+    for degree in range(max(entry[1] for entry in entries) + 1):
+        best = min((e for e in entries if e[1] >= degree), key=lambda e: e[0])
+        table.append([best[2], best[3]])
+    return table
+
+
+def build_good_scheme_index(domains=None, filename=None):
+    """Builds the index of all `domains` (default: all) and writes it to `filename`
+    (default: next to the scheme store, where `get_good_scheme()` looks for it).
+    """
+    index = {}
+    for domain in _domains if domains is None else domains:
+        dims = _dims if domain in _dim_domains else [None]
+        index[domain] = {str(n): build_index(domain, n) for n in dims}
+    with open(_index_file if filename is None else filename, "w") as f:
+        json.dump(index, f)
+    _load_index.cache_clear()
+    return index
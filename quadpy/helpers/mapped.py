@@ -0,0 +1,26 @@
+import numpy
+
+from .stats import instrument
+
+
+class MappedScheme:
+    """A scheme mapped onto fixed cells: the quadrature points `points` (d, ..., m) in
+    the cells and the weights `weights` (..., m), i.e., the scheme weights times
+    |det(J)|. Get it from the `precompute()` method of a scheme; integrating many
+    functions over the same cells is then one contraction per function.
+    """
+
+    def __init__(self, points, weights):
+        self.points = points
+        self.weights = weights
+
+    @instrument()
+    def integrate(self, f):
+        fx = numpy.asarray(f(self.points))
+        n = len(self.weights.shape)
+        assert (
+            fx.shape[-n:] == self.weights.shape
+        ), "Illegal shape of f(x) (expected (..., {}), got {})".format(
+            ", ".join([str(k) for k in self.weights.shape]), fx.shape
+        )
+        return numpy.einsum("...j,...j->...", fx, self.weights)
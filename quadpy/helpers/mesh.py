@@ -0,0 +1,222 @@
+import collections
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+import types
+
+import numpy
+
+from .stats import instrument
+
+
+@instrument()
+def integrate_mesh(
+    f,
+    points,
+    cells,
+    scheme,
+    shape,
+    order=None,
+    chunk_size=2 ** 14,
+    reduce="cell",
+    workers=1,
+    pool="thread",
+):
+    """Integrates `f` over all cells of a mesh given by its `points` (n_points, d) and
+    the vertex indices `cells` (n_cells, n_vertices) with `scheme`. The cells are
+    processed in chunks of `chunk_size`, so the peak memory is bounded by the chunk
+    size instead of the mesh size.
+
+    `order` reorders the vertices of each cell and `shape` is the layout of the
+    (reordered) vertices in the domain's `integrate()`, e.g., (2, 2) for
+    quadrilaterals. With `reduce="cell"`, the integrals over all cells are returned
+    (shape (..., n_cells)); with `reduce="sum"`, their sum.
+
+    With `workers > 1` (-1: all CPUs), the chunks are integrated in parallel. The
+    default `pool="thread"` is for integrands which spend their time in NumPy (and
+    release the GIL); `pool="process"` is for Python-heavy integrands. Then, `points`
+    and `cells` are put in shared memory, and `f` and `scheme` must be picklable. The
+    chunks and their reduction order are the same as in the serial case, so the
+    results are identical.
+    """
+    assert reduce in ["cell", "sum"], f"Unknown reduce {reduce}."
+    assert pool in ["thread", "process"], f"Unknown pool {pool}."
+    points = numpy.asarray(points)
+    cells = numpy.asarray(cells)
+    n_cells, n_vertices = cells.shape
+    assert numpy.prod(shape) == n_vertices
+
+    chunk_size = max(min(chunk_size, n_cells), 1)
+    starts = range(0, n_cells, chunk_size)
+    workers = os.cpu_count() if workers == -1 else workers
+    workers = min(workers, len(starts))
+
+    args = (f, scheme, tuple(shape), order, chunk_size)
+    if workers <= 1:
+        worker = _init_worker(types.SimpleNamespace(), points, cells, *args)
+        vals = (_integrate_chunk(worker, start) for start in starts)
+        return _reduce(vals, n_cells, chunk_size, reduce)
+
+    if pool == "thread":
+        # The arrays are shared anyway, every thread gets its own buffer.
+        local = threading.local()
+        executor = concurrent.futures.ThreadPoolExecutor(workers)
+
+        def integrate_chunk(start):
+            if not hasattr(local, "buf"):
+                _init_worker(local, points, cells, *args)
+            return _integrate_chunk(local, start)
+
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            workers,
+            initializer=_init_shared_worker,
+            initargs=(_to_shared(points), _to_shared(cells)) + args,
+        )
+        integrate_chunk = _integrate_shared_chunk
+
+    with executor:
+        vals = _map(executor, integrate_chunk, starts, 2 * workers)
+        return _reduce(vals, n_cells, chunk_size, reduce)
+
+
+def integrate_chunked(
+    integrate, f, cells, axis, args=(), chunk_size=2 ** 14, workers=1, pool="thread"
+):
+    """Computes `integrate(f, cells, *args)` for the cells `cells` with the cell index
+    on `axis` in chunks of `chunk_size` cells; the results (cell index on the last axis)
+    are put together in order. With `workers > 1` (-1: all CPUs), the chunks are
+    integrated in parallel, see `integrate_mesh()`; with `pool="process"`, `cells` is
+    put in shared memory and `integrate`, `f` and `args` must be picklable. The chunks
+    are the same as in the serial case, so the results are identical (unless those of
+    `f` depend on the memory alignment of its input, like NumPy's sin() may).
+    """
+    assert pool in ["thread", "process"], f"Unknown pool {pool}."
+    n_cells = cells.shape[axis]
+    chunk_size = max(min(chunk_size, n_cells), 1)
+    starts = range(0, n_cells, chunk_size)
+    workers = os.cpu_count() if workers == -1 else workers
+    workers = min(workers, len(starts))
+
+    data = (integrate, f, axis, args, chunk_size)
+    if workers <= 1:
+        worker = _init_cells_worker(types.SimpleNamespace(), cells, *data)
+        vals = (_integrate_cells_chunk(worker, start) for start in starts)
+        return _reduce(vals, n_cells, chunk_size, "cell")
+
+    if pool == "thread":
+        worker = _init_cells_worker(types.SimpleNamespace(), cells, *data)
+        executor = concurrent.futures.ThreadPoolExecutor(workers)
+
+        def integrate_chunk(start):
+            return _integrate_cells_chunk(worker, start)
+
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            workers,
+            initializer=_init_shared_cells_worker,
+            initargs=(_to_shared(cells),) + data,
+        )
+        integrate_chunk = _integrate_shared_cells_chunk
+
+    with executor:
+        vals = _map(executor, integrate_chunk, starts, 2 * workers)
+        return _reduce(vals, n_cells, chunk_size, "cell")
+
+
+def _map(executor, fun, items, window):
+    # Like executor.map(), but with at most `window` pending chunks, so the finished
+    # ones can't pile up in memory.
+    futures = collections.deque()
+    for item in items:
+        if len(futures) == window:
+            yield futures.popleft().result()
+        futures.append(executor.submit(fun, item))
+    while futures:
+        yield futures.popleft().result()
+
+
+def _reduce(vals, n_cells, chunk_size, reduce):
+    out = None
+    total = 0.0
+    for k, val in enumerate(vals):
+        if reduce == "sum":
+            total = total + numpy.sum(val, axis=-1)
+            continue
+        if out is None:
+            out = numpy.empty(val.shape[:-1] + (n_cells,), dtype=val.dtype)
+        out[..., k * chunk_size : k * chunk_size + val.shape[-1]] = val
+    return total if reduce == "sum" else out
+
+
+def _init_worker(worker, points, cells, f, scheme, shape, order, chunk_size):
+    worker.points = points
+    worker.cells = cells
+    worker.f = f
+    worker.scheme = scheme
+    worker.shape = shape
+    worker.order = order
+    worker.chunk_size = chunk_size
+    # The vertex coordinates of all cells in a chunk; reused for all chunks.
+    worker.buf = numpy.empty(
+        (cells.shape[1], chunk_size, points.shape[1]), dtype=points.dtype
+    )
+    return worker
+
+
+def _integrate_chunk(worker, start):
+    idx = worker.cells[start : start + worker.chunk_size]
+    if worker.order is not None:
+        idx = idx[:, worker.order]
+    m = idx.shape[0]
+    chunk = worker.buf[:, :m]
+    numpy.take(worker.points, idx.T, axis=0, out=chunk)
+    d = worker.points.shape[1]
+    return worker.scheme.integrate(worker.f, chunk.reshape(worker.shape + (m, d)))
+
+
+def _to_shared(a):
+    raw = multiprocessing.RawArray("b", max(a.nbytes, 1))
+    numpy.frombuffer(raw, dtype=a.dtype, count=a.size).reshape(a.shape)[...] = a
+    return raw, a.dtype.str, a.shape
+
+
+def _from_shared(raw, dtype, shape):
+    count = int(numpy.prod(shape))
+    return numpy.frombuffer(raw, dtype=dtype, count=count).reshape(shape)
+
+
+# The data of a worker process
+_worker = types.SimpleNamespace()
+
+
+def _init_shared_worker(points, cells, *args):
+    _init_worker(_worker, _from_shared(*points), _from_shared(*cells), *args)
+
+
+def _integrate_shared_chunk(start):
+    return _integrate_chunk(_worker, start)
+
+
+def _init_cells_worker(worker, cells, integrate, f, axis, args, chunk_size):
+    worker.cells = cells
+    worker.integrate = integrate
+    worker.f = f
+    worker.axis = axis
+    worker.args = args
+    worker.chunk_size = chunk_size
+    return worker
+
+
+def _integrate_cells_chunk(worker, start):
+    idx = (slice(None),) * worker.axis + (slice(start, start + worker.chunk_size),)
+    return worker.integrate(worker.f, worker.cells[idx], *worker.args)
+
+
+def _init_shared_cells_worker(cells, *args):
+    _init_cells_worker(_worker, _from_shared(*cells), *args)
+
+
+def _integrate_shared_cells_chunk(start):
+    return _integrate_cells_chunk(_worker, start)
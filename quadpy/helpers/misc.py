@@ -3,7 +3,6 @@ from collections import namedtuple
 
 import numpy
 import scipy.special
-import sympy
 
 article = namedtuple(
     "Article",
@@ -86,6 +85,21 @@ def n_outer(a):
     return out
 
 
+def get_kernel(symbolic):
+    """The functions `frac(x, y)`, `sqrt` and the constant `pi` for scheme
+    constructors, either exact (sympy) or in float64.
+    """
+    if symbolic:
+        import sympy
+
+        return sympy.Rational, sympy.sqrt, sympy.pi
+    return _frac, math.sqrt, math.pi
+
+
+def _frac(x, y):
+    return x / y
+
+
 def compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k, symbolic=False):
     """Compute some helper quantities used in
 
@@ -98,9 +112,12 @@ def compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k, symbolic=False):
     """
     t = 1 if pm_type == "I" else -1
 
-    binomial = sympy.binomial if symbolic else scipy.special.binom
-    fact = sympy.factorial if symbolic else math.factorial
-    sqrt = sympy.sqrt if symbolic else numpy.sqrt
+    if symbolic:
+        import sympy
+
+        binomial, fact, sqrt = sympy.binomial, sympy.factorial, sympy.sqrt
+    else:
+        binomial, fact, sqrt = scipy.special.binom, math.factorial, numpy.sqrt
 
     L = binomial(n, i) * 2 ** i
     M = fact(n) // (fact(j) * fact(k) * fact(n - j - k)) * 2 ** (j + k)
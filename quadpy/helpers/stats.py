@@ -0,0 +1,204 @@
+import contextlib
+import functools
+import inspect
+import threading
+import time
+from collections import namedtuple
+
+import numpy
+
+IntegrationRecord = namedtuple(
+    "IntegrationRecord", ["name", "num_f_calls", "num_points", "levels", "times"]
+)
+
+# The phases of the wall time of an integration: "map" is everything before an
+# evaluation of f (mapping the points into the domain; for adaptive integrators also
+# the error estimation and refinement of the previous step), "evaluate" is the time
+# spent in f, "reduce" everything after the last evaluation.
+PHASES = ["map", "evaluate", "reduce", "total"]
+
+_state = threading.local()
+
+
+class IntegrationStats:
+    """Statistics of all integrations run in the current thread inside a
+    `collect_stats()` block, one `IntegrationRecord` per call in `records`. Calls made
+    from within another integration (e.g., scheme integrations in `integrate_mesh()`)
+    are part of the outer record.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    @property
+    def num_integrations(self):
+        return len(self.records)
+
+    @property
+    def num_f_calls(self):
+        return sum(r.num_f_calls for r in self.records)
+
+    @property
+    def num_points(self):
+        return sum(r.num_points for r in self.records)
+
+    @property
+    def levels(self):
+        return max((r.levels for r in self.records), default=0)
+
+    @property
+    def times(self):
+        return {p: sum(r.times[p] for r in self.records) for p in PHASES}
+
+    def as_dict(self):
+        """All statistics as a (JSON-serializable) dictionary, in total and per
+        integration routine.
+        """
+        by_name = {}
+        for r in self.records:
+            by_name.setdefault(r.name, IntegrationStats()).records.append(r)
+        out = self._summary()
+        out["by_name"] = {name: s._summary() for name, s in by_name.items()}
+        return out
+
+    def _summary(self):
+        return {
+            "num_integrations": self.num_integrations,
+            "num_f_calls": self.num_f_calls,
+            "num_points": self.num_points,
+            "levels": self.levels,
+            "times": self.times,
+        }
+
+
+@contextlib.contextmanager
+def collect_stats():
+    """Context manager which records the integrations run in the current thread:
+
+        with quadpy.helpers.collect_stats() as stats:
+            scheme.integrate(f, triangle)
+        stats.num_points, stats.times["evaluate"]
+
+    Blocks can be nested; the records then go to all active `IntegrationStats`.
+    Evaluations in worker threads are counted, those in worker processes
+    (`integrate_mesh(..., pool="process")`) are not.
+    """
+    stats = IntegrationStats()
+    collectors = _get_collectors()
+    collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        collectors.remove(stats)
+
+
+def _get_collectors():
+    if not hasattr(_state, "collectors"):
+        _state.collectors = []
+    return _state.collectors
+
+
+class _Record:
+    def __init__(self, coordinate_axis):
+        self.coordinate_axis = coordinate_axis
+        self.num_f_calls = 0
+        self.num_points = 0
+        self.levels = 0
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.lock = threading.Lock()
+        self.start = self.last = time.perf_counter()
+
+    def count(self, x, t0, t1):
+        shape = numpy.shape(x)
+        n = int(numpy.prod(shape))
+        if self.coordinate_axis and len(shape) > 0:
+            n //= shape[0]
+        with self.lock:
+            self.num_f_calls += 1
+            self.num_points += n
+            self.times["map"] += max(t0 - self.last, 0.0)
+            self.times["evaluate"] += t1 - t0
+            self.last = max(self.last, t1)
+
+    def finish(self, name):
+        end = time.perf_counter()
+        times = dict(self.times)
+        times["reduce"] = end - self.last if self.num_f_calls > 0 else 0.0
+        times["total"] = end - self.start
+        if self.num_f_calls == 0:
+            times["map"] = times["total"]
+        return IntegrationRecord(
+            name, self.num_f_calls, self.num_points, self.levels, times
+        )
+
+
+class _CountedFunction:
+    def __init__(self, fun, record):
+        self.fun = fun
+        self.record = record
+
+    def __call__(self, x, *args, **kwargs):
+        t0 = time.perf_counter()
+        out = self.fun(x, *args, **kwargs)
+        self.record.count(x, t0, time.perf_counter())
+        return out
+
+    def __reduce__(self):
+        # Functions sent to worker processes aren't counted.
+        return (_identity, (self.fun,))
+
+
+def _identity(fun):
+    return fun
+
+
+def _wrap(value, record):
+    if isinstance(value, dict):
+        # f_left/f_right of tanh_sinh_lr: only the function itself (not its
+        # derivatives) is counted
+        return {k: _wrap(v, record) if k == 0 else v for k, v in value.items()}
+    return _CountedFunction(value, record)
+
+
+def record_levels(levels):
+    """Reports the number of refinement levels of the running integration."""
+    record = getattr(_state, "record", None)
+    if record is not None:
+        record.levels = max(record.levels, int(levels))
+
+
+def instrument(coordinate_axis=True, functions=("f",)):
+    """Decorator for integration routines. Inside `collect_stats()`, the arguments
+    `functions` are wrapped to count and time their evaluations. With
+    `coordinate_axis`, the first axis of the points is the coordinate, i.e., f(x) is
+    evaluated at `x.size // x.shape[0]` points; otherwise at `x.size`.
+    """
+
+    def decorator(fun):
+        signature = inspect.signature(fun)
+        name = f"{fun.__module__}.{fun.__qualname__}"
+
+        @functools.wraps(fun)
+        def wrapped(*args, **kwargs):
+            collectors = getattr(_state, "collectors", None)
+            if not collectors or getattr(_state, "record", None) is not None:
+                return fun(*args, **kwargs)
+
+            record = _Record(coordinate_axis)
+            bound = signature.bind(*args, **kwargs)
+            for key in functions:
+                if bound.arguments.get(key) is not None:
+                    bound.arguments[key] = _wrap(bound.arguments[key], record)
+
+            _state.record = record
+            try:
+                return fun(*bound.args, **bound.kwargs)
+            finally:
+                _state.record = None
+                result = record.finish(name)
+                for stats in list(collectors):
+                    stats.records.append(result)
+
+        return wrapped
+
+    return decorator
@@ -0,0 +1,82 @@
+import functools
+import importlib
+import json
+import os
+
+import numpy
+
+# The binary scheme store: All table-based schemes, fully expanded (symmetry orbits
+# etc.), as one flat float64 array plus an index. Build it with
+# `tools/build_scheme_store.py` (`make store`).
+_quadpy_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_blob_file = os.path.join(_quadpy_dir, "_scheme_store.npy")
+_index_file = os.path.join(_quadpy_dir, "_scheme_store.json")
+
+
+def read_table(filename, expand):
+    """Returns the scheme data `degree, *arrays` of the JSON table `filename`. If the
+    binary store has been built, this is a slice of a memory-mapped array; otherwise
+    the JSON file is parsed and passed through `expand(data)`, which must return
+    `degree, *arrays`.
+
+    The arrays from the store are read-only and shared between all processes.
+    """
+    store = _load_store()
+    key = os.path.relpath(os.path.realpath(filename), _quadpy_dir)
+    if store is not None and key in store[1]:
+        blob, index = store
+        degree, arrays = index[key]
+        return (degree,) + tuple(
+            blob[offset : offset + int(numpy.prod(shape))].reshape(shape)
+            for offset, shape in arrays
+        )
+
+    with open(filename, "r") as f:
+        data = json.load(f)
+    return expand(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_store():
+    if not os.path.exists(_blob_file) or not os.path.exists(_index_file):
+        return None
+    with open(_index_file, "r") as f:
+        index = json.load(f)
+    # numpy.asarray() makes plain ndarray views of the memmap
+    blob = numpy.asarray(numpy.load(_blob_file, mmap_mode="r"))
+    return blob, index
+
+
+def build_store():
+    """Expands all JSON tables in quadpy and writes them to the binary store. Every
+    directory with JSON tables must be a module with an `_expand(data)` function.
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for root, _, files in sorted(os.walk(_quadpy_dir)):
+        tables = sorted(f for f in files if f.endswith(".json"))
+        if root == _quadpy_dir or not tables:
+            continue
+        module_name = ".".join(
+            [os.path.basename(_quadpy_dir)]
+            + os.path.relpath(root, _quadpy_dir).split(os.sep)
+        )
+        expand = importlib.import_module(module_name)._expand
+        for filename in tables:
+            with open(os.path.join(root, filename), "r") as f:
+                degree, *arrays = expand(json.load(f))
+            entry = []
+            for array in arrays:
+                array = numpy.asarray(array, dtype=float)
+                entry.append([offset, list(array.shape)])
+                chunks.append(array.reshape(-1))
+                offset += array.size
+            key = os.path.relpath(os.path.join(root, filename), _quadpy_dir)
+            index[key] = [degree, entry]
+
+    numpy.save(_blob_file, numpy.concatenate(chunks))
+    with open(_index_file, "w") as f:
+        json.dump(index, f)
+    _load_store.cache_clear()
+    return len(index)
@@ -1,50 +1,9 @@
-from ..ncube import ncube_points as cube_points
-from ..ncube import transform
-from ._hammer_stroud import (
-    hammer_stroud_1_3,
-    hammer_stroud_2_3,
-    hammer_stroud_4_3,
-    hammer_stroud_5_3a,
-    hammer_stroud_5_3b,
-    hammer_stroud_6_3,
-)
-from ._hammer_wymore import hammer_wymore
-from ._mustard_lyness_blatt import (
-    mustard_lyness_blatt_1,
-    mustard_lyness_blatt_2,
-    mustard_lyness_blatt_3,
-    mustard_lyness_blatt_4,
-    mustard_lyness_blatt_5,
-    mustard_lyness_blatt_6,
-    mustard_lyness_blatt_7,
-)
-from ._product import product
-from ._sadowsky import sadowsky
-from ._stroud import (
-    stroud_c3_3_1,
-    stroud_c3_3_2,
-    stroud_c3_3_3,
-    stroud_c3_3_4,
-    stroud_c3_3_5,
-    stroud_c3_3_6,
-    stroud_c3_3_7,
-    stroud_c3_5_1,
-    stroud_c3_5_2,
-    stroud_c3_5_3,
-    stroud_c3_5_4,
-    stroud_c3_5_5,
-    stroud_c3_5_6,
-    stroud_c3_5_7,
-    stroud_c3_5_8,
-    stroud_c3_7_1a,
-    stroud_c3_7_1b,
-    stroud_c3_7_2,
-    stroud_c3_7_3,
-)
-from ._stroud_1967 import stroud_1967
-from ._tyler import tyler_1, tyler_2
+from .._lazy import lazy_import
 
 __all__ = [
+    "get_good_scheme",
+    "integrate_mesh",
+    "integrate_adaptive",
     "hammer_stroud_1_3",
     "hammer_stroud_2_3",
     "hammer_stroud_4_3",
@@ -88,3 +47,54 @@ __all__ = [
     "transform",
     "cube_points",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._helpers": ["get_good_scheme", "integrate_mesh"],
+        "..ncube": [("ncube_points", "cube_points"), "transform", "integrate_adaptive"],
+        "._hammer_stroud": [
+            "hammer_stroud_1_3",
+            "hammer_stroud_2_3",
+            "hammer_stroud_4_3",
+            "hammer_stroud_5_3a",
+            "hammer_stroud_5_3b",
+            "hammer_stroud_6_3",
+        ],
+        "._hammer_wymore": ["hammer_wymore"],
+        "._mustard_lyness_blatt": [
+            "mustard_lyness_blatt_1",
+            "mustard_lyness_blatt_2",
+            "mustard_lyness_blatt_3",
+            "mustard_lyness_blatt_4",
+            "mustard_lyness_blatt_5",
+            "mustard_lyness_blatt_6",
+            "mustard_lyness_blatt_7",
+        ],
+        "._product": ["product"],
+        "._sadowsky": ["sadowsky"],
+        "._stroud": [
+            "stroud_c3_3_1",
+            "stroud_c3_3_2",
+            "stroud_c3_3_3",
+            "stroud_c3_3_4",
+            "stroud_c3_3_5",
+            "stroud_c3_3_6",
+            "stroud_c3_3_7",
+            "stroud_c3_5_1",
+            "stroud_c3_5_2",
+            "stroud_c3_5_3",
+            "stroud_c3_5_4",
+            "stroud_c3_5_5",
+            "stroud_c3_5_6",
+            "stroud_c3_5_7",
+            "stroud_c3_5_8",
+            "stroud_c3_7_1a",
+            "stroud_c3_7_1b",
+            "stroud_c3_7_2",
+            "stroud_c3_7_3",
+        ],
+        "._stroud_1967": ["stroud_1967"],
+        "._tyler": ["tyler_1", "tyler_2"],
+    },
+)
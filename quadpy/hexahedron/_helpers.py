@@ -146,3 +146,38 @@ def pm_rrr(a):
             [-a, -a, -a],
         ]
     )
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("hexahedron", degree)
+
+
+def integrate_mesh(
+    f,
+    points,
+    cells,
+    scheme,
+    chunk_size=2 ** 14,
+    reduce="cell",
+    workers=1,
+    pool="thread",
+):
+    """Integrates `f` over a mesh of hexahedra with the vertex indices `cells`, in chunks
+    of `chunk_size` cells, see `quadpy.helpers.integrate_mesh()`. The vertices of each
+    cell are in VTK order, i.e., the bottom face counterclockwise, then the top face.
+    """
+    return helpers.integrate_mesh(
+        f,
+        points,
+        cells,
+        scheme,
+        (2, 2, 2),
+        order=[0, 4, 3, 7, 1, 5, 2, 6],
+        chunk_size=chunk_size,
+        reduce=reduce,
+        workers=workers,
+        pool=pool,
+    )
@@ -1,16 +1,4 @@
-from ._chebyshev_gauss import chebyshev_gauss_1, chebyshev_gauss_2
-from ._clenshaw_curtis import clenshaw_curtis
-from ._fejer import fejer_1, fejer_2
-from ._gauss_jacobi import gauss_jacobi
-from ._gauss_kronrod import gauss_kronrod
-from ._gauss_legendre import gauss_legendre
-from ._gauss_lobatto import gauss_lobatto
-from ._gauss_patterson import gauss_patterson
-from ._gauss_radau import gauss_radau
-from ._midpoint import midpoint
-from ._newton_cotes import newton_cotes_closed, newton_cotes_open
-from ._tools import integrate_adaptive
-from ._trapezoidal import trapezoidal
+from .._lazy import lazy_import
 
 __all__ = [
     "chebyshev_gauss_1",
@@ -30,3 +18,22 @@ __all__ = [
     "trapezoidal",
     "integrate_adaptive",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._chebyshev_gauss": ["chebyshev_gauss_1", "chebyshev_gauss_2"],
+        "._clenshaw_curtis": ["clenshaw_curtis"],
+        "._fejer": ["fejer_1", "fejer_2"],
+        "._gauss_jacobi": ["gauss_jacobi"],
+        "._gauss_kronrod": ["gauss_kronrod"],
+        "._gauss_legendre": ["gauss_legendre"],
+        "._gauss_lobatto": ["gauss_lobatto"],
+        "._gauss_patterson": ["gauss_patterson"],
+        "._gauss_radau": ["gauss_radau"],
+        "._midpoint": ["midpoint"],
+        "._newton_cotes": ["newton_cotes_closed", "newton_cotes_open"],
+        "._tools": ["integrate_adaptive"],
+        "._trapezoidal": ["trapezoidal"],
+    },
+)
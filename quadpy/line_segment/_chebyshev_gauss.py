@@ -1,10 +1,10 @@
 import numpy
-import sympy
-from mpmath import mp
 
+from ..helpers import cached_scheme
 from ._helpers import LineSegmentScheme
 
 
+@cached_scheme
 def chebyshev_gauss_1(n, mode="numpy"):
     """Chebyshev-Gauss quadrature for \\int_{-1}^1 f(x) / sqrt(1+x^2) dx.
     """
@@ -14,6 +14,8 @@ def chebyshev_gauss_1(n, mode="numpy"):
         points = numpy.cos((2 * numpy.arange(1, n + 1) - 1) / (2 * n) * numpy.pi)
         weights = numpy.full(n, numpy.pi / n)
     elif mode == "sympy":
+        import sympy
+
         points = numpy.array(
             [
                 sympy.cos(sympy.Rational(2 * k - 1, 2 * n) * sympy.pi)
@@ -23,6 +25,8 @@ def chebyshev_gauss_1(n, mode="numpy"):
         weights = numpy.full(n, sympy.pi / n)
     else:
         assert mode == "mpmath"
+        from mpmath import mp
+
         points = numpy.array(
             [mp.cos(mp.mpf(2 * k - 1) / (2 * n) * mp.pi) for k in range(1, n + 1)]
         )
@@ -30,6 +34,7 @@ def chebyshev_gauss_1(n, mode="numpy"):
     return LineSegmentScheme("Chebyshev-Gauss 1", degree, weights, points)
 
 
+@cached_scheme
 def chebyshev_gauss_2(n, mode="numpy", decimal_places=None):
     """Chebyshev-Gauss quadrature for \\int_{-1}^1 f(x) * sqrt(1+x^2) dx.
     """
@@ -44,6 +49,8 @@ def chebyshev_gauss_2(n, mode="numpy", decimal_places=None):
             * (numpy.sin(numpy.pi * numpy.arange(1, n + 1) / (n + 1))) ** 2
         )
     elif mode == "sympy":
+        import sympy
+
         points = numpy.array(
             [sympy.cos(sympy.Rational(k, n + 1) * sympy.pi) for k in range(1, n + 1)]
         )
@@ -55,6 +62,8 @@ def chebyshev_gauss_2(n, mode="numpy", decimal_places=None):
         )
     else:
         assert mode == "mpmath"
+        from mpmath import mp
+
         points = numpy.array(
             [mp.cos(mp.mpf(k) / (n + 1) * mp.pi) for k in range(1, n + 1)]
         )
@@ -1,6 +1,6 @@
 import numpy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._helpers import LineSegmentScheme
 
 citation = article(
@@ -16,6 +16,7 @@ citation = article(
 )
 
 
+@cached_scheme
 def clenshaw_curtis(n):
     degree = n
 
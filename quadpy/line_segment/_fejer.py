@@ -1,6 +1,6 @@
 import numpy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._helpers import LineSegmentScheme
 
 citation = article(
@@ -16,6 +16,7 @@ citation = article(
 )
 
 
+@cached_scheme
 def fejer_1(n):
     degree = n
 
@@ -42,6 +43,7 @@ def fejer_1(n):
     return LineSegmentScheme("Fejér 1", degree, weights, points, citation)
 
 
+@cached_scheme
 def fejer_2(n):
     degree = n
 
@@ -1,9 +1,11 @@
 import orthopy
 
+from ..helpers import cached_scheme
 from ..tools import scheme_from_rc
 from ._helpers import LineSegmentScheme
 
 
+@cached_scheme
 def gauss_jacobi(n, alpha, beta, mode="numpy"):
     degree = 2 * n - 1
 
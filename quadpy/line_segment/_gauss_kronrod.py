@@ -4,7 +4,7 @@ import numpy
 
 import orthopy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ..tools import scheme_from_rc
 from ._gauss_legendre import gauss_legendre
 from ._helpers import LineSegmentScheme, _find_shapes
@@ -20,6 +20,7 @@ citation = article(
 )
 
 
+@cached_scheme
 def gauss_kronrod(n, a=0, b=0):
     """
     Gauss-Kronrod quadrature; see
@@ -102,16 +103,38 @@ def _r_kronrod(n, a0, b0):
     return a, b
 
 
+class _GaussKronrodPair:
+    """Gauss-Kronrod points and weights together with the weights of the embedded
+    Gauss-Legendre scheme. The Gauss weights are padded with zeros such that both
+    estimates can be computed from the same function values. Also holds the factors
+    for mapping the points onto intervals.
+    """
+
+    def __init__(self, k):
+        gk = gauss_kronrod(k)
+        gl = gauss_legendre(k)
+        self.degree = k
+        self.points = gk.points
+        self.weights = gk.weights
+        # The Gauss points are every other Kronrod point.
+        self.gauss_weights = numpy.zeros(gk.weights.shape)
+        self.gauss_weights[1::2] = gl.weights
+        self.x0 = 0.5 * (1.0 - gk.points)
+        self.x1 = 0.5 * (1.0 + gk.points)
+
+
+@cached_scheme
+def _gauss_kronrod_pair(k):
+    return _GaussKronrodPair(k)
+
+
 def _gauss_kronrod_integrate(
-    k, f, intervals, dot=numpy.dot, domain_shape=None, range_shape=None,
+    pair, f, intervals, dot=numpy.dot, domain_shape=None, range_shape=None,
 ):
     # Compute the integral estimations according to Gauss and Gauss-Kronrod, sharing the
     # function evaluations
-    gk = gauss_kronrod(k)
-    gl = gauss_legendre(k)
-    # scale points
-    x0 = 0.5 * (1.0 - gk.points)
-    x1 = 0.5 * (1.0 + gk.points)
+    x0 = pair.x0
+    x1 = pair.x1
 
     sp = numpy.multiply.outer(intervals[0], x0) + numpy.multiply.outer(intervals[1], x1)
     if domain_shape is not None and range_shape is not None:
@@ -124,19 +147,17 @@ def _gauss_kronrod_integrate(
         fx_gk = numpy.asarray(f(sp))
         # try and guess shapes of domain, range, intervals
         domain_shape, range_shape, interval_set_shape = _find_shapes(
-            fx_gk, intervals, gk.points, domain_shape, range_shape
+            fx_gk, intervals, pair.points, domain_shape, range_shape
         )
 
-    fx_gl = fx_gk[..., 1::2]
-
     diff = intervals[1] - intervals[0]
     alpha = numpy.sqrt(numpy.sum(diff ** 2, axis=tuple(range(len(domain_shape)))))
 
     assert alpha.shape == interval_set_shape
 
     # integrate
-    val_gauss_kronrod = 0.5 * alpha * dot(fx_gk, gk.weights)
-    val_gauss_legendr = 0.5 * alpha * dot(fx_gl, gl.weights)
+    val_gauss_kronrod = 0.5 * alpha * dot(fx_gk, pair.weights)
+    val_gauss_legendr = 0.5 * alpha * dot(fx_gk, pair.gauss_weights)
 
     assert val_gauss_kronrod.shape == range_shape + interval_set_shape
     assert val_gauss_legendr.shape == range_shape + interval_set_shape
@@ -153,7 +174,7 @@ def _gauss_kronrod_integrate(
     # the classicial QUADPACK still compares favorably with other approaches.
     average = val_gauss_kronrod / alpha
     fx_avg_abs = numpy.abs(fx_gk - average[..., None])
-    I_tilde = 0.5 * alpha * dot(fx_avg_abs, gk.weights)
+    I_tilde = 0.5 * alpha * dot(fx_avg_abs, pair.weights)
 
     # The exponent 1.5 is chosen such that (200*x)**1.5 is approximately x at 1.0e-6,
     # the machine precision on IEEE 754 32-bit floating point arithmentic. This could be
@@ -1,17 +1,21 @@
 import numpy
 
-import orthopy
-
-from ..tools import scheme_from_rc
+from ..helpers import cached_scheme
 from ._helpers import LineSegmentScheme
 
 
+@cached_scheme
 def gauss_legendre(n, mode="numpy"):
     degree = 2 * n - 1
 
     if mode == "numpy":
         points, weights = numpy.polynomial.legendre.leggauss(n)
     else:
+        # symbolic/mpmath mode only
+        import orthopy
+
+        from ..tools import scheme_from_rc
+
         _, _, alpha, beta = orthopy.line_segment.recurrence_coefficients.legendre(
             n, "monic", symbolic=True
         )
@@ -2,10 +2,12 @@ import numpy
 
 import orthopy
 
+from ..helpers import cached_scheme
 from ..tools import scheme_from_rc
 from ._helpers import LineSegmentScheme
 
 
+@cached_scheme
 def gauss_lobatto(n, a=0.0, b=0.0):
     assert n >= 2
     degree = 2 * n - 3
@@ -1,6 +1,6 @@
 import numpy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._gauss_legendre import gauss_legendre
 from ._helpers import LineSegmentScheme
 
@@ -15,6 +15,7 @@ citation = article(
 )
 
 
+@cached_scheme
 def gauss_patterson(index):
     # Gauss-Patterson quadrature.
     # <https://people.sc.fsu.edu/~jburkardt/datasets/quadrature_rules_patterson/quadrature_rules_patterson.html>
@@ -1,6 +1,7 @@
 import numpy
 
 from ..helpers import plot_disks_1d
+from ..helpers.stats import instrument
 
 
 def _find_shapes(fx, intervals, x, domain_shape=None, range_shape=None):
@@ -54,6 +55,7 @@ class LineSegmentScheme:
         self.points = points
         self.citation = citation
 
+    @instrument(coordinate_axis=False)
     def integrate(
         self, f, intervals, domain_shape=None, range_shape=None, dot=numpy.dot
     ):
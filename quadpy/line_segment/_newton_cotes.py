@@ -3,9 +3,11 @@ import math
 import numpy
 import sympy
 
+from ..helpers import cached_scheme
 from ._helpers import LineSegmentScheme
 
 
+@cached_scheme
 def newton_cotes_closed(index, **kwargs):
     """
     Closed Newton-Cotes formulae.
@@ -36,6 +38,7 @@ def newton_cotes_closed(index, **kwargs):
     return LineSegmentScheme("Newton-Cotes (closed)", degree, weights, points)
 
 
+@cached_scheme
 def newton_cotes_open(index, **kwargs):
     """
     Open Newton-Cotes formulae.
@@ -1,16 +1,82 @@
+import heapq
+
 import numpy
 
-from ._gauss_kronrod import _gauss_kronrod_integrate
+from ..helpers.stats import instrument, record_levels
+from ._gauss_kronrod import _gauss_kronrod_integrate, _gauss_kronrod_pair
 
 
 def _numpy_all_except_last(a):
     return numpy.all(a, axis=tuple(range(len(a.shape) - 1)))
 
 
+def _numpy_max_except_last(a):
+    return numpy.max(a, axis=tuple(range(len(a.shape) - 1)))
+
+
+def _numpy_norm_except_last(a, norm):
+    a = numpy.abs(a)
+    if norm == "max":
+        return _numpy_max_except_last(a)
+    return numpy.sqrt(numpy.sum(a ** 2, axis=tuple(range(len(a.shape) - 1))))
+
+
+def _is_within_tolerance(err, tol, norm, compare=numpy.less):
+    """Checks the error estimates of all range components against the tolerances for
+    every interval (last dimension). With `norm="max"`, every component must meet its
+    tolerance, with `norm="2"`, the 2-norm of the errors must not exceed the 2-norm of
+    the tolerances.
+    """
+    if norm == "max":
+        return _numpy_all_except_last(compare(err, tol))
+    tol = numpy.broadcast_to(tol, err.shape)
+    return compare(_numpy_norm_except_last(err, "2"), _numpy_norm_except_last(tol, "2"))
+
+
+def _scatter_add(out, idx, values):
+    """Computes `out[..., idx] += values` where repeated indices are accumulated, cf.
+    numpy.add.at(). All leading dimensions are handled by a single numpy.bincount()
+    call.
+    """
+    n = out.shape[-1]
+    k = int(numpy.prod(out.shape[:-1]))
+    values = values.reshape(k, -1)
+    flat_idx = (idx + n * numpy.arange(k)[:, None]).reshape(-1)
+    if numpy.iscomplexobj(values):
+        s = numpy.bincount(flat_idx, weights=values.real.reshape(-1), minlength=k * n)
+        s = s + 1j * numpy.bincount(
+            flat_idx, weights=values.imag.reshape(-1), minlength=k * n
+        )
+    else:
+        s = numpy.bincount(flat_idx, weights=values.reshape(-1), minlength=k * n)
+    out += s.reshape(out.shape)
+
+
+def _wynn_epsilon(seq):
+    """Wynn's epsilon algorithm for accelerating the convergence of the sequence `seq`
+    (along the first axis, elementwise for all others). Returns the last entry of the
+    highest even column of the epsilon table.
+    """
+    seq = numpy.asarray(seq)
+    out = seq[-1]
+    # columns eps_{k-1} and eps_k of the table
+    e0 = numpy.zeros((seq.shape[0] + 1,) + seq.shape[1:], dtype=seq.dtype)
+    e1 = seq
+    with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for k in range(1, seq.shape[0]):
+            e0, e1 = e1, e0[1:-1] + 1 / (e1[1:] - e1[:-1])
+            # Differences can become 0 if the sequence has converged; leave the
+            # estimate as it is then.
+            if k % 2 == 0:
+                out = numpy.where(numpy.isfinite(e1[-1]), e1[-1], out)
+    return out
+
+
 class IntegrationError(Exception):
     pass
 
 
+@instrument(coordinate_axis=False)
 def integrate_adaptive(
     f,
     intervals,
@@ -22,29 +88,104 @@ def integrate_adaptive(
     dot=numpy.dot,
     domain_shape=None,
     range_shape=None,
+    strategy="local",
+    batch_size=None,
+    extrapolate=False,
+    norm="max",
+    full_output=False,
 ):
+    """Adaptive Gauss-Kronrod integration over the given intervals.
+
+    With `strategy="local"`, every interval whose error estimate doesn't meet the
+    tolerances (scaled by its relative length) is bisected in each step. With
+    `strategy="global"`, the subintervals are kept in a heap keyed by their error
+    estimate and only the worst `batch_size` ones are bisected in each step (QUADPACK
+    QAGS style) until the summed error estimate of every integral is below
+    `max(eps_abs, eps_rel * abs(value))`. `batch_size` defaults to the number of
+    integrals that haven't converged yet.
+
+    `extrapolate=True` (only with the global strategy) additionally applies Wynn's
+    epsilon algorithm to the sequence of integral values obtained whenever a new
+    refinement level is reached (QUADPACK QAGS). This speeds up convergence a lot for
+    integrable endpoint singularities like 1/sqrt(x) or log(x).
+
+    `eps_abs` and `eps_rel` can also be arrays of the shape of the range of `f`,
+    specifying tolerances per component. `norm` determines how the error estimates of
+    the components are combined: With `"max"`, every single component has to meet its
+    tolerance, with `"2"`, only the 2-norm of the errors has to meet the 2-norm of the
+    tolerances.
+
+    If `full_output` is True, a dictionary with the number of function evaluations
+    (integration points) and subintervals is returned as third value. Both are given
+    per integral, i.e., they have the shape of the set of intervals.
+    `max_num_subintervals` applies to every integral individually, too.
+    """
     intervals = numpy.asarray(intervals)
     assert intervals.shape[0] == 2
 
     assert (
         eps_abs is not None or eps_rel is not None
     ), "One of eps_abs, eps_rel must be specified."
+    assert strategy in ["local", "global"], f"Illegal strategy {strategy}."
+    assert norm in ["max", "2"], f"Illegal norm {norm}."
+    assert (
+        not extrapolate or strategy == "global"
+    ), "Extrapolation requires the global strategy."
+
+    # Use Gauss-Kronrod scheme for error estimation and adaptivity. The points and
+    # weights are computed only once and reused in all refinement steps.
+    pair = _gauss_kronrod_pair(kronrod_degree)
+
+    # Per-component tolerances have to broadcast against the trailing interval dimension
+    if numpy.ndim(eps_abs) > 0:
+        eps_abs = numpy.asarray(eps_abs)[..., None]
+    if numpy.ndim(eps_rel) > 0:
+        eps_rel = numpy.asarray(eps_rel)[..., None]
 
-    # Use Gauss-Kronrod scheme for error estimation and adaptivity.
     # The method also returns guesses for the domain_shape and range_shape (if any of
     # them is None).
-    _, val, a, error_estimate, domain_shape, range_shape = _gauss_kronrod_integrate(
-        kronrod_degree,
-        f,
-        intervals,
-        dot=dot,
-        domain_shape=domain_shape,
-        range_shape=range_shape,
+    (
+        val_gk,
+        val,
+        a,
+        error_estimate,
+        domain_shape,
+        range_shape,
+    ) = _gauss_kronrod_integrate(
+        pair, f, intervals, dot=dot, domain_shape=domain_shape, range_shape=range_shape,
     )
 
     # Flatten the list of intervals so we can do good-bad bookkeeping via a list.
     intervals = intervals.reshape((2,) + domain_shape + (-1,))
-    num_subintervals = 1
+    num_integrals = intervals.shape[-1]
+    # the shape of the set of intervals
+    integrals_shape = val.shape[len(range_shape) :]
+
+    if strategy == "global":
+        total_val, total_error_estimate, info = _integrate_global(
+            f,
+            intervals,
+            val_gk,
+            error_estimate,
+            pair,
+            eps_abs,
+            eps_rel,
+            minimum_interval_length,
+            max_num_subintervals,
+            dot,
+            domain_shape,
+            range_shape,
+            batch_size,
+            extrapolate,
+            norm,
+        )
+        if full_output:
+            info = {key: value.reshape(integrals_shape) for key, value in info.items()}
+            return total_val, total_error_estimate, info
+        return total_val, total_error_estimate
+
+    num_subintervals = numpy.ones(num_integrals, dtype=int)
+    num_evaluations = numpy.full(num_integrals, len(pair.points))
     a_orig = a.reshape(-1)
     val_shape = val.shape
     val = val.reshape(range_shape + (-1,))
@@ -58,11 +199,12 @@ def integrate_adaptive(
     is_good = numpy.ones(error_estimate.shape[-1], dtype=bool)
     if eps_abs is not None:
         is_good = numpy.logical_and(
-            is_good, _numpy_all_except_last(error_estimate < eps_abs)
+            is_good, _is_within_tolerance(error_estimate, eps_abs, norm)
         )
     if eps_rel is not None:
         is_good = numpy.logical_and(
-            is_good, _numpy_all_except_last(error_estimate < eps_rel * numpy.abs(val)),
+            is_good,
+            _is_within_tolerance(error_estimate, eps_rel * numpy.abs(val), norm),
         )
     idx = numpy.arange(intervals.shape[-1])
 
@@ -80,10 +222,13 @@ def integrate_adaptive(
                 numpy.concatenate([midpoints, intervals[1]], axis=-1),
             ]
         )
+        num_subintervals += numpy.bincount(idx[~is_good], minlength=num_integrals)
         idx = numpy.concatenate([idx[~is_good], idx[~is_good]])
-        num_subintervals += numpy.sum(~is_good)
+        num_evaluations += numpy.bincount(idx, minlength=num_integrals) * len(
+            pair.points
+        )
 
-        if num_subintervals > max_num_subintervals:
+        if numpy.any(num_subintervals > max_num_subintervals):
             raise IntegrationError(
                 f"Tolerances (abs: {eps_abs}, rel: {eps_rel}) could not be reached "
                 f"with the given max_num_subintervals (= {max_num_subintervals})."
@@ -91,7 +236,7 @@ def integrate_adaptive(
 
         # compute values and error estimates for the new intervals
         _, val, a, error_estimate, _, _ = _gauss_kronrod_integrate(
-            kronrod_degree,
+            pair,
             f,
             intervals,
             dot=dot,
@@ -100,7 +245,7 @@ def integrate_adaptive(
         )
 
         # relative interval lenghts
-        b = a / a_orig
+        b = a / a_orig[idx]
 
         # mark good intervals, gather values and error estimates
         if numpy.any(a < minimum_interval_length):
@@ -109,29 +254,236 @@ def integrate_adaptive(
                 f"with the given minimum_interval_length (= {minimum_interval_length})."
             )
 
-        # TODO speed up
         # tentative total value (as if all intervals were good)
         ttv = total_val.copy()
-        for j, i in enumerate(idx):
-            ttv[..., i] += val[..., j]
+        _scatter_add(ttv, idx, val)
 
         is_good = numpy.ones(error_estimate.shape[-1], dtype=bool)
         if eps_abs is not None:
             is_good = numpy.logical_and(
-                is_good, _numpy_all_except_last(error_estimate < eps_abs * b),
+                is_good, _is_within_tolerance(error_estimate, eps_abs * b, norm),
             )
         if eps_rel is not None:
             is_good = numpy.logical_and(
                 is_good,
-                _numpy_all_except_last(error_estimate < eps_rel * b * numpy.abs(ttv)),
+                _is_within_tolerance(
+                    error_estimate, eps_rel * b * numpy.abs(ttv[..., idx]), norm
+                ),
             )
 
-        # TODO speed up
-        for j, i in enumerate(idx[is_good]):
-            total_val[..., i] += val[..., is_good][..., j]
-            total_error_estimate[..., i] += error_estimate[..., is_good][..., j]
+        _scatter_add(total_val, idx[is_good], val[..., is_good])
+        _scatter_add(total_error_estimate, idx[is_good], error_estimate[..., is_good])
         k += 1
 
+    record_levels(k)
     total_val = total_val.reshape(val_shape)
     total_error_estimate = total_error_estimate.reshape(val_shape)
+    if full_output:
+        info = {
+            "num_evaluations": num_evaluations.reshape(integrals_shape),
+            "num_subintervals": num_subintervals.reshape(integrals_shape),
+        }
+        return total_val, total_error_estimate, info
     return total_val, total_error_estimate
+
+
+def _integrate_global(
+    f,
+    intervals,
+    val,
+    error_estimate,
+    pair,
+    eps_abs,
+    eps_rel,
+    minimum_interval_length,
+    max_num_subintervals,
+    dot,
+    domain_shape,
+    range_shape,
+    batch_size,
+    extrapolate,
+    norm,
+):
+    # Global adaptive strategy in the spirit of QUADPACK's QAG(S): Keep all subintervals
+    # in a heap sorted by their error estimate and bisect only the worst ones. Unlike
+    # the local strategy, the (more accurate) Kronrod value is used here.
+    val_shape = val.shape
+    num_integrals = intervals.shape[-1]
+
+    # All subintervals are stored in flat arrays; `parent` is the index of the integral
+    # a subinterval belongs to, `alive` marks those that haven't been split yet.
+    sub_intervals = intervals
+    sub_val = val.reshape(range_shape + (-1,))
+    sub_err = error_estimate.reshape(range_shape + (-1,))
+    parent = numpy.arange(num_integrals)
+    alive = numpy.ones(num_integrals, dtype=bool)
+    level = numpy.zeros(num_integrals, dtype=int)
+
+    total_val = sub_val.copy()
+    total_err = sub_err.copy()
+
+    if extrapolate:
+        # For every integral, the sequence of values on the refinement levels, and the
+        # values extrapolated from it
+        max_level = numpy.zeros(num_integrals, dtype=int)
+        sequences = [[total_val[..., i].copy()] for i in range(num_integrals)]
+        extrapolations = [[] for _ in range(num_integrals)]
+        ext_val = total_val.copy()
+        ext_err = numpy.full(total_err.shape, numpy.inf)
+
+    def get_tolerance(total_val):
+        tol = numpy.zeros(total_val.shape)
+        if eps_abs is not None:
+            tol = numpy.maximum(tol, eps_abs)
+        if eps_rel is not None:
+            tol = numpy.maximum(tol, eps_rel * numpy.abs(total_val))
+        return tol
+
+    def get_keys(err, tol):
+        # Error relative to the tolerance of the integral, such that the errors of
+        # different integrals are comparable
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            if norm == "max":
+                return _numpy_max_except_last(numpy.where(err > 0.0, err / tol, 0.0))
+            err = _numpy_norm_except_last(err, "2")
+            tol = _numpy_norm_except_last(tol, "2")
+            return numpy.where(err > 0.0, err / tol, 0.0)
+
+    def get_converged(err, tol):
+        return _is_within_tolerance(err, tol, norm, compare=numpy.less_equal)
+
+    tol = get_tolerance(total_val)
+    is_converged = get_converged(total_err, tol)
+
+    keys = get_keys(sub_err, tol)
+    heap = list(zip(-keys, range(num_integrals)))
+    heapq.heapify(heap)
+
+    num_subintervals = numpy.ones(num_integrals, dtype=int)
+    num_evaluations = numpy.full(num_integrals, len(pair.points))
+    while not numpy.all(is_converged):
+        k = (
+            numpy.count_nonzero(~is_converged)
+            if batch_size is None
+            else min(batch_size, numpy.count_nonzero(~is_converged))
+        )
+        # Pop the worst subintervals. Those which belong to already converged integrals
+        # are dropped from the heap; they will never be refined.
+        idx = []
+        while len(idx) < k:
+            _, i = heapq.heappop(heap)
+            if not is_converged[parent[i]]:
+                idx.append(i)
+        idx = numpy.array(idx)
+
+        num_subintervals += numpy.bincount(parent[idx], minlength=num_integrals)
+        if numpy.any(num_subintervals > max_num_subintervals):
+            raise IntegrationError(
+                f"Tolerances (abs: {eps_abs}, rel: {eps_rel}) could not be reached "
+                f"with the given max_num_subintervals (= {max_num_subintervals})."
+            )
+
+        # bisect
+        lo = sub_intervals[0][..., idx]
+        hi = sub_intervals[1][..., idx]
+        mid = 0.5 * (lo + hi)
+        new_intervals = numpy.array(
+            [
+                numpy.concatenate([lo, mid], axis=-1),
+                numpy.concatenate([mid, hi], axis=-1),
+            ]
+        )
+        new_parent = numpy.concatenate([parent[idx], parent[idx]])
+        new_level = numpy.concatenate([level[idx], level[idx]]) + 1
+
+        new_val, _, a, new_err, _, _ = _gauss_kronrod_integrate(
+            pair,
+            f,
+            new_intervals,
+            dot=dot,
+            domain_shape=domain_shape,
+            range_shape=range_shape,
+        )
+        num_evaluations += numpy.bincount(new_parent, minlength=num_integrals) * len(
+            pair.points
+        )
+
+        if numpy.any(a < minimum_interval_length):
+            raise IntegrationError(
+                f"Tolerances (abs: {eps_abs}, rel: {eps_rel}) could not be reached "
+                f"with the given minimum_interval_length (= {minimum_interval_length})."
+            )
+
+        # Replace the contributions of the split intervals by those of their children.
+        _scatter_add(total_val, parent[idx], -sub_val[..., idx])
+        _scatter_add(total_val, new_parent, new_val)
+        _scatter_add(total_err, parent[idx], -sub_err[..., idx])
+        _scatter_add(total_err, new_parent, new_err)
+
+        n = alive.shape[0]
+        alive[idx] = False
+        sub_intervals = numpy.concatenate([sub_intervals, new_intervals], axis=-1)
+        sub_val = numpy.concatenate([sub_val, new_val], axis=-1)
+        sub_err = numpy.concatenate([sub_err, new_err], axis=-1)
+        parent = numpy.concatenate([parent, new_parent])
+        level = numpy.concatenate([level, new_level])
+        alive = numpy.concatenate([alive, numpy.ones(len(new_parent), dtype=bool)])
+
+        tol = get_tolerance(total_val)
+        is_converged = get_converged(total_err, tol)
+
+        if extrapolate:
+            deeper = numpy.unique(new_parent[new_level > max_level[new_parent]])
+            numpy.maximum.at(max_level, new_parent, new_level)
+            for i in deeper:
+                _extrapolate(
+                    total_val[..., i],
+                    sequences[i],
+                    extrapolations[i],
+                    ext_val,
+                    ext_err,
+                    i,
+                )
+            is_converged |= get_converged(ext_err, tol)
+
+        keys = get_keys(new_err, tol[..., new_parent])
+        for key, i in zip(keys, range(n, n + len(new_parent))):
+            heapq.heappush(heap, (-key, i))
+
+    record_levels(numpy.max(level))
+
+    # Sum up once more to get rid of the accumulated round-off from the updates.
+    total_val = numpy.zeros(total_val.shape, dtype=total_val.dtype)
+    total_err = numpy.zeros(total_err.shape)
+    _scatter_add(total_val, parent[alive], sub_val[..., alive])
+    _scatter_add(total_err, parent[alive], sub_err[..., alive])
+
+    if extrapolate:
+        is_better = ext_err < total_err
+        total_val = numpy.where(is_better, ext_val, total_val)
+        total_err = numpy.where(is_better, ext_err, total_err)
+
+    info = {"num_evaluations": num_evaluations, "num_subintervals": num_subintervals}
+    return total_val.reshape(val_shape), total_err.reshape(val_shape), info
+
+
+def _extrapolate(val, sequence, extrapolations, ext_val, ext_err, i):
+    # Append `val` to the sequence of integral values, extrapolate the limit, and
+    # update the best extrapolation of integral `i` (in `ext_val`, `ext_err`). Cf.
+    # QUADPACK's QELG.
+    sequence.append(val.copy())
+    if len(sequence) < 3:
+        return
+    # Only the 50 most recent elements are considered.
+    del sequence[:-50]
+    res = _wynn_epsilon(sequence)
+    # The error is estimated from the differences to the three previous extrapolations.
+    previous = extrapolations[-3:]
+    extrapolations.append(res)
+    if len(previous) < 3:
+        return
+    err = sum(numpy.abs(res - r) for r in previous)
+    err = numpy.maximum(err, 5 * numpy.finfo(float).eps * numpy.abs(res))
+    is_better = err < ext_err[..., i]
+    ext_val[..., i] = numpy.where(is_better, res, ext_val[..., i])
+    ext_err[..., i] = numpy.where(is_better, err, ext_err[..., i])
@@ -1,31 +1,4 @@
-from ._dobrodeev_1970 import dobrodeev_1970
-from ._dobrodeev_1978 import dobrodeev_1978
-from ._hammer_stroud import hammer_stroud_11n, hammer_stroud_12n
-from ._stroud import stroud_sn_3_1  # stroud_sn_7_3a,
-from ._stroud import (
-    stroud_sn_2_1,
-    stroud_sn_3_2,
-    stroud_sn_5_1a,
-    stroud_sn_5_1b,
-    stroud_sn_5_2,
-    stroud_sn_5_3,
-    stroud_sn_5_4,
-    stroud_sn_5_5,
-    stroud_sn_5_6,
-    stroud_sn_7_1a,
-    stroud_sn_7_1b,
-    stroud_sn_7_2,
-    stroud_sn_7_3a,
-    stroud_sn_7_3b,
-    stroud_sn_9_1a,
-    stroud_sn_9_1b,
-    stroud_sn_11_1a,
-    stroud_sn_11_1b,
-)
-from ._stroud_1957 import stroud_1957
-from ._stroud_1966 import stroud_1966_a, stroud_1966_b, stroud_1966_c, stroud_1966_d
-from ._stroud_1967_5 import stroud_1967_5_a, stroud_1967_5_b
-from ._stroud_1967_7 import stroud_1967_7_a, stroud_1967_7_b, stroud_1967_7_c
+from .._lazy import lazy_import
 
 __all__ = [
     "dobrodeev_1970",
@@ -62,3 +35,42 @@ __all__ = [
     "stroud_1967_7_b",
     "stroud_1967_7_c",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._dobrodeev_1970": ["dobrodeev_1970"],
+        "._dobrodeev_1978": ["dobrodeev_1978"],
+        "._hammer_stroud": ["hammer_stroud_11n", "hammer_stroud_12n"],
+        "._stroud": [
+            "stroud_sn_3_1",
+            "stroud_sn_2_1",
+            "stroud_sn_3_2",
+            "stroud_sn_5_1a",
+            "stroud_sn_5_1b",
+            "stroud_sn_5_2",
+            "stroud_sn_5_3",
+            "stroud_sn_5_4",
+            "stroud_sn_5_5",
+            "stroud_sn_5_6",
+            "stroud_sn_7_1a",
+            "stroud_sn_7_1b",
+            "stroud_sn_7_2",
+            "stroud_sn_7_3a",
+            "stroud_sn_7_3b",
+            "stroud_sn_9_1a",
+            "stroud_sn_9_1b",
+            "stroud_sn_11_1a",
+            "stroud_sn_11_1b",
+        ],
+        "._stroud_1957": ["stroud_1957"],
+        "._stroud_1966": [
+            "stroud_1966_a",
+            "stroud_1966_b",
+            "stroud_1966_c",
+            "stroud_1966_d",
+        ],
+        "._stroud_1967_5": ["stroud_1967_5_a", "stroud_1967_5_b"],
+        "._stroud_1967_7": ["stroud_1967_7_a", "stroud_1967_7_b", "stroud_1967_7_c"],
+    },
+)
@@ -1,7 +1,8 @@
-from sympy import Rational as frac
-from sympy import gamma, pi, sqrt
+import math
 
-from ..helpers import article, fsd, untangle, z
+import sympy
+
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NBallScheme
 
 citation = article(
@@ -16,7 +17,10 @@ citation = article(
 )
 
 
-def dobrodeev_1970(n):
+def dobrodeev_1970(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    gamma = sympy.gamma if symbolic else math.gamma
+
     A = frac(1, 8)
     B = frac(5 - n, 4)
     C = frac((6 - n) * (1 - n ** 2) + 36, 4 * (n + 3))
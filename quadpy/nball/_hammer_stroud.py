@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, untangle, z
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NBallScheme, volume_unit_ball
 
 citation = article(
@@ -15,16 +12,20 @@ citation = article(
 )
 
 
-def hammer_stroud_11n(n, alpha):
+def hammer_stroud_11n(n, alpha, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(frac(n + alpha, n + alpha + 2))
     data = [(frac(1, 2 * n), fsd(n, (r, 1)))]
 
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Hammer-Stroud 11n", n, weights, points, 3, citation)
 
 
-def hammer_stroud_12n(n, alpha):
+def hammer_stroud_12n(n, alpha, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(frac(3 * (n + alpha + 2), (n + 2) * (n + alpha + 4)))
     B1 = frac(
         (4 - n) * (n + 2) * (n + alpha) * (n + alpha + 4), 18 * n * (n + alpha + 2) ** 2
@@ -35,5 +36,5 @@ def hammer_stroud_12n(n, alpha):
     data = [(B0, z(n)), (B1, fsd(n, (r, 1))), (B2, fsd(n, (r, 2)))]
 
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Hammer-Stroud 12n", n, weights, points, 5, citation)
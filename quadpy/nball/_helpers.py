@@ -1,5 +1,6 @@
 import numpy
 
+from ..helpers.stats import instrument
 from ..nsphere._helpers import integrate_monomial_over_unit_nsphere
 
 
@@ -25,6 +26,7 @@ class NBallScheme:
             self.points_symbolic = points
         return
 
+    @instrument()
     def integrate(self, f, center, radius, dot=numpy.dot):
         center = numpy.array(center)
         rr = numpy.multiply.outer(radius, self.points)
@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import book, pm, untangle
+from ..helpers import book, get_kernel, pm, untangle
 from ._hammer_stroud import hammer_stroud_11n, hammer_stroud_12n
 from ._helpers import NBallScheme, volume_unit_ball
 from ._stenger import stenger_7a as stroud_sn_7_3a
@@ -29,20 +26,22 @@ citation = book(
 )
 
 
-def stroud_sn_3_1(n):
-    return hammer_stroud_11n(n, 0)
+def stroud_sn_3_1(n, symbolic=False):
+    return hammer_stroud_11n(n, 0, symbolic)
+
 
+def stroud_sn_3_2(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
 
-def stroud_sn_3_2(n):
     r = sqrt(frac(1, n + 2))
     data = [(frac(1, 2 ** n), pm(n, r))]
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Stroud Sn 3-2", n, weights, points, 3, citation)
 
 
-def stroud_sn_5_2(n):
-    return hammer_stroud_12n(n, 0)
+def stroud_sn_5_2(n, symbolic=False):
+    return hammer_stroud_12n(n, 0, symbolic)
 
 
 __all__ = [
@@ -1,8 +1,9 @@
+import math
+
 import numpy
-from sympy import Rational as frac
-from sympy import cos, pi, sin, sqrt
+import sympy
 
-from ..helpers import article, untangle
+from ..helpers import article, get_kernel, untangle
 from ._helpers import NBallScheme, volume_unit_ball
 
 citation = article(
@@ -18,7 +19,11 @@ citation = article(
 )
 
 
-def stroud_1957(n):
+def stroud_1957(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    cos = sympy.cos if symbolic else math.cos
+    sin = sympy.sin if symbolic else math.sin
+
     pts = [
         [
             [
@@ -42,5 +47,5 @@ def stroud_1957(n):
 
     points, weights = untangle(data)
 
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Stroud 1957", n, weights, points, 2, citation)
@@ -1,8 +1,6 @@
 import numpy
-from sympy import Rational as frac
-from sympy import sqrt
 
-from ..helpers import article, combine, fsd, pm, pm_array, untangle, z
+from ..helpers import article, combine, fsd, get_kernel, pm, pm_array, untangle, z
 from ._helpers import NBallScheme, volume_unit_ball
 
 citation = article(
@@ -18,7 +16,9 @@ citation = article(
 )
 
 
-def stroud_1966_a(n):
+def stroud_1966_a(n, symbolic=False):
+    _, sqrt, _ = get_kernel(symbolic)
+
     a = sqrt(2 * (n + 4))
 
     r2 = (n + 4 - a) / (n + 4)
@@ -32,11 +32,13 @@ def stroud_1966_a(n):
 
     data = [(B1, fsd(n, (r, 1))), (B2, pm(n, s))]
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Stroud 1966a", n, weights, points, 5, citation)
 
 
-def stroud_1966_b(n):
+def stroud_1966_b(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     alpha = 0
     s = sqrt(frac(n + alpha + 2, (n + 2) * (n + alpha + 4)))
     data = []
@@ -59,11 +61,13 @@ def stroud_1966_b(n):
     data.append((B0, z(n)))
 
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Stroud 1966b", n, weights, points, 5, citation)
 
 
-def stroud_1966_c(n):
+def stroud_1966_c(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     a = sqrt(2 * (n + 2))
     r = sqrt((n + 2 + (n - 1) * a) / (n * (n + 4)))
     s = sqrt((n + 2 - a) / (n * (n + 4)))
@@ -74,11 +78,13 @@ def stroud_1966_c(n):
     data = [(B0, z(n)), (B1, combine(((+r, -r), 1), ((+s, -s), (n - 1))))]
 
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Stroud 1966c", n, weights, points, 5, citation)
 
 
-def stroud_1966_d(n):
+def stroud_1966_d(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     a = 2 * sqrt(n + 4)
     b = sqrt(2 * (n + 1) * (n + 2) * (n + 4))
 
@@ -88,11 +94,8 @@ def stroud_1966_d(n):
 
     B = frac(1, 2 ** n * (n + 1))
 
-    # The data is given symbolically, and for large n, those are thousands of points and
-    # weights. Converting them to float takes a long time. A better approach would be to
-    # be convert r, s, t first, and assemble the data afterwards.
     data = [(B, combine(((+r, -r), 1), ((+s, -s), (n - 1)))), (B, pm(n, t))]
 
     points, weights = untangle(data)
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
     return NBallScheme("Stroud 1966d", n, weights, points, 5, citation)
@@ -1,8 +1,7 @@
 import numpy
-from sympy import sqrt
 
 from .. import nsphere
-from ..helpers import article, fsd, pm, untangle, z
+from ..helpers import article, fsd, get_kernel, pm, untangle, z
 from ._helpers import NBallScheme, volume_unit_ball
 
 citation = article(
@@ -16,7 +15,9 @@ citation = article(
 )
 
 
-def _stroud_1967_7_ab(n, variant_a):
+def _stroud_1967_7_ab(n, variant_a, symbolic=False):
+    _, sqrt, _ = get_kernel(symbolic)
+
     if variant_a:
         assert 3 <= n <= 7
         t = 1
@@ -44,21 +45,23 @@ def _stroud_1967_7_ab(n, variant_a):
     data = [(A, z(n)), (B, fsd(n, (r, 1))), (C, pm(n, s)), (D, fsd(n, (t, 2)))]
     points, weights = untangle(data)
 
-    weights *= volume_unit_ball(n)
+    weights *= volume_unit_ball(n, symbolic=symbolic)
 
     name = "Stroud 1967-7{}".format("a" if variant_a else "b")
     return NBallScheme(name, n, weights, points, 7, citation)
 
 
-def stroud_1967_7_a(n):
-    return _stroud_1967_7_ab(n, variant_a=True)
+def stroud_1967_7_a(n, symbolic=False):
+    return _stroud_1967_7_ab(n, variant_a=True, symbolic=symbolic)
+
 
+def stroud_1967_7_b(n, symbolic=False):
+    return _stroud_1967_7_ab(n, variant_a=False, symbolic=symbolic)
 
-def stroud_1967_7_b(n):
-    return _stroud_1967_7_ab(n, variant_a=False)
 
+def stroud_1967_7_c(n, symbolic=False):
+    _, sqrt, _ = get_kernel(symbolic)
 
-def stroud_1967_7_c(n):
     assert n >= 3
 
     alpha = sqrt(2 * (n + 2) * (n + 4))
@@ -71,7 +74,7 @@ def stroud_1967_7_c(n):
         for i in [+1, -1]
     ]
 
-    s = nsphere.stroud_1967(n)
+    s = nsphere.stroud_1967(n, symbolic)
 
     points = numpy.concatenate([r1 * s.points, r2 * s.points])
     weights = numpy.concatenate([A1 * s.weights, A2 * s.weights])
@@ -1,38 +1,8 @@
-from ._dobrodeev1970 import dobrodeev_1970
-from ._dobrodeev1978 import dobrodeev_1978
-from ._ewing import ewing
-from ._hammer_stroud import hammer_stroud_1n, hammer_stroud_2n
-from ._helpers import NCubeScheme, ncube_points, transform
-from ._mustard_lyness_blatt import mustard_lyness_blatt
-from ._phillips import phillips
-from ._stroud import (
-    stroud_cn_1_1,
-    stroud_cn_1_2,
-    stroud_cn_2_1,
-    stroud_cn_2_2,
-    stroud_cn_3_1,
-    stroud_cn_3_2,
-    stroud_cn_3_3,
-    stroud_cn_3_4,
-    stroud_cn_3_5,
-    stroud_cn_3_6,
-    stroud_cn_5_2,
-    stroud_cn_5_3,
-    stroud_cn_5_4,
-    stroud_cn_5_5,
-    stroud_cn_5_6,
-    stroud_cn_5_7,
-    stroud_cn_5_8,
-    stroud_cn_5_9,
-    stroud_cn_7_1,
-)
-from ._stroud_1957 import stroud_1957_2, stroud_1957_3
-from ._stroud_1966 import stroud_1966_a, stroud_1966_b, stroud_1966_c, stroud_1966_d
-from ._stroud_1968 import stroud_1968
-from ._thacher import thacher
-from ._tyler import tyler
+from .._lazy import lazy_import
 
 __all__ = [
+    "get_good_scheme",
+    "integrate_adaptive",
     "dobrodeev_1970",
     "dobrodeev_1978",
     "ewing",
@@ -73,3 +43,48 @@ __all__ = [
     "transform",
     "NCubeScheme",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._dobrodeev1970": ["dobrodeev_1970"],
+        "._dobrodeev1978": ["dobrodeev_1978"],
+        "._ewing": ["ewing"],
+        "._hammer_stroud": ["hammer_stroud_1n", "hammer_stroud_2n"],
+        "._helpers": ["NCubeScheme", "ncube_points", "transform", "get_good_scheme"],
+        "._tools": ["integrate_adaptive"],
+        "._mustard_lyness_blatt": ["mustard_lyness_blatt"],
+        "._phillips": ["phillips"],
+        "._stroud": [
+            "stroud_cn_1_1",
+            "stroud_cn_1_2",
+            "stroud_cn_2_1",
+            "stroud_cn_2_2",
+            "stroud_cn_3_1",
+            "stroud_cn_3_2",
+            "stroud_cn_3_3",
+            "stroud_cn_3_4",
+            "stroud_cn_3_5",
+            "stroud_cn_3_6",
+            "stroud_cn_5_2",
+            "stroud_cn_5_3",
+            "stroud_cn_5_4",
+            "stroud_cn_5_5",
+            "stroud_cn_5_6",
+            "stroud_cn_5_7",
+            "stroud_cn_5_8",
+            "stroud_cn_5_9",
+            "stroud_cn_7_1",
+        ],
+        "._stroud_1957": ["stroud_1957_2", "stroud_1957_3"],
+        "._stroud_1966": [
+            "stroud_1966_a",
+            "stroud_1966_b",
+            "stroud_1966_c",
+            "stroud_1966_d",
+        ],
+        "._stroud_1968": ["stroud_1968"],
+        "._thacher": ["thacher"],
+        "._tyler": ["tyler"],
+    },
+)
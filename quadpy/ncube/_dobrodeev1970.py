@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, untangle, z
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NCubeScheme
 
 _citation = article(
@@ -16,8 +13,10 @@ _citation = article(
 )
 
 
-def dobrodeev_1970(n):
-    assert n >= 3, f"Only works for n >= 3, not n = {n}"
+def dobrodeev_1970(n, symbolic=False):
+    # c is imaginary for n < 5
+    assert n >= 5, f"Only works for n >= 5, not n = {n}"
+    frac, sqrt, _ = get_kernel(symbolic)
 
     A = frac(1, 8)
     B = frac(19 - 5 * n, 20)
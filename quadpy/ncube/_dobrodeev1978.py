@@ -13,7 +13,7 @@ _citation = article(
 )
 
 
-def dobrodeev_1978(n):
+def dobrodeev_1978(n, symbolic=False):
     assert 2 <= n <= 20
 
     dim_config = {
@@ -46,7 +46,9 @@ def dobrodeev_1978(n):
 
     pm_type, i, j, k = dim_config[n]
 
-    G, a, b, c = compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k, symbolic=True)
+    G, a, b, c = compute_dobrodeev(
+        n, I0, I2, I22, I4, pm_type, i, j, k, symbolic=symbolic
+    )
 
     data = [(G, fsd(n, (a, i))), (G, fsd(n, (b, j), (c, k)))]
 
@@ -1,6 +1,4 @@
-from sympy import Rational as frac
-
-from ..helpers import article, pm, untangle, z
+from ..helpers import article, get_kernel, pm, untangle, z
 from ._helpers import NCubeScheme
 
 _citation = article(
@@ -16,7 +14,9 @@ _citation = article(
 )
 
 
-def ewing(n):
+def ewing(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     data = [(frac(2, 3), z(n)), (frac(1, 3 * 2 ** n), pm(n, 1))]
 
     points, weights = untangle(data)
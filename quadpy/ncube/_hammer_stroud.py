@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, untangle, z
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NCubeScheme
 
 _citation = article(
@@ -15,14 +12,18 @@ _citation = article(
 )
 
 
-def hammer_stroud_1n(n):
+def hammer_stroud_1n(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     data = [(frac(1, 2 * n), fsd(n, (sqrt(frac(n, 3)), 1)))]
     points, weights = untangle(data)
     weights *= 2 ** n
     return NCubeScheme("Hammer-Stroud 1n", n, weights, points, 3, _citation)
 
 
-def hammer_stroud_2n(n):
+def hammer_stroud_2n(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(frac(3, 5))
     data = [
         (frac(25 * n ** 2 - 115 * n + 162, 162), z(n)),
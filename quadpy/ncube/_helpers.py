@@ -2,7 +2,10 @@ import itertools
 
 import numpy
 
+from .. import helpers
 from ..helpers import n_outer
+from ..helpers.mesh import integrate_chunked
+from ..helpers.stats import instrument
 
 
 class NCubeScheme:
@@ -27,11 +30,36 @@ class NCubeScheme:
             self.points_symbolic = points
         return
 
-    def integrate(self, f, ncube, dot=numpy.dot):
+    @instrument()
+    def integrate(
+        self, f, ncube, dot=numpy.dot, chunk_size=2 ** 14, workers=1, pool="thread"
+    ):
+        """Integrates `f` over the n-cubes `ncube` (shape (2, ..., 2, ..., d)). With many
+        cubes, they are processed in chunks of `chunk_size` along the cell axis, in
+        parallel with `workers > 1`, see `quadpy.helpers.mesh.integrate_chunked()`.
+        """
+        ncube = numpy.asarray(ncube)
+        d = ncube.shape[-1]
+        if ncube.ndim < d + 2:
+            return self._integrate(f, ncube, dot)
+        return integrate_chunked(
+            self._integrate, f, ncube, d, (dot,), chunk_size, workers, pool
+        )
+
+    def _integrate(self, f, ncube, dot):
         x = transform(self.points.T, ncube).T
         detJ = get_detJ(self.points.T, ncube)
         return dot(f(x) * abs(detJ), self.weights)
 
+    def precompute(self, ncube, dtype=numpy.float64):
+        """Returns the points and weights of the scheme mapped onto the cubes `ncube`, see
+        `quadpy.helpers.MappedScheme`. With `dtype=numpy.float32`, the tables take half
+        the memory.
+        """
+        x = transform(self.points.T, ncube).T
+        weights = abs(get_detJ(self.points.T, ncube)) * self.weights
+        return helpers.MappedScheme(x.astype(dtype), weights.astype(dtype))
+
 
 def transform(xi, cube):
     """Transform the points `xi` from the reference cube to `cube`.
@@ -77,6 +105,14 @@ def get_detJ(xi, cube):
     # ```
     # Like transform(), simplify here and form the determinant explicitly.
     d = xi.shape[0]
+    cube = numpy.asarray(cube)
+
+    # Parallelograms, parallelepipeds etc. are mapped affinely; their Jacobian doesn't
+    # depend on xi.
+    edges = _get_affine_edges(cube, d)
+    if edges is not None:
+        det = _det([0.5 * e.T for e in edges], cube.shape[-1])
+        return numpy.multiply.outer(det, numpy.ones(xi.shape[1:]))
 
     one_mp_xi = numpy.stack([0.5 * (1.0 - xi), 0.5 * (1.0 + xi)], axis=1)
 
@@ -89,19 +125,44 @@ def get_detJ(xi, cube):
         a0 = n_outer(a)
         J.append(numpy.tensordot(a0, cube, axes=(range(d), range(d))).T)
 
+    return _det(J, cube.shape[-1])
+
+
+def _det(J, d):
+    """Determinant of the matrix with the rows `J[k]`; the entries `J[k][i]` are arrays.
+    """
+    if len(J) == d == 2:
+        return J[0][0] * J[1][1] - J[1][0] * J[0][1]
+    if len(J) == d == 3:
+        J0, J1, J2 = J
+        return (
+            +J0[0] * (J1[1] * J2[2] - J2[1] * J1[2])
+            + J1[0] * (J2[1] * J0[2] - J0[1] * J2[2])
+            + J2[0] * (J0[1] * J1[2] - J1[1] * J0[2])
+        )
     # `det` needs the square at the end. Fortran...
-    # For d==2 or d==3, we could avoid this copy and compute the determinant
-    # with their elementary formulas, i.e.,
-    #
-    #     + J[0][0]*J[1][1] - J[1][0]*J[0][1];
-    #
-    #     + J0[0]*J1[1]*J2[2] + J1[0]*J2[1]*J0[2] + J2[0]*J0[1]*J1[2]
-    #     - J0[2]*J1[1]*J2[0] - J1[2]*J2[1]*J0[0] - J2[2]*J0[1]*J1[0].
-    #
     J = numpy.array(J)
     J = numpy.moveaxis(J, (0, 1), (-2, -1))
-    out = numpy.linalg.det(J)
-    return out
+    return numpy.linalg.det(J)
+
+
+def _get_affine_edges(cube, d):
+    """If all cells of `cube` are affine images of the reference cube, returns the
+    edges from the corner (0, ..., 0) along the axes; otherwise None.
+    """
+    if cube.dtype.kind != "f":
+        return None
+    corner0 = cube[d * (0,)]
+    edges = [cube[k * (0,) + (1,) + (d - k - 1) * (0,)] - corner0 for k in range(d)]
+    # All corners must be where the affine map puts them, up to round-off.
+    tol = 16 * numpy.finfo(float).eps * numpy.max(numpy.abs(cube), initial=0.0)
+    for idx in itertools.product([0, 1], repeat=d):
+        if sum(idx) < 2:
+            continue
+        x = corner0 + sum(e for i, e in zip(idx, edges) if i)
+        if numpy.any(numpy.abs(cube[idx] - x) > tol):
+            return None
+    return edges
 
 
 def integrate_monomial_over_ncube(ncube_limits, exp):
@@ -157,8 +218,24 @@ def _s11(n, a, b):
     """Get all permutations of [a, b, 0, 0, ..., 0] of length n.
     len(out) == (n-1)*n.
     """
-    s = [a, b] + (n - 2) * [0]
-    # First permutations, then set can be really inefficient if items are
-    # repeated. Check out <https://stackoverflow.com/q/6284396/353337> for
-    # improvements.
-    return numpy.array(list(set(itertools.permutations(s, n))))
+    # Place a and b directly instead of deduplicating all n! permutations of s. If
+    # a == b, the positions (i, j) and (j, i) give the same point.
+    positions = (
+        itertools.combinations(range(n), 2)
+        if a == b
+        else itertools.permutations(range(n), 2)
+    )
+    out = []
+    for i, j in positions:
+        s = n * [0]
+        s[i] = a
+        s[j] = b
+        out.append(s)
+    return numpy.array(out)
+
+
+def get_good_scheme(n, degree):
+    """Returns the cheapest scheme of dimension `n` with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("ncube", degree, n)
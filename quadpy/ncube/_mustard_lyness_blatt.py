@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, pm, untangle, z
+from ..helpers import article, fsd, get_kernel, pm, untangle, z
 from ._helpers import NCubeScheme
 
 _citation = article(
@@ -16,7 +13,9 @@ _citation = article(
 )
 
 
-def mustard_lyness_blatt(n):
+def mustard_lyness_blatt(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(frac(2, 5))
     data = [
         (frac(8 - 5 * n, 9), z(n)),
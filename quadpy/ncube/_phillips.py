@@ -1,8 +1,6 @@
 import scipy.special
-from sympy import Rational as frac
-from sympy import sqrt
 
-from ..helpers import article, fsd, untangle, z
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NCubeScheme
 
 _citation = article(
@@ -17,7 +15,9 @@ _citation = article(
 )
 
 
-def phillips(n):
+def phillips(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     if n == 2:
         p1 = 1
         p2 = frac(14, 3)
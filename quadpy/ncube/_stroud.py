@@ -1,8 +1,6 @@
 import numpy
-from sympy import Rational as frac
-from sympy import sqrt
 
-from ..helpers import book, fsd, pm
+from ..helpers import book, fsd, get_kernel, pm
 from ._ewing import ewing as stroud_cn_3_5
 from ._hammer_stroud import hammer_stroud_2n as stroud_cn_5_2
 from ._helpers import NCubeScheme
@@ -41,7 +39,9 @@ def stroud_cn_1_2(n):
     return NCubeScheme("Stroud Cn 1-2", n, weights, points, 1, _citation)
 
 
-def stroud_cn_3_2(n):
+def stroud_cn_3_2(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     reference_volume = 2 ** n
 
     weights = numpy.full(2 * n, frac(reference_volume, 2 * n))
@@ -50,7 +50,9 @@ def stroud_cn_3_2(n):
     return NCubeScheme("Stroud Cn 3-2", n, weights, points, 3, _citation)
 
 
-def stroud_cn_3_4(n):
+def stroud_cn_3_4(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     reference_volume = 2 ** n
     weights = numpy.full(2 ** n, frac(reference_volume, 2 ** n))
     r = sqrt(3) / 3
@@ -58,7 +60,9 @@ def stroud_cn_3_4(n):
     return NCubeScheme("Stroud Cn 3-4", n, weights, points, 3, _citation)
 
 
-def stroud_cn_3_6(n):
+def stroud_cn_3_6(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     lst = n * [[frac(1, 3), frac(4, 3), frac(1, 3)]]
     weights = numpy.product(numpy.array(numpy.meshgrid(*lst)).T.reshape(-1, n), axis=-1)
     lst = n * [[-1, 0, +1]]
@@ -66,7 +70,9 @@ def stroud_cn_3_6(n):
     return NCubeScheme("Stroud Cn 3-6", n, weights, points, 3, _citation)
 
 
-def stroud_cn_5_9(n):
+def stroud_cn_5_9(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     lst = n * [[frac(5, 9), frac(8, 9), frac(5, 9)]]
     weights = numpy.product(numpy.array(numpy.meshgrid(*lst)).T.reshape(-1, n), axis=-1)
     sqrt35 = sqrt(frac(3, 5))
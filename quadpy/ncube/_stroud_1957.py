@@ -1,8 +1,9 @@
+import math
+
 import numpy
-from sympy import Rational as frac
-from sympy import cos, pi, sin, sqrt
+import sympy
 
-from ..helpers import article, untangle
+from ..helpers import article, get_kernel, untangle
 from ._helpers import NCubeScheme, _s
 
 _citation = article(
@@ -18,7 +19,9 @@ _citation = article(
 )
 
 
-def stroud_1957_2(n):
+def stroud_1957_2(n, symbolic=False):
+    _, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(3) / 6
     data = [
         (1.0, numpy.array([numpy.full(n, 2 * r)])),
@@ -32,7 +35,11 @@ def stroud_1957_2(n):
     return NCubeScheme("Stroud 1957-2", n, weights, points, 2, _citation)
 
 
-def stroud_1957_3(n):
+def stroud_1957_3(n, symbolic=False):
+    frac, sqrt, pi = get_kernel(symbolic)
+    cos = sympy.cos if symbolic else math.cos
+    sin = sympy.sin if symbolic else math.sin
+
     n2 = n // 2 if n % 2 == 0 else (n - 1) // 2
     i_range = range(1, 2 * n + 1)
     pts = [
@@ -1,8 +1,7 @@
 import numpy
-from sympy import Rational as frac
-from sympy import S, sqrt
+import sympy
 
-from ..helpers import article, fsd, pm, untangle, z
+from ..helpers import article, fsd, get_kernel, pm, untangle, z
 from ._helpers import NCubeScheme, _fs11
 
 _citation = article(
@@ -18,7 +17,9 @@ _citation = article(
 )
 
 
-def stroud_1966_a(n):
+def stroud_1966_a(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(frac(5 * n + 4, 30))
     s = sqrt(frac(5 * n + 4, 15 * n - 12))
     data = [
@@ -31,12 +32,15 @@ def stroud_1966_a(n):
     return NCubeScheme("Stroud 1966a", n, weights, points, 5, _citation)
 
 
-def stroud_1966_b(n):
+def stroud_1966_b(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+    zero = sympy.S(0) if symbolic else 0.0
+
     s = 1 / sqrt(3)
     data = [(frac(4, 5 * n + 4), z(n))]
     for k in range(1, n + 1):
         r = sqrt(frac(5 * k + 4, 15))
-        arr = numpy.full((2 ** (n - k + 1), n), S(0))
+        arr = numpy.full((2 ** (n - k + 1), n), zero)
         arr[:, k - 1 :] = pm(n - k + 1, 1)
         arr[:, k - 1] *= r
         arr[:, k:] *= s
@@ -48,7 +52,9 @@ def stroud_1966_b(n):
     return NCubeScheme("Stroud 1966b", n, weights, points, 5, _citation)
 
 
-def stroud_1966_c(n):
+def stroud_1966_c(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt((5 * n + 4 + 2 * (n - 1) * sqrt(5 * n + 4)) / (15 * n))
     s = sqrt((5 * n + 4 - 2 * sqrt(5 * n + 4)) / (15 * n))
     data = [(frac(4, 5 * n + 4), z(n)), (frac(5, (5 * n + 4) * 2 ** n), _fs11(n, r, s))]
@@ -58,9 +64,12 @@ def stroud_1966_c(n):
     return NCubeScheme("Stroud 1966c", n, weights, points, 5, _citation)
 
 
-def stroud_1966_d(n):
+def stroud_1966_d(n, symbolic=False):
+    # s is imaginary for n=2
+    assert n >= 3, f"Only works for n >= 3, not n = {n}"
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt((5 * n - 2 * sqrt(5) + 2 * (n - 1) * sqrt(5 * n + 5)) / (15 * n))
-    # This sqrt() is imaginary for negative for n=2.
     s = sqrt((5 * n - 2 * sqrt(5) - 2 * sqrt(5 * n + 5)) / (15 * n))
     t = sqrt((5 + 2 * sqrt(5)) / 15)
     w = frac(1, 2 ** n * (n + 1))
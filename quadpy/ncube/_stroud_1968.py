@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, untangle, z
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NCubeScheme, _s2, _s11
 
 _citation = article(
@@ -17,7 +14,9 @@ _citation = article(
 )
 
 
-def stroud_1968(n):
+def stroud_1968(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(frac(7, 15))
     s, t = [sqrt((7 + i * sqrt(24)) / 15) for i in [+1, -1]]
     data = [
@@ -1,6 +1,4 @@
-from sympy import sqrt
-
-from ..helpers import article, untangle
+from ..helpers import article, get_kernel, untangle
 from ._helpers import NCubeScheme, _s
 
 _citation = article(
@@ -16,7 +14,9 @@ _citation = article(
 )
 
 
-def thacher(n):
+def thacher(n, symbolic=False):
+    _, sqrt, _ = get_kernel(symbolic)
+
     r = sqrt(3) / 6
     data = [(1, [n * [2 * r]]), (+r, _s(n, -1, r)), (-r, _s(n, +1, r))]
     points, weights = untangle(data)
@@ -0,0 +1,148 @@
+import itertools
+
+import numpy
+
+from ..helpers.adaptive import integrate_cells
+from ..helpers.stats import instrument
+from ._helpers import get_detJ, transform
+
+
+def _genz_malik(n):
+    """The degree-7 rule with embedded degree-5 rule of Genz and Malik for [-1, 1]^n,
+    n >= 2.
+
+    A.C. Genz, A.A. Malik,
+    An adaptive algorithm for numerical integration over an n-dimensional rectangular
+    region,
+    Journal of Computational and Applied Mathematics 6 (4), 1980, 295-302,
+    <https://doi.org/10.1016/0771-050X(80)90039-X>.
+
+    Returns the points, the weights of both rules (normalized to sum 1), and the
+    indices of the points 0, +-lambda2 e_i, +-lambda3 e_i needed for the fourth
+    differences.
+    """
+    assert n >= 2
+    lmbda2 = numpy.sqrt(9 / 70)
+    lmbda3 = numpy.sqrt(9 / 10)
+    lmbda4 = numpy.sqrt(9 / 10)
+    lmbda5 = numpy.sqrt(9 / 19)
+
+    eye = numpy.eye(n)
+    pairs = [
+        s * lmbda4 * eye[i] + t * lmbda4 * eye[j]
+        for i, j in itertools.combinations(range(n), 2)
+        for s, t in itertools.product([+1, -1], repeat=2)
+    ]
+    points = numpy.concatenate(
+        [
+            numpy.zeros((1, n)),
+            +lmbda2 * eye,
+            -lmbda2 * eye,
+            +lmbda3 * eye,
+            -lmbda3 * eye,
+            numpy.array(pairs),
+            lmbda5 * numpy.array(list(itertools.product([+1, -1], repeat=n))),
+        ]
+    )
+    counts = [1, 2 * n, 2 * n, len(pairs), 2 ** n]
+    weights7 = numpy.repeat(
+        [
+            (12824 - 9120 * n + 400 * n ** 2) / 19683,
+            980 / 6561,
+            (1820 - 400 * n) / 19683,
+            200 / 19683,
+            6859 / 19683 / 2 ** n,
+        ],
+        counts,
+    )
+    weights5 = numpy.repeat(
+        [
+            (729 - 950 * n + 50 * n ** 2) / 729,
+            245 / 486,
+            (265 - 100 * n) / 1458,
+            25 / 729,
+            0.0,
+        ],
+        counts,
+    )
+    idx = numpy.arange(1, 4 * n + 1).reshape(4, n)
+    return points, weights7, weights5, idx
+
+
+def _bisect(cubes, axis):
+    """Splits the cubes in half along the reference axis `axis`."""
+    c0 = numpy.take(cubes, 0, axis=axis)
+    c1 = numpy.take(cubes, 1, axis=axis)
+    mid = 0.5 * (c0 + c1)
+    return numpy.concatenate(
+        [numpy.stack([c0, mid], axis=axis), numpy.stack([mid, c1], axis=axis)], axis=-2,
+    )
+
+
+@instrument()
+def integrate_adaptive(
+    f, ncube, eps, minimum_cube_volume=None, dot=numpy.dot, full_output=False
+):
+    """Adaptive integration of `f` over the n-cubes `ncube` (shape (2, ..., 2, ..., n),
+    see `ncube_points()`), which may be non-affine.
+
+    Every (sub)cube is integrated with the degree-7 rule of Genz and Malik and its
+    embedded degree-5 rule; the difference is the error estimate. As long as the summed
+    error estimate of a cell exceeds `eps`, the subcubes with an error estimate of at
+    least a quarter of the largest one are bisected, namely along the axis in which the
+    fourth difference of the integrand is largest. `eps` can be given per cell. By
+    default, a cell is bisected at most 10*n times.
+
+    Returns the integrals and error estimates for every cube. Cells which would need
+    subcubes smaller than `minimum_cube_volume` aren't refined further and a warning is
+    shown. If `full_output` is True, a dictionary with the number of function
+    evaluations, the number of subcubes, the refinement depth (number of bisections)
+    and whether the tolerance was met (`converged`) per cell is returned as third value
+    instead.
+    """
+    ncube = numpy.asarray(ncube, dtype=float)
+    n = ncube.shape[-1]
+    assert ncube.shape[:n] == n * (2,)
+    cells_shape = ncube.shape[n:-1]
+    cubes = ncube.reshape(n * (2,) + (-1, n))
+
+    xi, weights7, weights5, diff_idx = _genz_malik(n)
+    weights = 2 ** n * numpy.array([weights7, weights5])
+    ratio = (9 / 70) / (9 / 10)
+
+    def integrate(cubes):
+        x = transform(xi.T, cubes).T
+        detJ = abs(get_detJ(xi.T, cubes))
+        fx = numpy.asarray(f(x)) * detJ
+        val7, val5 = numpy.moveaxis(dot(fx, weights.T), -1, 0)
+        vol = numpy.dot(detJ, weights[0])
+        # fourth differences along all axes, maximized over the components of f
+        f0 = fx[..., :1]
+        d2 = fx[..., diff_idx[0]] + fx[..., diff_idx[1]] - 2 * f0
+        d3 = fx[..., diff_idx[2]] + fx[..., diff_idx[3]] - 2 * f0
+        fourth = numpy.abs(d2 - ratio * d3)
+        fourth = numpy.max(fourth, axis=tuple(range(fourth.ndim - 2)))
+        return val7, numpy.abs(val7 - val5), vol, numpy.argmax(fourth, axis=-1)
+
+    def refine(cubes, split_axis):
+        children = []
+        parent = []
+        for axis in range(n):
+            is_split = split_axis == axis
+            if numpy.any(is_split):
+                children.append(_bisect(cubes[..., is_split, :], axis))
+                parent.append(numpy.tile(numpy.flatnonzero(is_split), 2))
+        return numpy.concatenate(children, axis=-2), numpy.concatenate(parent)
+
+    return integrate_cells(
+        integrate,
+        refine,
+        cubes,
+        cells_shape,
+        eps,
+        minimum_cube_volume,
+        0.5 ** (10 * n),
+        len(xi),
+        "cubes",
+        full_output,
+    )
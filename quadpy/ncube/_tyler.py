@@ -1,6 +1,4 @@
-from sympy import Rational as frac
-
-from ..helpers import article, fsd, untangle, z
+from ..helpers import article, fsd, get_kernel, untangle, z
 from ._helpers import NCubeScheme
 
 _citation = article(
@@ -14,7 +12,9 @@ _citation = article(
 )
 
 
-def tyler(n):
+def tyler(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     data = [(frac(3 - n, 3), z(n)), (frac(1, 6), fsd(n, (1, 1)))]
 
     points, weights = untangle(data)
@@ -1,9 +1,8 @@
 from math import factorial as fact
 
 import numpy
-from sympy import Rational as frac
 
-from ..helpers import article, get_all_exponents, untangle
+from ..helpers import article, cached_scheme, get_all_exponents, get_kernel, untangle
 from ._helpers import NSimplexScheme
 
 citation = article(
@@ -17,7 +16,10 @@ citation = article(
 )
 
 
-def grundmann_moeller(n, s):
+@cached_scheme
+def grundmann_moeller(n, s, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     d = 2 * s + 1
 
     exponents = get_all_exponents(n + 1, s)
@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, rd, untangle
+from ..helpers import article, get_kernel, rd, untangle
 from ._helpers import NSimplexScheme
 
 citation = article(
@@ -17,7 +14,9 @@ citation = article(
 )
 
 
-def hammer_stroud_1a(n):
+def hammer_stroud_1a(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 2
     r = (n + 2 - sqrt(n + 2)) / (n + 1) / (n + 2)
     s = (n + 2 + n * sqrt(n + 2)) / (n + 1) / (n + 2)
@@ -27,7 +26,9 @@ def hammer_stroud_1a(n):
     return NSimplexScheme("Hammer-Stround 1a", n, weights, points, degree, citation)
 
 
-def hammer_stroud_1b(n):
+def hammer_stroud_1b(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 2
     r = (n + 2 + sqrt(n + 2)) / (n + 1) / (n + 2)
     s = (n + 2 - n * sqrt(n + 2)) / (n + 1) / (n + 2)
@@ -37,7 +38,9 @@ def hammer_stroud_1b(n):
     return NSimplexScheme("Hammer-Stround 1b", n, weights, points, degree, citation)
 
 
-def hammer_stroud_2(n):
+def hammer_stroud_2(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
 
     B = -frac((n + 1) ** 2, 4 * (n + 2))
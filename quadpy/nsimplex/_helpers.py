@@ -2,7 +2,10 @@ import math
 
 import numpy
 import scipy.special
-import sympy
+
+from .. import helpers
+from ..helpers.mesh import integrate_chunked
+from ..helpers.stats import instrument
 
 
 class NSimplexScheme:
@@ -27,9 +30,23 @@ class NSimplexScheme:
             self.points_symbolic = points
         return
 
-    def integrate(self, f, simplex, dot=numpy.dot):
-        flt = numpy.vectorize(float)
+    @instrument()
+    def integrate(
+        self, f, simplex, dot=numpy.dot, chunk_size=2 ** 14, workers=1, pool="thread"
+    ):
+        """Integrates `f` over the simplices `simplex` (shape (n+1, ..., d)). With many
+        simplices, they are processed in chunks of `chunk_size` along the cell axis, in
+        parallel with `workers > 1`, see `quadpy.helpers.mesh.integrate_chunked()`.
+        """
         simplex = numpy.asarray(simplex)
+        if simplex.ndim < 3:
+            return self._integrate(f, simplex, dot)
+        return integrate_chunked(
+            self._integrate, f, simplex, 1, (dot,), chunk_size, workers, pool
+        )
+
+    def _integrate(self, f, simplex, dot):
+        flt = numpy.vectorize(float)
         x = transform(flt(self.points).T, simplex.T)
         vol = get_vol(simplex)
 
@@ -42,6 +59,17 @@ class NSimplexScheme:
         )
         return vol * dot(fx, flt(self.weights))
 
+    def precompute(self, simplex, dtype=numpy.float64):
+        """Returns the points and weights of the scheme mapped onto the simplices `simplex`, see
+        `quadpy.helpers.MappedScheme`. With `dtype=numpy.float32`, the tables take half
+        the memory.
+        """
+        simplex = numpy.asarray(simplex)
+        xi = numpy.asarray(self.points, dtype=float).T
+        x = transform(xi, simplex.T)
+        weights = numpy.multiply.outer(get_vol(simplex), self.weights)
+        return helpers.MappedScheme(x.astype(dtype), weights.astype(dtype))
+
 
 def transform(points, simplex):
     """Transform the points `xi` from the reference simplex onto `simplex`.
@@ -56,27 +84,60 @@ def transform(points, simplex):
 
 
 def get_vol(simplex):
-    # Compute the volume via the Cayley-Menger determinant
-    # <http://mathworld.wolfram.com/Cayley-MengerDeterminant.html>. One advantage is
-    # that it can compute the volume of the simplex indenpendent of the dimension of the
-    # space in which it is embedded.
-
-    # compute all edge lengths
-    edges = numpy.subtract(simplex[:, None], simplex[None, :])
-    ei_dot_ej = numpy.einsum("...k,...k->...", edges, edges)
-
-    j = simplex.shape[0] - 1
-    a = numpy.empty((j + 2, j + 2) + ei_dot_ej.shape[2:])
-    a[1:, 1:] = ei_dot_ej
-    a[0, 1:] = 1.0
-    a[1:, 0] = 1.0
-    a[0, 0] = 0.0
-
-    a = numpy.moveaxis(a, (0, 1), (-2, -1))
-    det = numpy.linalg.det(a)
-
-    vol = numpy.sqrt((-1.0) ** (j + 1) / 2 ** j / math.factorial(j) ** 2 * det)
-    return vol
+    """Volume of the simplex (or simplices) `simplex` of shape `(n + 1, ..., d)`, i.e.,
+    the n + 1 corners, any number of batch dimensions, and the coordinates. The simplex
+    can be embedded in a space of higher dimension d > n.
+    """
+    simplex = numpy.asarray(simplex)
+    n = simplex.shape[0] - 1
+    d = simplex.shape[-1]
+    if n == 0:
+        return numpy.ones(simplex.shape[1:-1])
+
+    # The edges from the first corner. Unlike the Cayley-Menger determinant, this
+    # doesn't need the (n+1)x(n+1) tensor of all edge lengths, and for the common cases
+    # of triangles and tetrahedra, no (batched) determinant at all.
+    e = simplex[1:] - simplex[0]
+    if n == 1:
+        return numpy.sqrt(numpy.einsum("...k,...k->...", e[0], e[0]))
+    if n == 2 and d == 2:
+        return 0.5 * abs(e[0, ..., 0] * e[1, ..., 1] - e[0, ..., 1] * e[1, ..., 0])
+    if n == 2 and d == 3:
+        c = numpy.cross(e[0], e[1])
+        return 0.5 * numpy.sqrt(numpy.einsum("...k,...k->...", c, c))
+    if n == 3 and d == 3:
+        triple = numpy.einsum("...k,...k->...", e[0], numpy.cross(e[1], e[2]))
+        return abs(triple) / 6
+
+    if n == d:
+        det = numpy.linalg.det(numpy.moveaxis(e, 0, -2))
+        return abs(det) / math.factorial(n)
+    # Gram determinant for simplices embedded in higher dimensions
+    gram = numpy.einsum("i...k,j...k->...ij", e, e)
+    return numpy.sqrt(numpy.linalg.det(gram)) / math.factorial(n)
+
+
+def _embed(scheme1, scheme2):
+    """Returns the points of `scheme2` (plus those of `scheme1` which aren't among
+    them) and the weights of both schemes on these points, shape (2, num_points). If
+    the schemes are nested, e.g., triangle.dunavant_05 and triangle.cubtri, the shared
+    points only appear once.
+    """
+    p1 = numpy.asarray(scheme1.points, dtype=float)
+    p2 = numpy.asarray(scheme2.points, dtype=float)
+    dist = numpy.max(numpy.abs(p1[:, None] - p2[None]), axis=-1)
+    # Not 1.0e-14: tabulated schemes only carry about 16 digits, e.g., the points which
+    # cubtri shares with dunavant_05 differ from those by 3.0e-14.
+    is_shared = numpy.min(dist, axis=1) < 1.0e-12
+    points = numpy.concatenate([p2, p1[~is_shared]])
+
+    weights = numpy.zeros((2, len(points)))
+    weights[1, : len(p2)] = scheme2.weights
+    idx = numpy.empty(len(p1), dtype=int)
+    idx[is_shared] = numpy.argmin(dist[is_shared], axis=1)
+    idx[~is_shared] = len(p2) + numpy.arange(numpy.count_nonzero(~is_shared))
+    weights[0, idx] = scheme1.weights
+    return points, weights
 
 
 def integrate_monomial_over_unit_simplex(k, symbolic=False):
@@ -97,6 +158,8 @@ def integrate_monomial_over_unit_simplex(k, symbolic=False):
     all dimensions.
     """
     if symbolic:
+        import sympy
+
         return sympy.prod([sympy.gamma(kk + 1) for kk in k]) / sympy.gamma(
             sum(k) + len(k) + 1
         )
@@ -106,3 +169,10 @@ def integrate_monomial_over_unit_simplex(k, symbolic=False):
         math.fsum([scipy.special.gammaln(kk + 1) for kk in k])
         - scipy.special.gammaln(sum([kk + 1 for kk in k]) + 1)
     )
+
+
+def get_good_scheme(n, degree):
+    """Returns the cheapest scheme of dimension `n` with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("nsimplex", degree, n)
@@ -1,6 +1,4 @@
-from sympy import Rational as frac
-
-from ..helpers import article, rd, untangle
+from ..helpers import article, get_kernel, rd, untangle
 from ._helpers import NSimplexScheme
 
 citation = article(
@@ -14,13 +12,17 @@ citation = article(
 )
 
 
-def lauffer_1(n):
+def lauffer_1(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     data = [(frac(1, n + 1), rd(n + 1, [(1, 1)]))]
     points, weights = untangle(data)
     return NSimplexScheme("Lauffer 1", n, weights, points, 1, citation)
 
 
-def lauffer_2(n):
+def lauffer_2(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     B = frac(2 - n, (n + 1) * (n + 2))
     C = frac(4, (n + 1) * (n + 2))
     data = [(B, rd(n + 1, [(1, 1)])), (C, rd(n + 1, [(frac(1, 2), 2)]))]
@@ -28,7 +30,9 @@ def lauffer_2(n):
     return NSimplexScheme("Lauffer 2", n, weights, points, 2, citation)
 
 
-def lauffer_3(n):
+def lauffer_3(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     B = frac(n ** 2 - 4 * n + 6, (n + 1) * (n + 2) * (n + 3))
     C = frac(27 - 9 * n, 2 * (n + 1) * (n + 2) * (n + 3))
     D = frac(27, (n + 1) * (n + 2) * (n + 3))
@@ -45,7 +49,9 @@ def lauffer_3(n):
     return NSimplexScheme("Lauffer 3", n, weights, points, 3, citation)
 
 
-def lauffer_4(n):
+def lauffer_4(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     assert n >= 3
 
     nprod = (n + 1) * (n + 2) * (n + 3) * (n + 4)
@@ -71,7 +77,9 @@ def lauffer_4(n):
     return NSimplexScheme("Lauffer 4", n, weights, points, 4, citation)
 
 
-def lauffer_5(n):
+def lauffer_5(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     assert n >= 4
 
     nprod = (n + 1) * (n + 2) * (n + 3) * (n + 4) * (n + 5)
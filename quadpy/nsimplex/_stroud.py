@@ -1,7 +1,6 @@
 import numpy
-from sympy import Rational as frac
 
-from ..helpers import book, untangle
+from ..helpers import book, get_kernel, untangle
 from ._hammer_stroud import hammer_stroud_1a as stroud_tn_2_1a
 from ._hammer_stroud import hammer_stroud_1b as stroud_tn_2_1b
 from ._hammer_stroud import hammer_stroud_2 as stroud_tn_3_1
@@ -31,7 +30,9 @@ citation = book(
 )
 
 
-def stroud_tn_1_1(n):
+def stroud_tn_1_1(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     # midpoint rule
     degree = 1
     data = [(1, numpy.full((1, n + 1), frac(1, n + 1)))]
@@ -1,6 +1,4 @@
-from sympy import Rational as frac
-
-from ..helpers import article, rd, untangle
+from ..helpers import article, get_kernel, rd, untangle
 from ._helpers import NSimplexScheme
 
 citation = article(
@@ -16,7 +14,9 @@ citation = article(
 )
 
 
-def stroud_1961(n):
+def stroud_1961(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
 
     r = frac(1, n + 1)
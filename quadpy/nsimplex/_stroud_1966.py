@@ -1,8 +1,6 @@
 import numpy
-from sympy import Rational as frac
-from sympy import sqrt
 
-from ..helpers import article, rd, untangle
+from ..helpers import article, get_kernel, rd, untangle
 from ._helpers import NSimplexScheme
 
 citation = article(
@@ -18,7 +16,9 @@ citation = article(
 )
 
 
-def stroud_1966_1(n):
+def stroud_1966_1(n, symbolic=False):
+    _, sqrt, _ = get_kernel(symbolic)
+
     degree = 3
     sqrt4n13 = sqrt(4 * n + 13)
 
@@ -54,7 +54,9 @@ def stroud_1966_2(n):
     return NSimplexScheme("Stroud 1966-II", n, weights, points, degree, citation)
 
 
-def stroud_1966_3(n):
+def stroud_1966_3(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     assert n > 2
 
@@ -76,7 +78,9 @@ def stroud_1966_3(n):
     return NSimplexScheme("Stroud 1966-III", n, weights, points, degree, citation)
 
 
-def stroud_1966_4(n):
+def stroud_1966_4(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     assert n >= 3
 
@@ -96,7 +100,9 @@ def stroud_1966_4(n):
     return NSimplexScheme("Stroud 1966-IV", n, weights, points, degree, citation)
 
 
-def stroud_1966_5(n):
+def stroud_1966_5(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     r = frac(1, n)
     s = frac(1, 3)
@@ -115,7 +121,9 @@ def stroud_1966_5(n):
     return NSimplexScheme("Stroud 1966-I", n, weights, points, degree, citation)
 
 
-def stroud_1966_6(n):
+def stroud_1966_6(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     assert n >= 3
     assert n != 5
@@ -139,7 +147,9 @@ def stroud_1966_6(n):
     return NSimplexScheme("Stroud 1966-VI", n, weights, points, degree, citation)
 
 
-def stroud_1966_7(n):
+def stroud_1966_7(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     assert n >= 3
     assert n != 5
@@ -1,8 +1,6 @@
 import numpy
-from sympy import Rational as frac
-from sympy import sqrt
 
-from ..helpers import article, rd, untangle
+from ..helpers import article, get_kernel, rd, untangle
 from ._helpers import NSimplexScheme, integrate_monomial_over_unit_simplex
 
 citation = article(
@@ -16,8 +14,9 @@ citation = article(
 )
 
 
-def stroud_1969(n):
+def stroud_1969(n, symbolic=False):
     assert n >= 3
+    frac, sqrt, _ = get_kernel(symbolic)
 
     degree = 5
 
@@ -45,10 +44,10 @@ def stroud_1969(n):
         pts.append(rd(n + 1, [(u2, n - 1), (v2, 2)]))
         k_range.append(5)
 
-    b0 = integrate_monomial_over_unit_simplex(n * [0], symbolic=True)
+    b0 = integrate_monomial_over_unit_simplex(n * [0], symbolic=symbolic)
     b = [
         integrate_monomial_over_unit_simplex(
-            numpy.array([k] + (n - 1) * [0]), symbolic=True
+            numpy.array([k] + (n - 1) * [0]), symbolic=symbolic
         )
         / b0
         for k in k_range
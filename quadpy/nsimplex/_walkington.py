@@ -1,10 +1,8 @@
 from math import factorial
 
 import numpy
-from sympy import Rational as frac
-from sympy import sqrt
 
-from ..helpers import techreport, untangle
+from ..helpers import get_kernel, techreport, untangle
 from ._helpers import NSimplexScheme
 
 citation = techreport(
@@ -16,7 +14,9 @@ citation = techreport(
 )
 
 
-def walkington_1(d):
+def walkington_1(d, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 1
     data = [(frac(1, factorial(d)), _c(d, frac))]
     points, weights = untangle(data)
@@ -25,7 +25,9 @@ def walkington_1(d):
     return NSimplexScheme("Walkington 1", d, weights, points, degree, citation)
 
 
-def walkington_2(d):
+def walkington_2(d, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     # The article claims order 2, but tests really only show order 1. Also, the article
     # says:
     #
@@ -40,7 +42,9 @@ def walkington_2(d):
     return NSimplexScheme("Walkington 2", d, weights, points, degree, citation)
 
 
-def walkington_3(d):
+def walkington_3(d, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     data = [
         (frac(-((d + 1) ** 3), 4 * factorial(d + 2)), _c(d, frac)),
@@ -52,7 +56,9 @@ def walkington_3(d):
     return NSimplexScheme("Walkington 3", d, weights, points, degree, citation)
 
 
-def walkington_5(d):
+def walkington_5(d, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 5
     w0 = frac(+((d + 1) ** 5), 32 * factorial(d + 3))
     w1 = frac(-((d + 3) ** 5), 16 * factorial(d + 4))
@@ -70,7 +76,9 @@ def walkington_5(d):
     return NSimplexScheme("Walkington 5", d, weights, points, degree, citation)
 
 
-def walkington_7(d):
+def walkington_7(d, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 7
     w0 = -frac(1, 384) * frac((d + 1) ** 7, factorial(d + 4))
     w1 = +frac(1, 128) * frac((d + 3) ** 7, factorial(d + 5))
@@ -1,17 +1,4 @@
-from ._dobrodeev_1978 import dobrodeev_1978
-from ._stroud import (
-    stroud_un_3_1,
-    stroud_un_3_2,
-    stroud_un_5_1,
-    stroud_un_5_2,
-    stroud_un_5_3,
-    stroud_un_5_4,
-    stroud_un_7_1,
-    stroud_un_7_2,
-    stroud_un_11_1,
-)
-from ._stroud_1967 import stroud_1967
-from ._stroud_1969 import stroud_1969
+from .._lazy import lazy_import
 
 __all__ = [
     "dobrodeev_1978",
@@ -27,3 +14,23 @@ __all__ = [
     "stroud_1967",
     "stroud_1969",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._dobrodeev_1978": ["dobrodeev_1978"],
+        "._stroud": [
+            "stroud_un_3_1",
+            "stroud_un_3_2",
+            "stroud_un_5_1",
+            "stroud_un_5_2",
+            "stroud_un_5_3",
+            "stroud_un_5_4",
+            "stroud_un_7_1",
+            "stroud_un_7_2",
+            "stroud_un_11_1",
+        ],
+        "._stroud_1967": ["stroud_1967"],
+        "._stroud_1969": ["stroud_1969"],
+    },
+)
@@ -1,9 +1,6 @@
 from math import factorial as fact
 
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, untangle
+from ..helpers import article, fsd, get_kernel, untangle
 from ._helpers import NSphereScheme, integrate_monomial_over_unit_nsphere
 
 citation = article(
@@ -18,8 +15,7 @@ citation = article(
 )
 
 
-def dobrodeev_1978(n):
-    # from sympy import sqrt, factorial as fact, Rational as fr
+def dobrodeev_1978(n, symbolic=False):
 
     assert 2 <= n <= 20
 
@@ -48,23 +44,27 @@ def dobrodeev_1978(n):
     }
 
     pm_type, i, j, k = dim_config[n]
-    I0 = integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    I0 = integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     if i is None:
-        G, b, c = _generate_jk(n, pm_type, j, k)
+        G, b, c = _generate_jk(n, pm_type, j, k, symbolic)
         data = [(G, fsd(n, (b, j), (c, k)))]
     elif j is None:
         assert k is None
         assert pm_type is None
-        G, a = _generate_i(n, i)
+        G, a = _generate_i(n, i, symbolic)
         data = [(G, fsd(n, (a, i)))]
     else:
-        I2 = integrate_monomial_over_unit_nsphere([2] + (n - 1) * [0], symbolic=True)
+        I2 = integrate_monomial_over_unit_nsphere(
+            [2] + (n - 1) * [0], symbolic=symbolic
+        )
         I22 = integrate_monomial_over_unit_nsphere(
-            [2, 2] + (n - 2) * [0], symbolic=True
+            [2, 2] + (n - 2) * [0], symbolic=symbolic
+        )
+        I4 = integrate_monomial_over_unit_nsphere(
+            [4] + (n - 1) * [0], symbolic=symbolic
         )
-        I4 = integrate_monomial_over_unit_nsphere([4] + (n - 1) * [0], symbolic=True)
 
-        G, a, b, c = _compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k)
+        G, a, b, c = _compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k, symbolic)
 
         data = [(G, fsd(n, (a, i))), (G, fsd(n, (b, j), (c, k)))]
 
@@ -73,14 +73,18 @@ def dobrodeev_1978(n):
     return NSphereScheme("Dobrodeev 1978", n, weights, points, degree, citation)
 
 
-def _generate_i(n, i):
+def _generate_i(n, i, symbolic):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     L = fact(n) // fact(i) // fact(n - i) * 2 ** i
     G = frac(1, L)
     a = sqrt(frac(3, n + 2))
     return G, a
 
 
-def _generate_jk(n, pm_type, j, k):
+def _generate_jk(n, pm_type, j, k, symbolic):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     M = fact(n) // fact(j) // fact(k) // fact(n - j - k) * 2 ** (j + k)
     G = frac(1, M)
 
@@ -90,7 +94,9 @@ def _generate_jk(n, pm_type, j, k):
     return G, b, c
 
 
-def _compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k):
+def _compute_dobrodeev(n, I0, I2, I22, I4, pm_type, i, j, k, symbolic):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     """Same as the helper function in ..helpers, making use of the fact that
     `F == 0` for the sphere
     """
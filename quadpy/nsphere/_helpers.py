@@ -3,6 +3,8 @@ import math
 import numpy
 from sympy import Rational, gamma, prod
 
+from ..helpers.stats import instrument
+
 
 class NSphereScheme:
     def __init__(self, name, dim, weights, points, degree, citation):
@@ -26,6 +28,7 @@ class NSphereScheme:
             self.points_symbolic = points
         return
 
+    @instrument()
     def integrate(self, f, center, radius, dot=numpy.dot):
         center = numpy.array(center)
         rr = numpy.multiply.outer(radius, self.points)
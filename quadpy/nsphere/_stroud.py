@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import book, fsd, pm, pm_array0, untangle
+from ..helpers import book, fsd, get_kernel, pm, pm_array0, untangle
 from ._helpers import NSphereScheme, integrate_monomial_over_unit_nsphere
 from ._stroud_1967 import stroud_1967 as stroud_un_7_1
 from ._stroud_1969 import stroud_1969 as stroud_un_11_1
@@ -14,23 +11,29 @@ citation = book(
 )
 
 
-def stroud_un_3_1(n):
+def stroud_un_3_1(n, symbolic=False):
+    frac, _, _ = get_kernel(symbolic)
+
     degree = 3
     data = [(frac(1, 2 * n), fsd(n, (1, 1)))]
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 3-1", n, weights, points, degree, citation)
 
 
-def stroud_un_3_2(n):
+def stroud_un_3_2(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 3
     data = [(frac(1, 2 ** n), pm(n, sqrt(frac(1, n))))]
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 3-2", n, weights, points, degree, citation)
 
 
-def stroud_un_5_1(n):
+def stroud_un_5_1(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 5
 
     B1 = frac(4 - n, 2 * n * (n + 2))
@@ -39,11 +42,13 @@ def stroud_un_5_1(n):
     data = [(B1, fsd(n, (1, 1))), (B2, fsd(n, (sqrt(frac(1, 2)), 2)))]
 
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 5-1", n, weights, points, degree, citation)
 
 
-def stroud_un_5_2(n):
+def stroud_un_5_2(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 5
 
     B1 = frac(1, n * (n + 2))
@@ -52,11 +57,13 @@ def stroud_un_5_2(n):
     data = [(B1, fsd(n, (1, 1))), (B2, pm(n, sqrt(frac(1, n))))]
 
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 5-2", n, weights, points, degree, citation)
 
 
-def stroud_un_5_3(n):
+def stroud_un_5_3(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 5
 
     s = sqrt(frac(1, n + 2))
@@ -67,11 +74,13 @@ def stroud_un_5_3(n):
     ]
 
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 5-3", n, weights, points, degree, citation)
 
 
-def stroud_un_5_4(n):
+def stroud_un_5_4(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 5
 
     s = sqrt(2 * (n + 2))
@@ -81,11 +90,13 @@ def stroud_un_5_4(n):
     data = [(frac(1, 2 ** n * n), fsd(n, (u, 1), (v, n - 1)))]
 
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 5-4", n, weights, points, degree, citation)
 
 
-def stroud_un_7_2(n):
+def stroud_un_7_2(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 7
 
     A = frac(-(n ** 2), 2 ** (n + 3) * (n + 2))
@@ -98,7 +109,7 @@ def stroud_un_7_2(n):
     data = [(A, pm(n, r)), (B, fsd(n, (s, 1), (t, n - 1)))]
 
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0])
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud Un 7-1", n, weights, points, degree, citation)
 
 
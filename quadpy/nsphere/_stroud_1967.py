@@ -1,7 +1,4 @@
-from sympy import Rational as frac
-from sympy import sqrt
-
-from ..helpers import article, fsd, pm, untangle
+from ..helpers import article, fsd, get_kernel, pm, untangle
 from ._helpers import NSphereScheme, integrate_monomial_over_unit_nsphere
 
 citation = article(
@@ -15,7 +12,9 @@ citation = article(
 )
 
 
-def stroud_1967(n):
+def stroud_1967(n, symbolic=False):
+    frac, sqrt, _ = get_kernel(symbolic)
+
     degree = 7
 
     r = 1
@@ -34,5 +33,5 @@ def stroud_1967(n):
     ]
 
     points, weights = untangle(data)
-    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=True)
+    weights *= integrate_monomial_over_unit_nsphere(n * [0], symbolic=symbolic)
     return NSphereScheme("Stroud 1967", n, weights, points, degree, citation)
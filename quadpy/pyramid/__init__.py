@@ -1,16 +1,8 @@
-from ._felippa import (
-    felippa_1,
-    felippa_2,
-    felippa_3,
-    felippa_4,
-    felippa_5,
-    felippa_6,
-    felippa_7,
-    felippa_8,
-    felippa_9,
-)
+from .._lazy import lazy_import
 
 __all__ = [
+    "get_good_scheme",
+    "integrate_mesh",
     "felippa_1",
     "felippa_2",
     "felippa_3",
@@ -21,3 +13,21 @@ __all__ = [
     "felippa_8",
     "felippa_9",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._helpers": ["get_good_scheme", "integrate_mesh"],
+        "._felippa": [
+            "felippa_1",
+            "felippa_2",
+            "felippa_3",
+            "felippa_4",
+            "felippa_5",
+            "felippa_6",
+            "felippa_7",
+            "felippa_8",
+            "felippa_9",
+        ],
+    },
+)
@@ -1,6 +1,8 @@
 import numpy
 
+from .. import helpers
 from ..helpers import backend_to_function
+from ..helpers.stats import instrument
 
 
 class PyramidScheme:
@@ -24,6 +26,7 @@ class PyramidScheme:
             self.points_symbolic = points
         return
 
+    @instrument()
     def integrate(self, f, pyra, dot=numpy.dot):
         flt = numpy.vectorize(float)
 
@@ -33,6 +36,16 @@ class PyramidScheme:
 
         return dot(f(x) * abs(det.T), flt(self.weights))
 
+    def precompute(self, pyra, dtype=numpy.float64):
+        """Returns the points and weights of the scheme mapped onto the pyramids `pyra`, see
+        `quadpy.helpers.MappedScheme`. With `dtype=numpy.float32`, the tables take half
+        the memory.
+        """
+        xi = numpy.asarray(self.points, dtype=float).T
+        x = _transform(xi, pyra)
+        weights = abs(_get_det_J(pyra, xi).T) * self.weights
+        return helpers.MappedScheme(x.astype(dtype), weights.astype(dtype))
+
     def show(
         self,
         pyra=numpy.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 1.0]]),
@@ -109,3 +122,37 @@ def _s4(a, z):
 
 def _s4_0(a, z):
     return [[+a, 0.0, z], [-a, 0.0, z], [0.0, +a, z], [0.0, -a, z]]
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("pyramid", degree)
+
+
+def integrate_mesh(
+    f,
+    points,
+    cells,
+    scheme,
+    chunk_size=2 ** 14,
+    reduce="cell",
+    workers=1,
+    pool="thread",
+):
+    """Integrates `f` over a mesh of pyramids with the vertex indices `cells`, in chunks of
+    `chunk_size` cells, see `quadpy.helpers.integrate_mesh()`. The vertices of each cell
+    are the base in counterclockwise order, then the apex.
+    """
+    return helpers.integrate_mesh(
+        f,
+        points,
+        cells,
+        scheme,
+        (5,),
+        chunk_size=chunk_size,
+        reduce=reduce,
+        workers=workers,
+        pool=pool,
+    )
@@ -1,172 +1,9 @@
-from ..ncube import ncube_points as rectangle_points
-from ..ncube import transform
-from ._albrecht_collatz import (
-    albrecht_collatz_1,
-    albrecht_collatz_2,
-    albrecht_collatz_3,
-    albrecht_collatz_4,
-)
-from ._burnside import burnside
-from ._cohen_gismalla import cohen_gismalla_1, cohen_gismalla_2
-from ._cools_haegemans_1985 import (
-    cools_haegemans_1985_1,
-    cools_haegemans_1985_2,
-    cools_haegemans_1985_3,
-)
-from ._cools_haegemans_1988 import cools_haegemans_1988_1, cools_haegemans_1988_2
-from ._dunavant import (
-    dunavant_00,
-    dunavant_01,
-    dunavant_02,
-    dunavant_03,
-    dunavant_04,
-    dunavant_05,
-    dunavant_06,
-    dunavant_07,
-    dunavant_08,
-    dunavant_09,
-    dunavant_10,
-)
-from ._franke import (
-    franke_1,
-    franke_2a,
-    franke_2b,
-    franke_3a,
-    franke_3b,
-    franke_3c,
-    franke_5,
-    franke_6,
-    franke_8,
-)
-from ._haegemans_piessens import haegemans_piessens
-from ._hammer_stroud import hammer_stroud_1_2, hammer_stroud_2_2, hammer_stroud_3_2
-from ._irwin import irwin_1, irwin_2
-from ._maxwell import maxwell
-from ._meister import meister
-from ._miller import miller
-from ._morrow_patterson import morrow_patterson_1, morrow_patterson_2
-from ._phillips import phillips
-from ._piessens_haegemans import piessens_haegemans_1, piessens_haegemans_2
-from ._product import product
-from ._rabinowitz_richter import (
-    rabinowitz_richter_1,
-    rabinowitz_richter_2,
-    rabinowitz_richter_3,
-    rabinowitz_richter_4,
-    rabinowitz_richter_5,
-    rabinowitz_richter_6,
-)
-from ._schmid import schmid_2, schmid_4, schmid_6
-from ._sommariva import (
-    sommariva_01,
-    sommariva_02,
-    sommariva_03,
-    sommariva_04,
-    sommariva_05,
-    sommariva_06,
-    sommariva_07,
-    sommariva_08,
-    sommariva_09,
-    sommariva_10,
-    sommariva_11,
-    sommariva_12,
-    sommariva_13,
-    sommariva_14,
-    sommariva_15,
-    sommariva_16,
-    sommariva_17,
-    sommariva_18,
-    sommariva_19,
-    sommariva_20,
-    sommariva_21,
-    sommariva_22,
-    sommariva_23,
-    sommariva_24,
-    sommariva_25,
-    sommariva_26,
-    sommariva_27,
-    sommariva_28,
-    sommariva_29,
-    sommariva_30,
-    sommariva_31,
-    sommariva_32,
-    sommariva_33,
-    sommariva_34,
-    sommariva_35,
-    sommariva_36,
-    sommariva_37,
-    sommariva_38,
-    sommariva_39,
-    sommariva_40,
-    sommariva_41,
-    sommariva_42,
-    sommariva_43,
-    sommariva_44,
-    sommariva_45,
-    sommariva_46,
-    sommariva_47,
-    sommariva_48,
-    sommariva_49,
-    sommariva_50,
-    sommariva_51,
-    sommariva_52,
-    sommariva_53,
-    sommariva_54,
-    sommariva_55,
-)
-from ._stroud import (
-    stroud_c2_1_1,
-    stroud_c2_1_2,
-    stroud_c2_3_1,
-    stroud_c2_3_2,
-    stroud_c2_3_3,
-    stroud_c2_3_4,
-    stroud_c2_3_5,
-    stroud_c2_5_1,
-    stroud_c2_5_2,
-    stroud_c2_5_3,
-    stroud_c2_5_4,
-    stroud_c2_5_5,
-    stroud_c2_5_6,
-    stroud_c2_5_7,
-    stroud_c2_7_1,
-    stroud_c2_7_2,
-    stroud_c2_7_3,
-    stroud_c2_7_4,
-    stroud_c2_7_5,
-    stroud_c2_7_6,
-    stroud_c2_9_1,
-    stroud_c2_11_1,
-    stroud_c2_11_2,
-    stroud_c2_13_1,
-    stroud_c2_15_1,
-    stroud_c2_15_2,
-)
-from ._tyler import tyler_1, tyler_2, tyler_3
-from ._waldron import waldron
-from ._wissmann_becker import (
-    wissmann_becker_4_1,
-    wissmann_becker_4_2,
-    wissmann_becker_6_1,
-    wissmann_becker_6_2,
-    wissmann_becker_8_1,
-    wissmann_becker_8_2,
-)
-from ._witherden_vincent import (
-    witherden_vincent_01,
-    witherden_vincent_03,
-    witherden_vincent_05,
-    witherden_vincent_07,
-    witherden_vincent_09,
-    witherden_vincent_11,
-    witherden_vincent_13,
-    witherden_vincent_15,
-    witherden_vincent_17,
-    witherden_vincent_19,
-    witherden_vincent_21,
-)
+from .._lazy import lazy_import
 
 __all__ = [
+    "get_good_scheme",
+    "integrate_mesh",
+    "integrate_adaptive",
     "albrecht_collatz_1",
     "albrecht_collatz_2",
     "albrecht_collatz_3",
@@ -329,3 +166,184 @@ __all__ = [
     "transform",
     "rectangle_points",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._helpers": ["get_good_scheme", "integrate_mesh"],
+        "..ncube": [
+            ("ncube_points", "rectangle_points"),
+            "transform",
+            "integrate_adaptive",
+        ],
+        "._albrecht_collatz": [
+            "albrecht_collatz_1",
+            "albrecht_collatz_2",
+            "albrecht_collatz_3",
+            "albrecht_collatz_4",
+        ],
+        "._burnside": ["burnside"],
+        "._cohen_gismalla": ["cohen_gismalla_1", "cohen_gismalla_2"],
+        "._cools_haegemans_1985": [
+            "cools_haegemans_1985_1",
+            "cools_haegemans_1985_2",
+            "cools_haegemans_1985_3",
+        ],
+        "._cools_haegemans_1988": ["cools_haegemans_1988_1", "cools_haegemans_1988_2"],
+        "._dunavant": [
+            "dunavant_00",
+            "dunavant_01",
+            "dunavant_02",
+            "dunavant_03",
+            "dunavant_04",
+            "dunavant_05",
+            "dunavant_06",
+            "dunavant_07",
+            "dunavant_08",
+            "dunavant_09",
+            "dunavant_10",
+        ],
+        "._franke": [
+            "franke_1",
+            "franke_2a",
+            "franke_2b",
+            "franke_3a",
+            "franke_3b",
+            "franke_3c",
+            "franke_5",
+            "franke_6",
+            "franke_8",
+        ],
+        "._haegemans_piessens": ["haegemans_piessens"],
+        "._hammer_stroud": [
+            "hammer_stroud_1_2",
+            "hammer_stroud_2_2",
+            "hammer_stroud_3_2",
+        ],
+        "._irwin": ["irwin_1", "irwin_2"],
+        "._maxwell": ["maxwell"],
+        "._meister": ["meister"],
+        "._miller": ["miller"],
+        "._morrow_patterson": ["morrow_patterson_1", "morrow_patterson_2"],
+        "._phillips": ["phillips"],
+        "._piessens_haegemans": ["piessens_haegemans_1", "piessens_haegemans_2"],
+        "._product": ["product"],
+        "._rabinowitz_richter": [
+            "rabinowitz_richter_1",
+            "rabinowitz_richter_2",
+            "rabinowitz_richter_3",
+            "rabinowitz_richter_4",
+            "rabinowitz_richter_5",
+            "rabinowitz_richter_6",
+        ],
+        "._schmid": ["schmid_2", "schmid_4", "schmid_6"],
+        "._sommariva": [
+            "sommariva_01",
+            "sommariva_02",
+            "sommariva_03",
+            "sommariva_04",
+            "sommariva_05",
+            "sommariva_06",
+            "sommariva_07",
+            "sommariva_08",
+            "sommariva_09",
+            "sommariva_10",
+            "sommariva_11",
+            "sommariva_12",
+            "sommariva_13",
+            "sommariva_14",
+            "sommariva_15",
+            "sommariva_16",
+            "sommariva_17",
+            "sommariva_18",
+            "sommariva_19",
+            "sommariva_20",
+            "sommariva_21",
+            "sommariva_22",
+            "sommariva_23",
+            "sommariva_24",
+            "sommariva_25",
+            "sommariva_26",
+            "sommariva_27",
+            "sommariva_28",
+            "sommariva_29",
+            "sommariva_30",
+            "sommariva_31",
+            "sommariva_32",
+            "sommariva_33",
+            "sommariva_34",
+            "sommariva_35",
+            "sommariva_36",
+            "sommariva_37",
+            "sommariva_38",
+            "sommariva_39",
+            "sommariva_40",
+            "sommariva_41",
+            "sommariva_42",
+            "sommariva_43",
+            "sommariva_44",
+            "sommariva_45",
+            "sommariva_46",
+            "sommariva_47",
+            "sommariva_48",
+            "sommariva_49",
+            "sommariva_50",
+            "sommariva_51",
+            "sommariva_52",
+            "sommariva_53",
+            "sommariva_54",
+            "sommariva_55",
+        ],
+        "._stroud": [
+            "stroud_c2_1_1",
+            "stroud_c2_1_2",
+            "stroud_c2_3_1",
+            "stroud_c2_3_2",
+            "stroud_c2_3_3",
+            "stroud_c2_3_4",
+            "stroud_c2_3_5",
+            "stroud_c2_5_1",
+            "stroud_c2_5_2",
+            "stroud_c2_5_3",
+            "stroud_c2_5_4",
+            "stroud_c2_5_5",
+            "stroud_c2_5_6",
+            "stroud_c2_5_7",
+            "stroud_c2_7_1",
+            "stroud_c2_7_2",
+            "stroud_c2_7_3",
+            "stroud_c2_7_4",
+            "stroud_c2_7_5",
+            "stroud_c2_7_6",
+            "stroud_c2_9_1",
+            "stroud_c2_11_1",
+            "stroud_c2_11_2",
+            "stroud_c2_13_1",
+            "stroud_c2_15_1",
+            "stroud_c2_15_2",
+        ],
+        "._tyler": ["tyler_1", "tyler_2", "tyler_3"],
+        "._waldron": ["waldron"],
+        "._wissmann_becker": [
+            "wissmann_becker_4_1",
+            "wissmann_becker_4_2",
+            "wissmann_becker_6_1",
+            "wissmann_becker_6_2",
+            "wissmann_becker_8_1",
+            "wissmann_becker_8_2",
+        ],
+        "._witherden_vincent": [
+            "witherden_vincent_01",
+            "witherden_vincent_03",
+            "witherden_vincent_05",
+            "witherden_vincent_07",
+            "witherden_vincent_09",
+            "witherden_vincent_11",
+            "witherden_vincent_13",
+            "witherden_vincent_15",
+            "witherden_vincent_17",
+            "witherden_vincent_19",
+            "witherden_vincent_21",
+        ],
+    },
+)
@@ -141,3 +141,39 @@ def concat(*data):
     weights = numpy.concatenate([t[0] for t in data])
     points = numpy.vstack([t[1] for t in data])
     return weights, points
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("quadrilateral", degree)
+
+
+def integrate_mesh(
+    f,
+    points,
+    cells,
+    scheme,
+    chunk_size=2 ** 14,
+    reduce="cell",
+    workers=1,
+    pool="thread",
+):
+    """Integrates `f` over a mesh of quadrilaterals with the vertex indices `cells`, in
+    chunks of `chunk_size` cells (in parallel with `workers`), see
+    `quadpy.helpers.integrate_mesh()`. The vertices of each cell are in counterclockwise
+    order.
+    """
+    return helpers.integrate_mesh(
+        f,
+        points,
+        cells,
+        scheme,
+        (2, 2),
+        order=[0, 3, 1, 2],
+        chunk_size=chunk_size,
+        reduce=reduce,
+        workers=workers,
+        pool=pool,
+    )
@@ -1,9 +1,8 @@
-import json
 import os
 
 import numpy
 
-from ...helpers import online
+from ...helpers import online, read_table
 from .._helpers import QuadrilateralScheme
 
 _citation = online(
@@ -16,15 +15,16 @@ _citation = online(
 def _read(index):
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"sommariva_{index:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    return QuadrilateralScheme(f"Sommariva {index}", weights, points, degree, _citation)
 
-    degree = data.pop("degree")
 
+def _expand(data):
+    degree = data.pop("degree")
     data = numpy.array(data["data"])
     points = data[:, :2]
     weights = data[:, 2]
-    return QuadrilateralScheme(f"Sommariva {index}", weights, points, degree, _citation)
+    return degree, points, weights
 
 
 def sommariva_01():
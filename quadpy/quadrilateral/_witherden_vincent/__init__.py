@@ -1,9 +1,8 @@
 """
 """
-import json
 import os
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import QuadrilateralScheme, concat, symm_r0, symm_s, symm_s_t, zero
 
 _citation = article(
@@ -22,11 +21,17 @@ _citation = article(
 def _read(degree):
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"wv{degree:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    table_degree, weights, points = read_table(
+        os.path.join(this_dir, filename), _expand
+    )
+    assert degree == table_degree
+    return QuadrilateralScheme(
+        f"Witherden-Vincent {degree}", weights, points, degree, _citation
+    )
 
-    assert degree == data.pop("degree")
 
+def _expand(data):
+    degree = data.pop("degree")
     d = []
     if "zero" in data:
         d += [zero(data["zero"][0][0])]
@@ -38,9 +43,7 @@ def _read(degree):
         d += [symm_s_t(*data["symm_s_t"])]
 
     weights, points = concat(*d)
-    return QuadrilateralScheme(
-        f"Witherden-Vincent {degree}", weights, points, degree, _citation
-    )
+    return degree, weights, points
 
 
 def witherden_vincent_01():
@@ -1,114 +1,7 @@
-from ._albrecht_collatz import (
-    albrecht_collatz_1,
-    albrecht_collatz_2,
-    albrecht_collatz_3,
-    albrecht_collatz_4,
-    albrecht_collatz_5,
-)
-from ._bazant_oh import bazant_oh_09, bazant_oh_11, bazant_oh_13
-from ._fliege_maier import (
-    fliege_maier_04,
-    fliege_maier_09,
-    fliege_maier_16,
-    fliege_maier_25,
-)
-from ._helpers import area
-from ._heo_xu import (
-    heo_xu_13,
-    heo_xu_15,
-    heo_xu_17,
-    heo_xu_19_1,
-    heo_xu_19_2,
-    heo_xu_21_1,
-    heo_xu_21_2,
-    heo_xu_21_3,
-    heo_xu_21_4,
-    heo_xu_21_5,
-    heo_xu_21_6,
-    heo_xu_23_1,
-    heo_xu_23_2,
-    heo_xu_23_3,
-    heo_xu_25_1,
-    heo_xu_25_2,
-    heo_xu_27_1,
-    heo_xu_27_2,
-    heo_xu_27_3,
-    heo_xu_29,
-    heo_xu_31,
-    heo_xu_33,
-    heo_xu_35,
-    heo_xu_37,
-    heo_xu_39_1,
-    heo_xu_39_2,
-)
-from ._lebedev import (
-    lebedev_003a,
-    lebedev_003b,
-    lebedev_003c,
-    lebedev_005,
-    lebedev_007,
-    lebedev_009,
-    lebedev_011,
-    lebedev_013,
-    lebedev_015,
-    lebedev_017,
-    lebedev_019,
-    lebedev_021,
-    lebedev_023,
-    lebedev_025,
-    lebedev_027,
-    lebedev_029,
-    lebedev_031,
-    lebedev_035,
-    lebedev_041,
-    lebedev_047,
-    lebedev_053,
-    lebedev_059,
-    lebedev_065,
-    lebedev_071,
-    lebedev_077,
-    lebedev_083,
-    lebedev_089,
-    lebedev_095,
-    lebedev_101,
-    lebedev_107,
-    lebedev_113,
-    lebedev_119,
-    lebedev_125,
-    lebedev_131,
-)
-from ._mclaren import (
-    mclaren_01,
-    mclaren_02,
-    mclaren_03,
-    mclaren_04,
-    mclaren_05,
-    mclaren_06,
-    mclaren_07,
-    mclaren_08,
-    mclaren_09,
-    mclaren_10,
-)
-from ._stroud import (
-    stroud_u3_3_1,
-    stroud_u3_5_1,
-    stroud_u3_5_2,
-    stroud_u3_5_3,
-    stroud_u3_5_4,
-    stroud_u3_5_5,
-    stroud_u3_7_1,
-    stroud_u3_7_2,
-    stroud_u3_8_1,
-    stroud_u3_9_1,
-    stroud_u3_9_2,
-    stroud_u3_9_3,
-    stroud_u3_11_1,
-    stroud_u3_11_2,
-    stroud_u3_11_3,
-    stroud_u3_14_1,
-)
+from .._lazy import lazy_import
 
 __all__ = [
+    "get_good_scheme",
     "albrecht_collatz_1",
     "albrecht_collatz_2",
     "albrecht_collatz_3",
@@ -210,3 +103,118 @@ __all__ = [
     #
     "area",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        "._albrecht_collatz": [
+            "albrecht_collatz_1",
+            "albrecht_collatz_2",
+            "albrecht_collatz_3",
+            "albrecht_collatz_4",
+            "albrecht_collatz_5",
+        ],
+        "._bazant_oh": ["bazant_oh_09", "bazant_oh_11", "bazant_oh_13"],
+        "._fliege_maier": [
+            "fliege_maier_04",
+            "fliege_maier_09",
+            "fliege_maier_16",
+            "fliege_maier_25",
+        ],
+        "._helpers": ["area", "get_good_scheme"],
+        "._heo_xu": [
+            "heo_xu_13",
+            "heo_xu_15",
+            "heo_xu_17",
+            "heo_xu_19_1",
+            "heo_xu_19_2",
+            "heo_xu_21_1",
+            "heo_xu_21_2",
+            "heo_xu_21_3",
+            "heo_xu_21_4",
+            "heo_xu_21_5",
+            "heo_xu_21_6",
+            "heo_xu_23_1",
+            "heo_xu_23_2",
+            "heo_xu_23_3",
+            "heo_xu_25_1",
+            "heo_xu_25_2",
+            "heo_xu_27_1",
+            "heo_xu_27_2",
+            "heo_xu_27_3",
+            "heo_xu_29",
+            "heo_xu_31",
+            "heo_xu_33",
+            "heo_xu_35",
+            "heo_xu_37",
+            "heo_xu_39_1",
+            "heo_xu_39_2",
+        ],
+        "._lebedev": [
+            "lebedev_003a",
+            "lebedev_003b",
+            "lebedev_003c",
+            "lebedev_005",
+            "lebedev_007",
+            "lebedev_009",
+            "lebedev_011",
+            "lebedev_013",
+            "lebedev_015",
+            "lebedev_017",
+            "lebedev_019",
+            "lebedev_021",
+            "lebedev_023",
+            "lebedev_025",
+            "lebedev_027",
+            "lebedev_029",
+            "lebedev_031",
+            "lebedev_035",
+            "lebedev_041",
+            "lebedev_047",
+            "lebedev_053",
+            "lebedev_059",
+            "lebedev_065",
+            "lebedev_071",
+            "lebedev_077",
+            "lebedev_083",
+            "lebedev_089",
+            "lebedev_095",
+            "lebedev_101",
+            "lebedev_107",
+            "lebedev_113",
+            "lebedev_119",
+            "lebedev_125",
+            "lebedev_131",
+        ],
+        "._mclaren": [
+            "mclaren_01",
+            "mclaren_02",
+            "mclaren_03",
+            "mclaren_04",
+            "mclaren_05",
+            "mclaren_06",
+            "mclaren_07",
+            "mclaren_08",
+            "mclaren_09",
+            "mclaren_10",
+        ],
+        "._stroud": [
+            "stroud_u3_3_1",
+            "stroud_u3_5_1",
+            "stroud_u3_5_2",
+            "stroud_u3_5_3",
+            "stroud_u3_5_4",
+            "stroud_u3_5_5",
+            "stroud_u3_7_1",
+            "stroud_u3_7_2",
+            "stroud_u3_8_1",
+            "stroud_u3_9_1",
+            "stroud_u3_9_2",
+            "stroud_u3_9_3",
+            "stroud_u3_11_1",
+            "stroud_u3_11_2",
+            "stroud_u3_11_3",
+            "stroud_u3_14_1",
+        ],
+    },
+)
@@ -1,8 +1,7 @@
-import json
 import os
 import re
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import SphereScheme, cartesian_to_spherical, untangle2
 
 citation = article(
@@ -24,14 +23,17 @@ def _read(index):
 
     m = re.match("([0-9]+)([a-z]*)", index)
     filename = "bazant_oh_{:03d}{}.json".format(int(m.group(1)), m.group(2))
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights, azimuthal_polar = read_table(
+        os.path.join(this_dir, filename), _expand
+    )
+    return SphereScheme(name, weights, points, azimuthal_polar, degree, citation)
 
-    degree = data.pop("degree")
 
+def _expand(data):
+    degree = data.pop("degree")
     points, weights = untangle2(data)
     azimuthal_polar = cartesian_to_spherical(points)
-    return SphereScheme(name, weights, points, azimuthal_polar, degree, citation)
+    return degree, points, weights, azimuthal_polar
 
 
 def bazant_oh_09():
@@ -1,11 +1,10 @@
-import json
 import os
 import re
 import warnings
 
 import numpy
 
-from ...helpers import online
+from ...helpers import online, read_table
 from .._helpers import SphereScheme, cartesian_to_spherical
 
 citation = online(
@@ -24,17 +23,19 @@ def _read(index):
 
     m = re.match("([0-9]+)([a-z]*)", index)
     filename = "fliege_maier_{:03d}{}.json".format(int(m.group(1)), m.group(2))
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights, azimuthal_polar = read_table(
+        os.path.join(this_dir, filename), _expand
+    )
+    return SphereScheme(name, weights, points, azimuthal_polar, degree, citation)
 
-    degree = data.pop("degree")
 
+def _expand(data):
+    degree = data.pop("degree")
     data = numpy.array(data["data"])
     points = data[:, :3]
     weights = data[:, 3] / 4 / numpy.pi
-
     azimuthal_polar = cartesian_to_spherical(points)
-    return SphereScheme(name, weights, points, azimuthal_polar, degree, citation)
+    return degree, points, weights, azimuthal_polar
 
 
 def fliege_maier_04():
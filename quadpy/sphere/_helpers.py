@@ -1,6 +1,9 @@
 import numpy
 import sympy
 
+from .. import helpers
+from ..helpers.stats import instrument
+
 
 class SphereScheme:
     def __init__(self, name, weights, points, azimuthal_polar, degree, citation):
@@ -59,6 +62,7 @@ class SphereScheme:
         ax.set_axis_off()
         return
 
+    @instrument()
     def integrate(self, f, center, radius, dot=numpy.dot):
         """Quadrature where `f` is defined in Cartesian coordinates.
         """
@@ -68,6 +72,7 @@ class SphereScheme:
         ff = numpy.array(f((rr + center).T))
         return area(radius) * dot(ff, self.weights)
 
+    @instrument(coordinate_axis=False)
     def integrate_spherical(self, f, dot=numpy.dot):
         """Quadrature where `f` is a function of the spherical coordinates
         `azimuthal` and `polar` (in this order).
@@ -479,3 +484,10 @@ def _collapse0(a):
     """Collapse all dimensions of `a` except the first.
     """
     return a.reshape(a.shape[0], -1)
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("sphere", degree)
@@ -1,6 +1,7 @@
 import numpy
 import sympy
 
+from .. import helpers
 from ..helpers import backend_to_function
 from ..nsimplex import NSimplexScheme, get_vol, transform
 
@@ -284,3 +285,37 @@ def concat(*data):
     weights = numpy.concatenate([t[0] for t in data])
     points = numpy.vstack([t[1] for t in data])
     return weights, points
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("tetrahedron", degree)
+
+
+def integrate_mesh(
+    f,
+    points,
+    cells,
+    scheme,
+    chunk_size=2 ** 14,
+    reduce="cell",
+    workers=1,
+    pool="thread",
+):
+    """Integrates `f` over a mesh of tetrahedra with the vertex indices `cells`, in chunks
+    of `chunk_size` cells (in parallel with `workers`), see
+    `quadpy.helpers.integrate_mesh()`.
+    """
+    return helpers.integrate_mesh(
+        f,
+        points,
+        cells,
+        scheme,
+        (4,),
+        chunk_size=chunk_size,
+        reduce=reduce,
+        workers=workers,
+        pool=pool,
+    )
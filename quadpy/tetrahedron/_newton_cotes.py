@@ -3,7 +3,7 @@ import math
 import numpy
 import sympy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._helpers import TetrahedronScheme
 
 citation = article(
@@ -75,12 +75,14 @@ def _newton_cotes(n, point_fun):
     return weights, points, degree, citation
 
 
+@cached_scheme
 def newton_cotes_closed(n):
     return TetrahedronScheme(
         f"Newton-Cotes (closed, {n})", *_newton_cotes(n, lambda k, n: k / float(n))
     )
 
 
+@cached_scheme
 def newton_cotes_open(n):
     scheme = TetrahedronScheme(
         f"Newton-Cotes (open, {n})",
@@ -0,0 +1,91 @@
+import numpy
+
+from ..helpers.adaptive import integrate_cells
+from ..helpers.stats import instrument
+from ..nsimplex import get_vol, transform
+from ..nsimplex._helpers import _embed
+from ._witherden_vincent import witherden_vincent_05, witherden_vincent_08
+
+
+def _refine(tetras):
+    """Splits every tetrahedron into eight with the edge midpoints (red refinement,
+    J. Bey, Tetrahedral grid refinement, Computing 55, 1995).
+    """
+    x0, x1, x2, x3 = tetras
+    x01 = 0.5 * (x0 + x1)
+    x02 = 0.5 * (x0 + x2)
+    x03 = 0.5 * (x0 + x3)
+    x12 = 0.5 * (x1 + x2)
+    x13 = 0.5 * (x1 + x3)
+    x23 = 0.5 * (x2 + x3)
+    children = [
+        [x0, x01, x02, x03],
+        [x01, x1, x12, x13],
+        [x02, x12, x2, x23],
+        [x03, x13, x23, x3],
+        [x01, x02, x03, x13],
+        [x01, x02, x12, x13],
+        [x02, x03, x13, x23],
+        [x02, x12, x13, x23],
+    ]
+    return numpy.concatenate([numpy.array(c) for c in children], axis=1)
+
+
+@instrument()
+def integrate_adaptive(
+    f,
+    tetras,
+    eps,
+    minimum_tetrahedron_volume=None,
+    scheme1=witherden_vincent_05(),
+    scheme2=witherden_vincent_08(),
+    full_output=False,
+):
+    """Adaptive integration of `f` over the tetrahedra `tetras` (shape (4, ..., 3)).
+
+    Every (sub)tetrahedron is integrated with the pair `scheme1` (degree 5, 14 points)
+    and `scheme2` (degree 8, 46 points), and the difference of the results is taken as
+    the error estimate. All of their points are in the interior, so singularities on
+    the boundary are never evaluated. As long as the summed error estimate of a cell
+    exceeds `eps`, the subtetrahedra of the cell with an error estimate of at least a
+    quarter of the largest one are split into eight. `eps` can be given per cell, i.e.,
+    with the shape of `tetras.shape[1:-1]`. By default, tetrahedra are refined at most
+    ten times.
+
+    Returns the integrals (from `scheme2`) and error estimates for every tetrahedron of
+    `tetras`. Cells which would need subtetrahedra smaller than
+    `minimum_tetrahedron_volume` aren't refined further and a warning is shown. If
+    `full_output` is True, a dictionary with the number of function evaluations, the
+    number of subtetrahedra, the refinement depth and whether the tolerance was met
+    (`converged`) per cell is returned as third value instead.
+    """
+    tetras = numpy.asarray(tetras, dtype=float)
+    cells_shape = tetras.shape[1:-1]
+    tetras = tetras.reshape(4, -1, 3)
+
+    points, weights = _embed(scheme1, scheme2)
+
+    def integrate(tetras):
+        # One evaluation of f for both schemes
+        x = transform(points.T, tetras.T)
+        fx = numpy.asarray(f(x))
+        vol = get_vol(tetras)
+        val1, val2 = numpy.moveaxis(vol[:, None] * numpy.dot(fx, weights.T), -1, 0)
+        return val2, numpy.abs(val2 - val1), vol, None
+
+    def refine(tetras, _):
+        parent = numpy.tile(numpy.arange(tetras.shape[1]), 8)
+        return _refine(tetras), parent
+
+    return integrate_cells(
+        integrate,
+        refine,
+        tetras,
+        cells_shape,
+        eps,
+        minimum_tetrahedron_volume,
+        0.125 ** 10,
+        len(points),
+        "tetrahedra",
+        full_output,
+    )
@@ -1,7 +1,6 @@
-import json
 import os
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import TetrahedronScheme, untangle2
 
 citation = article(
@@ -22,15 +21,17 @@ citation = article(
 def _read(index):
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"vr{index:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    return TetrahedronScheme(
+        f"Vioreanu-Rokhlin {index}", weights, points, degree, citation
+    )
+
 
+def _expand(data):
     degree = data.pop("degree")
     points, weights = untangle2(data)
     weights *= 3.0 / 4.0
-    return TetrahedronScheme(
-        f"Vioreanu-Rokhlin {index}", weights, points, degree, citation
-    )
+    return degree, points, weights
 
 
 def vioreanu_rokhlin_0():
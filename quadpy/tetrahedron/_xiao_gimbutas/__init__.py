@@ -1,9 +1,8 @@
-import json
 import os
 
 import numpy
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import TetrahedronScheme
 
 citation = article(
@@ -24,16 +23,16 @@ citation = article(
 def _read(degree):
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"xg{degree:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    return TetrahedronScheme(
+        f"Xiao-Gimbutas {degree}", weights, points, degree, citation
+    )
 
-    degree = data.pop("degree")
 
+def _expand(data):
     points = numpy.array(data["bary"])
     weights = numpy.array(data["weights"])
-    return TetrahedronScheme(
-        f"Xiao-Gimbutas {degree}", weights, points, degree, citation
-    )
+    return data["degree"], points, weights
 
 
 def xiao_gimbutas_01():
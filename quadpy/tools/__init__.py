@@ -1,13 +1,4 @@
-from .main import (
-    chebyshev,
-    chebyshev_modified,
-    check_coefficients,
-    coefficients_from_gauss,
-    golub_welsch,
-    integrate,
-    scheme_from_rc,
-    stieltjes,
-)
+from .._lazy import lazy_import
 
 __all__ = [
     "golub_welsch",
@@ -19,3 +10,19 @@ __all__ = [
     "check_coefficients",
     "scheme_from_rc",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    attributes={
+        ".main": [
+            "chebyshev",
+            "chebyshev_modified",
+            "check_coefficients",
+            "coefficients_from_gauss",
+            "golub_welsch",
+            "integrate",
+            "scheme_from_rc",
+            "stieltjes",
+        ],
+    },
+)
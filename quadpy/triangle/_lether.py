@@ -11,7 +11,7 @@
 
 import numpy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ..line_segment import gauss_legendre
 from ._helpers import TriangleScheme
 
@@ -28,6 +28,7 @@ citation = article(
 )
 
 
+@cached_scheme
 def lether(n):
     gl = gauss_legendre(n)
 
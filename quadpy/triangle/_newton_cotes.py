@@ -3,7 +3,7 @@ import math
 import numpy
 import sympy
 
-from ..helpers import article
+from ..helpers import article, cached_scheme
 from ._helpers import TriangleScheme
 
 citation = article(
@@ -63,6 +63,7 @@ def _newton_cotes(n, point_fun):
     return points, weights, degree
 
 
+@cached_scheme
 def newton_cotes_closed(n):
     points, weights, degree = _newton_cotes(n, lambda k, n: k / float(n))
     return TriangleScheme(
@@ -70,6 +71,7 @@ def newton_cotes_closed(n):
     )
 
 
+@cached_scheme
 def newton_cotes_open(n):
     points, weights, degree = _newton_cotes(n, lambda k, n: (k + 1) / float(n + 3))
     if n == 0:
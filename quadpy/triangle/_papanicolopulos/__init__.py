@@ -1,7 +1,6 @@
-import json
 import os
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import TriangleScheme, untangle2
 
 citation = article(
@@ -19,12 +18,14 @@ citation = article(
 
 def _read(filename):
     this_dir = os.path.dirname(os.path.realpath(__file__))
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    return weights, points, degree, citation
+
 
+def _expand(data):
     degree = data.pop("degree")
     points, weights = untangle2(data)
-    return weights, points, degree, citation
+    return degree, points, weights
 
 
 def papanicolopulos_sym_0():
@@ -1,6 +1,11 @@
+import heapq
+import warnings
+
 import numpy
 
-from ..nsimplex import get_vol
+from ..helpers.stats import instrument, record_levels
+from ..nsimplex import get_vol, transform
+from ..nsimplex._helpers import _embed
 from ._dunavant import dunavant_05, dunavant_10
 
 
@@ -10,6 +15,40 @@ def _numpy_all_except(a, axis=-1):
     return numpy.all(a, axis=tuple(axes))
 
 
+def _numpy_max_except_last(a):
+    return numpy.max(a, axis=tuple(range(a.ndim - 1)))
+
+
+def _integrate_pair(f, triangles, points, weights, dot):
+    # One evaluation of f for both schemes
+    x = transform(points.T, triangles.T)
+    fx = numpy.asarray(f(x))
+    return numpy.moveaxis(dot(fx, weights.T), -1, 0) * get_vol(triangles)
+
+
+def _refine(triangles):
+    # split the triangles into four #triforce
+    #
+    #         /\
+    #        /__\
+    #       /\  /\
+    #      /__\/__\
+    #
+    midpoints = [
+        0.5 * (triangles[1] + triangles[2]),
+        0.5 * (triangles[2] + triangles[0]),
+        0.5 * (triangles[0] + triangles[1]),
+    ]
+    return numpy.array(
+        [
+            numpy.concatenate([triangles[0], triangles[1], triangles[2], midpoints[0]]),
+            numpy.concatenate([midpoints[1], midpoints[2], midpoints[0], midpoints[1]]),
+            numpy.concatenate([midpoints[2], midpoints[0], midpoints[1], midpoints[2]]),
+        ]
+    )
+
+
+@instrument()
 def integrate_adaptive(
     f,
     triangles,
@@ -18,7 +57,33 @@ def integrate_adaptive(
     scheme1=dunavant_05(),
     scheme2=dunavant_10(),
     dot=numpy.dot,
+    strategy="local",
+    max_num_evaluations=numpy.inf,
+    batch_size=None,
+    full_output=False,
 ):
+    """Adaptive integration of `f` over the union of `triangles`; the difference of the
+    results of `scheme1` and `scheme2` serves as error estimate. Points which the
+    schemes share are evaluated only once: the default pair `dunavant_05` (7 points)
+    and `dunavant_10` (25 points) shares the centroid and needs 31 evaluations per
+    triangle, nested pairs like `dunavant_05` and `cubtri` (19 points) only 19.
+
+    With `strategy="local"`, every triangle whose error estimate exceeds its share of
+    `eps`, `eps * area / total_area`, is split into four in each step. With
+    `strategy="global"`, the triangles are kept in a heap sorted by their error estimate
+    and only the worst ones are split until the summed error estimate is below `eps`.
+    In each step, these are the triangles with an error estimate of at least a quarter
+    of the largest one, but not more than `batch_size`. The global strategy returns the
+    more accurate `scheme2` value.
+
+    Refinement stops when the next step would exceed `max_num_evaluations` evaluations
+    of `f` (integration points) or create triangles smaller than
+    `minimum_triangle_area`. The best value and error estimate found so far are then
+    returned, with a warning. If `full_output` is True, a dictionary with the number of
+    function evaluations, the number of triangles, and whether the tolerance was met
+    (`converged`) is returned as third value instead.
+    """
+    assert strategy in ["local", "global"], f"Illegal strategy {strategy}."
     sumfun = numpy.sum
 
     triangles = numpy.array(triangles)
@@ -32,59 +97,172 @@ def integrate_adaptive(
     if minimum_triangle_area is None:
         minimum_triangle_area = total_area * 0.25 ** 10
 
-    val1 = scheme1.integrate(f, triangles, dot=dot)
-    val2 = scheme2.integrate(f, triangles, dot=dot)
+    # If the points of scheme1 are among those of scheme2 (or vice versa), they are
+    # evaluated only once.
+    points, weights = _embed(scheme1, scheme2)
+    val1, val2 = _integrate_pair(f, triangles, points, weights, dot)
     error_estimate = abs(val1 - val2)
+    num_evaluations = len(points) * triangles.shape[-2]
 
-    # Mark intervals with acceptable approximations. For this, take all()
-    # across every dimension except the last one, which is the interval index.
-    is_good = _numpy_all_except(error_estimate < eps * areas / total_area, axis=-1)
-
-    # add values from good intervals to sum
-    quad_sum = sumfun(val1[..., is_good], axis=-1)
-    global_error_estimate = sumfun(error_estimate[..., is_good], axis=-1)
-
-    is_bad = numpy.logical_not(is_good)
-    while any(is_bad):
-        # split the bad triangles into four #triforce
-        #
-        #         /\
-        #        /__\
-        #       /\  /\
-        #      /__\/__\
-        #
-        triangles = triangles[..., is_bad, :]
-        midpoints = [
-            0.5 * (triangles[1] + triangles[2]),
-            0.5 * (triangles[2] + triangles[0]),
-            0.5 * (triangles[0] + triangles[1]),
-        ]
-        triangles = numpy.array(
-            [
-                numpy.concatenate(
-                    [triangles[0], triangles[1], triangles[2], midpoints[0]]
-                ),
-                numpy.concatenate(
-                    [midpoints[1], midpoints[2], midpoints[0], midpoints[1]]
-                ),
-                numpy.concatenate(
-                    [midpoints[2], midpoints[0], midpoints[1], midpoints[2]]
-                ),
-            ]
+    if strategy == "global":
+        quad_sum, global_error_estimate, info = _integrate_global(
+            f,
+            triangles,
+            val2,
+            error_estimate,
+            eps,
+            minimum_triangle_area,
+            points,
+            weights,
+            dot,
+            max_num_evaluations,
+            batch_size,
+            num_evaluations,
         )
-        areas = get_vol(triangles)
-        assert all(areas > minimum_triangle_area)
-
-        # compute values and error estimates for the new intervals
-        val1 = scheme1.integrate(f, triangles, dot=dot)
-        val2 = scheme2.integrate(f, triangles, dot=dot)
-        error_estimate = abs(val1 - val2)
-
-        # mark good intervals, gather values and error estimates
+    else:
+        # Mark intervals with acceptable approximations. For this, take all()
+        # across every dimension except the last one, which is the interval index.
         is_good = _numpy_all_except(error_estimate < eps * areas / total_area, axis=-1)
+
         # add values from good intervals to sum
-        quad_sum += sumfun(val1[..., is_good], axis=-1)
-        global_error_estimate += sumfun(error_estimate[..., is_good], axis=-1)
+        quad_sum = sumfun(val1[..., is_good], axis=-1)
+        global_error_estimate = sumfun(error_estimate[..., is_good], axis=-1)
+        num_triangles = numpy.count_nonzero(is_good)
+        level = 0
+
         is_bad = numpy.logical_not(is_good)
+        while any(is_bad):
+            triangles = triangles[..., is_bad, :]
+            new_evaluations = 4 * len(points) * triangles.shape[-2]
+            if num_evaluations + new_evaluations > max_num_evaluations or numpy.any(
+                get_vol(triangles) / 4 <= minimum_triangle_area
+            ):
+                # Give up, take what we have.
+                quad_sum += sumfun(val1[..., is_bad], axis=-1)
+                global_error_estimate += sumfun(error_estimate[..., is_bad], axis=-1)
+                num_triangles += numpy.count_nonzero(is_bad)
+                break
+
+            triangles = _refine(triangles)
+            areas = get_vol(triangles)
+            num_evaluations += new_evaluations
+            level += 1
+
+            # compute values and error estimates for the new intervals
+            val1, val2 = _integrate_pair(f, triangles, points, weights, dot)
+            error_estimate = abs(val1 - val2)
+
+            # mark good intervals, gather values and error estimates
+            is_good = _numpy_all_except(
+                error_estimate < eps * areas / total_area, axis=-1
+            )
+            # add values from good intervals to sum
+            quad_sum += sumfun(val1[..., is_good], axis=-1)
+            global_error_estimate += sumfun(error_estimate[..., is_good], axis=-1)
+            num_triangles += numpy.count_nonzero(is_good)
+            is_bad = numpy.logical_not(is_good)
+
+        record_levels(level)
+        info = {
+            "num_evaluations": num_evaluations,
+            "num_triangles": num_triangles,
+            "converged": not numpy.any(is_bad),
+        }
 
+    if full_output:
+        return quad_sum, global_error_estimate, info
+    if not info["converged"]:
+        warnings.warn(
+            f"Tolerance {eps} not reached "
+            f"(error estimate: {global_error_estimate}, "
+            f"evaluations: {info['num_evaluations']})."
+        )
     return quad_sum, global_error_estimate
+
+
+def _integrate_global(
+    f,
+    triangles,
+    val,
+    error_estimate,
+    eps,
+    minimum_triangle_area,
+    points,
+    weights,
+    dot,
+    max_num_evaluations,
+    batch_size,
+    num_evaluations,
+):
+    # All triangles are stored in flat arrays, `alive` marks those that haven't been
+    # split yet.
+    alive = numpy.ones(triangles.shape[-2], dtype=bool)
+    level = numpy.zeros(triangles.shape[-2], dtype=int)
+    keys = _numpy_max_except_last(error_estimate)
+    heap = list(zip(-keys, range(len(keys))))
+    heapq.heapify(heap)
+
+    total_val = numpy.sum(val, axis=-1)
+    total_err = numpy.sum(error_estimate, axis=-1)
+    # the error of the triangles which are too small to be split
+    final_err = numpy.zeros(total_err.shape)
+
+    while numpy.any(total_err > eps) and heap:
+        # Pop the worst triangles.
+        max_key = -heap[0][0]
+        idx = []
+        while heap and -heap[0][0] >= 0.25 * max_key:
+            if batch_size is not None and len(idx) >= batch_size:
+                break
+            idx.append(heapq.heappop(heap)[1])
+        idx = numpy.array(idx)
+
+        # Triangles which are too small are not split (and never looked at again).
+        is_final = get_vol(triangles[..., idx, :]) / 4 <= minimum_triangle_area
+        final_err += numpy.sum(error_estimate[..., idx[is_final]], axis=-1)
+        if numpy.any(final_err > eps):
+            # The tolerance can't be reached anymore.
+            break
+        idx = idx[~is_final]
+        if len(idx) == 0:
+            continue
+
+        new_evaluations = 4 * len(points) * len(idx)
+        if num_evaluations + new_evaluations > max_num_evaluations:
+            break
+        num_evaluations += new_evaluations
+
+        new_triangles = _refine(triangles[..., idx, :])
+        val1, new_val = _integrate_pair(f, new_triangles, points, weights, dot)
+        new_err = abs(val1 - new_val)
+
+        # Replace the contributions of the split triangles by those of their children.
+        total_val += numpy.sum(new_val, axis=-1) - numpy.sum(val[..., idx], axis=-1)
+        total_err += numpy.sum(new_err, axis=-1) - numpy.sum(
+            error_estimate[..., idx], axis=-1
+        )
+
+        n = alive.shape[0]
+        alive[idx] = False
+        triangles = numpy.concatenate([triangles, new_triangles], axis=-2)
+        val = numpy.concatenate([val, new_val], axis=-1)
+        error_estimate = numpy.concatenate([error_estimate, new_err], axis=-1)
+        alive = numpy.concatenate([alive, numpy.ones(new_triangles.shape[-2], bool)])
+        level = numpy.concatenate([level, numpy.tile(level[idx] + 1, 4)])
+
+        keys = _numpy_max_except_last(new_err)
+        for key, i in zip(keys, range(n, alive.shape[0])):
+            heapq.heappush(heap, (-key, i))
+
+    record_levels(numpy.max(level))
+
+    # Sum up once more to get rid of the accumulated round-off from the updates.
+    total_val = numpy.sum(val[..., alive], axis=-1)
+    total_err = numpy.sum(error_estimate[..., alive], axis=-1)
+
+    info = {
+        "num_evaluations": num_evaluations,
+        "num_triangles": numpy.count_nonzero(alive),
+        "converged": bool(numpy.all(total_err <= eps)),
+    }
+    return total_val, total_err, info
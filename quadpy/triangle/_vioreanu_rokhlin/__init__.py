@@ -1,7 +1,6 @@
-import json
 import os
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import TriangleScheme, untangle2
 
 citation = article(
@@ -25,15 +24,17 @@ def _read(index):
     #  * it's _much_ faster to parse <https://stackoverflow.com/a/50685946/353337>
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"vr{index:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    return TriangleScheme(
+        f"Vioreanu-Rokhlin {index}", weights, points, degree, citation
+    )
+
 
+def _expand(data):
     degree = data.pop("degree")
     points, weights = untangle2(data)
     weights /= 2
-    return TriangleScheme(
-        f"Vioreanu-Rokhlin {index}", weights, points, degree, citation
-    )
+    return degree, points, weights
 
 
 def vioreanu_rokhlin_00():
@@ -1,7 +1,6 @@
-import json
 import os
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import TriangleScheme, untangle2
 
 citation = article(
@@ -23,13 +22,14 @@ citation = article(
 def _read(index):
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"wx{index:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
-    degree = data.pop("degree")
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    return TriangleScheme(f"Wandzura-Xiao {index}", weights, points, degree, citation)
+
 
-    data = data
+def _expand(data):
+    degree = data.pop("degree")
     points, weights = untangle2(data)
-    return TriangleScheme(f"Wandzura-Xiao {index}", weights, points, degree, citation)
+    return degree, points, weights
 
 
 def wandzura_xiao_1():
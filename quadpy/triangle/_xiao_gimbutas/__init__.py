@@ -1,7 +1,6 @@
-import json
 import os
 
-from ...helpers import article
+from ...helpers import article, read_table
 from .._helpers import TriangleScheme, untangle2
 
 citation = article(
@@ -23,13 +22,15 @@ citation = article(
 def _read(degree):
     this_dir = os.path.dirname(os.path.realpath(__file__))
     filename = f"xg{degree:02d}.json"
-    with open(os.path.join(this_dir, filename), "r") as f:
-        data = json.load(f)
+    degree, points, weights = read_table(os.path.join(this_dir, filename), _expand)
+    name = f"Xiao-Gimbutas {degree}"
+    return TriangleScheme(name, weights, points, degree, citation)
+
 
+def _expand(data):
     degree = data.pop("degree")
-    name = f"Xiao-Gimbutas {degree}"
     points, weights = untangle2(data)
-    return TriangleScheme(name, weights, points, degree, citation)
+    return degree, points, weights
 
 
 def xiao_gimbutas_01():
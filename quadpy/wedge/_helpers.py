@@ -1,6 +1,8 @@
 import numpy
 
+from .. import helpers
 from ..helpers import backend_to_function
+from ..helpers.stats import instrument
 
 
 class WedgeScheme:
@@ -24,12 +26,23 @@ class WedgeScheme:
             self.points_symbolic = points
         return
 
+    @instrument()
     def integrate(self, f, wedge, dot=numpy.dot):
         flt = numpy.vectorize(float)
         x = _transform(flt(self.points).T, wedge)
         det = _get_detJ(flt(self.points).T, wedge)
         return dot(f(x) * abs(det), flt(self.weights))
 
+    def precompute(self, wedge, dtype=numpy.float64):
+        """Returns the points and weights of the scheme mapped onto the wedges `wedge`, see
+        `quadpy.helpers.MappedScheme`. With `dtype=numpy.float32`, the tables take half
+        the memory.
+        """
+        xi = numpy.asarray(self.points, dtype=float).T
+        x = _transform(xi, wedge)
+        weights = abs(_get_detJ(xi, wedge)) * self.weights
+        return helpers.MappedScheme(x.astype(dtype), weights.astype(dtype))
+
     def show(
         self,
         wedge=numpy.array(
@@ -107,3 +120,37 @@ def _get_detJ(xi, wedge):
         - J2[2] * J0[1] * J1[0]
     )
     return det
+
+
+def get_good_scheme(degree):
+    """Returns the cheapest scheme with degree at least `degree`, see
+    `quadpy.helpers.get_good_scheme()`.
+    """
+    return helpers.get_good_scheme("wedge", degree)
+
+
+def integrate_mesh(
+    f,
+    points,
+    cells,
+    scheme,
+    chunk_size=2 ** 14,
+    reduce="cell",
+    workers=1,
+    pool="thread",
+):
+    """Integrates `f` over a mesh of wedges with the vertex indices `cells`, in chunks of
+    `chunk_size` cells, see `quadpy.helpers.integrate_mesh()`. The vertices of each cell
+    are the bottom triangle, then the top triangle.
+    """
+    return helpers.integrate_mesh(
+        f,
+        points,
+        cells,
+        scheme,
+        (2, 3),
+        chunk_size=chunk_size,
+        reduce=reduce,
+        workers=workers,
+        pool=pool,
+    )
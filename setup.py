@@ -1,4 +1,27 @@
+import os
+import sys
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPy(build_py):
+    """Also builds the index of `get_good_scheme()`, quadpy/_good_schemes.json, from
+    the schemes in the source tree. For editable installs, it's written to the source
+    tree.
+    """
+
+    def run(self):
+        super().run()
+        here = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, here)
+        from quadpy.helpers.good_schemes import build_good_scheme_index
+
+        target = here if getattr(self, "editable_mode", False) else self.build_lib
+        build_good_scheme_index(
+            filename=os.path.join(target, "quadpy", "_good_schemes.json")
+        )
+
 
 if __name__ == "__main__":
-    setup()
+    setup(cmdclass={"build_py": BuildPy})
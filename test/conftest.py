@@ -0,0 +1,31 @@
+import pytest
+
+from quadpy.helpers import good_schemes
+
+
+@pytest.fixture
+def good_scheme_index(request, monkeypatch):
+    """The index of `get_good_scheme()`. In a checkout without the index (it is built
+    with the package, see setup.py, or with `make store`), the part for the domain of
+    the test module is built; `build_index()` caches it for the session.
+    """
+    if good_schemes._load_index() is not None:
+        return
+    domain = request.module.__name__[len("test_") :]
+    dims = good_schemes._dims if domain in good_schemes._dim_domains else [None]
+    index = {domain: {str(n): good_schemes.build_index(domain, n) for n in dims}}
+    monkeypatch.setattr(good_schemes, "_load_index", lambda: index)
+
+
+@pytest.fixture
+def no_sympy(monkeypatch):
+    """Makes every use of the sympy functions which the scheme constructors call fail,
+    to check that the numeric construction doesn't go through sympy.
+    """
+    import sympy
+
+    def fail(*args, **kwargs):
+        raise AssertionError("sympy was used")
+
+    for name in ["Rational", "S", "cos", "gamma", "pi", "prod", "sin", "sqrt"]:
+        monkeypatch.setattr(sympy, name, fail)
@@ -85,6 +85,106 @@ def integrate_monomial_over_enr(k):
     )
 
 
+def check_ridge_exactness(integrate, moments, dim, degree, tol=1.0e-11):
+    """Checks that `integrate` is exact for the powers ell(x)**k, k <= degree, of the
+    affine function ell(x) = a.x + b with random `a`. The error of a scheme for them is
+    a polynomial in `a` which only vanishes identically if the scheme is exact for all
+    polynomials of that degree. Unlike check_degree(), the cost doesn't grow with the
+    number of monomials, so this works in high dimensions. `moments(a, b, degree)`
+    returns the exact integrals.
+    """
+    a = numpy.random.RandomState(0).uniform(-1.0, 1.0, dim) / math.sqrt(dim)
+    b = 0.25
+
+    def f(x):
+        ell = numpy.tensordot(a, x, axes=1) + b
+        return numpy.array([ell ** k for k in range(degree + 1)])
+
+    exact = moments(a, b, degree)
+    assert numpy.all(abs(integrate(f) - exact) <= tol * abs(exact))
+
+
+def _power_series_product(factors, degree):
+    out = numpy.zeros(degree + 1)
+    out[0] = 1.0
+    for factor in factors:
+        out = numpy.convolve(out, factor)[: degree + 1]
+    return out
+
+
+def _exp_series(b, degree):
+    return numpy.array([b ** k / math.factorial(k) for k in range(degree + 1)])
+
+
+def _even_series(coefficients, degree):
+    # sum_j coefficients[j] t**(2j)
+    out = numpy.zeros(degree + 1)
+    out[::2] = coefficients[: len(out[::2])]
+    return out
+
+
+def ncube_ridge_moments(a, b, degree):
+    """The integrals of (a.x + b)**k over [-1, 1]^n from the generating function
+    exp(t*b) * prod_i 2*sinh(t*a_i) / (t*a_i).
+    """
+    j = numpy.arange(degree // 2 + 1)
+    factors = [
+        _even_series(
+            [2 * ai ** (2 * jj) / math.factorial(2 * jj + 1) for jj in j], degree
+        )
+        for ai in a
+    ]
+    c = _power_series_product(factors + [_exp_series(b, degree)], degree)
+    return c * [math.factorial(k) for k in range(degree + 1)]
+
+
+def enr2_ridge_moments(a, b, degree):
+    """The integrals of (a.x + b)**k with the weight exp(-|x|^2) from the generating
+    function pi**(n/2) * exp(t**2 * |a|^2 / 4 + t*b).
+    """
+    s = numpy.dot(a, a) / 4
+    j = range(degree // 2 + 1)
+    factor = _even_series([s ** jj / math.factorial(jj) for jj in j], degree)
+    c = _power_series_product([factor, _exp_series(b, degree)], degree)
+    return math.pi ** (len(a) / 2) * c * [math.factorial(k) for k in range(degree + 1)]
+
+
+def nball_ridge_moments(a, b, degree):
+    """The integrals of (a.x + b)**k over the unit ball, with
+    int x_1**(2j) = pi**((n-1)/2) * Gamma(j + 1/2) / Gamma(n/2 + j + 1).
+    """
+    n = len(a)
+    r2 = numpy.dot(a, a)
+    j = range(degree // 2 + 1)
+    factor = _even_series(
+        [
+            r2 ** jj
+            * math.pi ** ((n - 1) / 2)
+            * math.gamma(jj + 0.5)
+            / math.gamma(n / 2 + jj + 1)
+            / math.factorial(2 * jj)
+            for jj in j
+        ],
+        degree,
+    )
+    c = _power_series_product([factor, _exp_series(b, degree)], degree)
+    return c * [math.factorial(k) for k in range(degree + 1)]
+
+
+def nsimplex_ridge_moments(a, b, degree):
+    """The integrals of (a.x + b)**k over the unit simplex, k!/(k+n)! times the
+    complete homogeneous symmetric polynomial of degree k in the values at the vertices.
+    """
+    n = len(a)
+    vertex_values = numpy.concatenate([[b], a + b])
+    h = _power_series_product(
+        [v ** numpy.arange(degree + 1) for v in vertex_values], degree
+    )
+    return numpy.array(
+        [math.factorial(k) / math.factorial(k + n) * h[k] for k in range(degree + 1)]
+    )
+
+
 def find_equal(schemes):
     tol = 1.0e-13
     n = len(schemes)
@@ -0,0 +1,86 @@
+import numpy
+import pytest
+
+import quadpy
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_polynomial(n):
+    # degree 5 is integrated exactly without refinement
+    cube = quadpy.ncube.ncube_points(*(n * [[0.0, 1.0]]))
+    val, err, info = quadpy.ncube.integrate_adaptive(
+        lambda x: x[0] ** 5 + x[1] ** 3, cube, 1.0e-10, full_output=True
+    )
+    assert abs(val - (1 / 6 + 1 / 4)) < 1.0e-14
+    assert info["num_cubes"] == 1
+    assert info["num_evaluations"] == 2 ** n + 2 * n ** 2 + 2 * n + 1
+
+
+def test_non_affine():
+    quad = numpy.array([[[0.0, 0.0], [0.0, 1.0]], [[1.0, 0.0], [2.0, 3.0]]])
+    val, _ = quadpy.quadrilateral.integrate_adaptive(
+        lambda x: numpy.ones(x.shape[1:]), quad, 1.0e-10
+    )
+    assert abs(val - 2.5) < 1.0e-14
+
+
+def test_singular():
+    # two cells with their own tolerances, two components
+    quad = quadpy.quadrilateral.rectangle_points([0.0, 1.0], [0.0, 1.0])
+    quads = numpy.stack([quad, quad], axis=-2)
+    eps = [1.0e-4, 1.0e-8]
+
+    def f(x):
+        return [numpy.sqrt(x[0] + x[1]), numpy.sqrt(x[0])]
+
+    val, err, info = quadpy.quadrilateral.integrate_adaptive(
+        f, quads, eps, full_output=True
+    )
+    exact = [[4 * (4 * numpy.sqrt(2) - 2) / 15], [2 / 3]]
+    assert val.shape == (2, 2)
+    assert numpy.all(numpy.abs(val - exact) < eps)
+    assert numpy.all(err < eps)
+    assert info["num_cubes"][0] < info["num_cubes"][1]
+
+
+def test_anisotropic():
+    # The integrand is only rough in z, so the cubes are only bisected in z.
+    hexa = quadpy.hexahedron.cube_points([0.0, 1.0], [0.0, 1.0], [0.0, 1.0])
+    val, err, info = quadpy.hexahedron.integrate_adaptive(
+        lambda x: numpy.sqrt(x[2]) + x[0] ** 2, hexa, 1.0e-4, full_output=True
+    )
+    assert abs(val - 1.0) < 1.0e-4
+    assert info["num_cubes"] == info["depth"] + 1
+
+
+def test_minimum_volume():
+    # The singularity at the origin can't be resolved with so few bisections.
+    quad = quadpy.quadrilateral.rectangle_points([0.0, 1.0], [0.0, 1.0])
+
+    def f(x):
+        return 1.0 / (x[0] + x[1]) ** 1.9
+
+    with pytest.warns(UserWarning, match="1 of 1 cells"):
+        quadpy.quadrilateral.integrate_adaptive(
+            f, quad, 1.0e-10, minimum_cube_volume=1.0e-3
+        )
+
+    val, err, info = quadpy.quadrilateral.integrate_adaptive(
+        f, quad, 1.0e-10, minimum_cube_volume=1.0e-3, full_output=True
+    )
+    assert not info["converged"]
+    assert err > 1.0e-10
+    # cubes of volume 2^-10 would be smaller than the minimum
+    assert info["depth"] == 9
+
+
+def test_bisect():
+    cube = numpy.random.rand(2, 2, 2, 1, 3)
+    for axis in range(3):
+        children = quadpy.ncube._tools._bisect(cube, axis)
+        assert children.shape == (2, 2, 2, 2, 3)
+        # the centers of the children are at -1/2 and +1/2 in the parent
+        xi = numpy.zeros((3, 2))
+        xi[axis] = [-0.5, 0.5]
+        centers = quadpy.ncube.transform(numpy.zeros((3, 1)), children)[0]
+        assert numpy.allclose(centers, quadpy.ncube.transform(xi, cube)[:, 0])
@@ -0,0 +1,75 @@
+import numpy
+import pytest
+
+import quadpy
+
+
+def test_simple():
+    # polynomials of degree 5 need no refinement
+    tetra = numpy.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    )
+    val, err, info = quadpy.tetrahedron.integrate_adaptive(
+        lambda x: x[0] ** 3, tetra, 1.0e-10, full_output=True
+    )
+    assert abs(val - 1.0 / 120.0) < 1.0e-14
+    assert info["depth"] == 0
+    assert info["num_evaluations"] == 60
+
+
+def test_singular():
+    # 1/sqrt(x + y + z) over the unit tetrahedron is 1/5; it's singular at the origin.
+    tetra = numpy.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    )
+    # three copies with different tolerances
+    tetras = numpy.stack(3 * [tetra], axis=1)
+    eps = [1.0e-3, 1.0e-5, 1.0e-7]
+
+    def f(x):
+        s = 1.0 / numpy.sqrt(numpy.sum(x, axis=0))
+        return [s, 2 * s]
+
+    val, err, info = quadpy.tetrahedron.integrate_adaptive(
+        f, tetras, eps, full_output=True
+    )
+    assert val.shape == (2, 3)
+    assert numpy.all(numpy.abs(val - [[0.2], [0.4]]) < 2 * numpy.array(eps))
+    assert numpy.all(err < eps)
+    # tighter tolerances need more refinement
+    assert numpy.all(numpy.diff(info["depth"]) >= 0)
+    assert numpy.all(numpy.diff(info["num_evaluations"]) > 0)
+    assert numpy.all(
+        info["num_evaluations"] == 60 * (8 * info["num_tetrahedra"] - 1) / 7
+    )
+
+
+def test_refine():
+    tetra = numpy.random.rand(4, 1, 3)
+    children = quadpy.tetrahedron._tools._refine(tetra)
+    vol = quadpy.nsimplex.get_vol(children)
+    assert numpy.all(numpy.abs(vol - quadpy.nsimplex.get_vol(tetra) / 8) < 1.0e-14)
+
+
+def test_minimum_volume():
+    tetra = numpy.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    )
+    tetras = numpy.stack([tetra, tetra], axis=1)
+
+    def f(x):
+        return 1.0 / numpy.sum(x, axis=0) ** 2.9
+
+    with pytest.warns(UserWarning, match="1 of 2 cells") as record:
+        quadpy.tetrahedron.integrate_adaptive(f, tetras, [1.0e-10, 1.0e10])
+    # a short message, also for many cells
+    assert "full_output" in str(record[0].message)
+    assert len(str(record[0].message)) < 200
+
+    val, err, info = quadpy.tetrahedron.integrate_adaptive(
+        f, tetras, [1.0e-10, 1.0e10], full_output=True
+    )
+    assert list(info["converged"]) == [False, True]
+    assert err[0] > 1.0e-10
+    # refined at most ten times
+    assert info["depth"][0] == 10
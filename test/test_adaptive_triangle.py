@@ -1,3 +1,4 @@
+import numpy
 import pytest
 from numpy import cos, exp, pi, sin
 
@@ -5,11 +6,13 @@ import quadpy
 
 
 @pytest.mark.parametrize("k", range(1, 6))
-def test_simple(k):
+@pytest.mark.parametrize("strategy", ["local", "global"])
+def test_simple(k, strategy):
     val, _ = quadpy.triangle.integrate_adaptive(
         lambda x: sin(k * pi * x[0]) * sin(k * pi * x[1]),
         [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
         1.0e-10,
+        strategy=strategy,
     )
     exact = (2 - pi * k * sin(pi * k) - 2 * cos(pi * k)) / (2 * pi ** 2 * k ** 2)
 
@@ -42,6 +45,92 @@ def test_vector(k=1):
     return
 
 
+def test_singular():
+    # The local strategy refines around the singularity until the triangles are too
+    # small, the global one converges.
+    def f(x):
+        return 1.0 / numpy.sqrt(x[0] + x[1])
+
+    triangle = [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+    val, err, info = quadpy.triangle.integrate_adaptive(
+        f, triangle, 1.0e-6, strategy="local", full_output=True
+    )
+    assert not info["converged"]
+    num_evaluations = info["num_evaluations"]
+
+    val, err, info = quadpy.triangle.integrate_adaptive(
+        f, triangle, 1.0e-6, strategy="global", full_output=True
+    )
+    assert info["converged"]
+    assert err < 1.0e-6
+    assert abs(val - 2 / 3) < 1.0e-6
+    assert info["num_evaluations"] < num_evaluations
+
+
+def test_budget():
+    def f(x):
+        return 1.0 / numpy.sqrt(x[0] + x[1])
+
+    triangle = [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+    val, err, info = quadpy.triangle.integrate_adaptive(
+        f,
+        triangle,
+        1.0e-8,
+        strategy="global",
+        max_num_evaluations=1000,
+        full_output=True,
+    )
+    assert not info["converged"]
+    assert info["num_evaluations"] <= 1000
+    assert abs(val - 2 / 3) < err
+
+    with pytest.warns(UserWarning):
+        quadpy.triangle.integrate_adaptive(
+            f, triangle, 1.0e-8, strategy="global", max_num_evaluations=1000
+        )
+
+
+def test_nested():
+    # The points of dunavant_05 are among those of cubtri, so every triangle costs
+    # only the 19 evaluations of cubtri.
+    scheme1 = quadpy.triangle.dunavant_05()
+    scheme2 = quadpy.triangle.cubtri()
+    _, _, info = quadpy.triangle.integrate_adaptive(
+        lambda x: exp(x[0]) * sin(pi * x[1]),
+        [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+        1.0e-10,
+        scheme1=scheme1,
+        scheme2=scheme2,
+        strategy="global",
+        full_output=True,
+    )
+    assert info["converged"]
+    # root triangle plus four children per split
+    assert info["num_evaluations"] % len(scheme2.weights) == 0
+    assert info["num_evaluations"] == len(scheme2.weights) * (
+        1 + 4 * (info["num_triangles"] - 1) // 3
+    )
+
+    triangles = numpy.array(
+        [[[0.0, 0.0], [0.5, 0.0]], [[1.0, 0.0], [0.0, 1.0]], [[0.0, 1.0], [0.0, 0.0]],]
+    )
+    points, weights = quadpy.nsimplex._helpers._embed(scheme1, scheme2)
+    assert len(points) == len(scheme2.weights)
+    x = quadpy.nsimplex.transform(points.T, triangles.T)
+    vals = numpy.dot(numpy.exp(x[0]), weights.T).T * quadpy.nsimplex.get_vol(triangles)
+    assert numpy.allclose(vals[0], scheme1.integrate(lambda x: exp(x[0]), triangles))
+    assert numpy.allclose(vals[1], scheme2.integrate(lambda x: exp(x[0]), triangles))
+
+
+def test_default_pair():
+    # dunavant_05 and dunavant_10 only share the centroid: 7 + 25 - 1 points
+    points, weights = quadpy.nsimplex._helpers._embed(
+        quadpy.triangle.dunavant_05(), quadpy.triangle.dunavant_10()
+    )
+    assert len(points) == 31
+    assert numpy.allclose(numpy.sum(weights, axis=1), 1.0)
+
+
 if __name__ == "__main__":
     # test_simple(1.1)
     test_vector(1.1)
@@ -0,0 +1,112 @@
+import copy
+import pickle
+
+import numpy
+import pytest
+from mpmath import mp
+
+import quadpy
+
+
+def test_hits_misses():
+    cache = quadpy.helpers.scheme_cache
+    cache.clear()
+
+    s0 = quadpy.line_segment.gauss_legendre(5)
+    s1 = quadpy.line_segment.gauss_legendre(5)
+    s2 = quadpy.line_segment.gauss_legendre(5, mode="numpy")
+    assert s0 is s1
+    assert s0 is s2
+    info = cache.info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.currsize == 1
+
+    # different argument, different entry
+    quadpy.line_segment.gauss_legendre(6)
+    assert cache.info().currsize == 2
+
+    cache.clear()
+    assert cache.info() == (0, 0, cache.maxsize, 0)
+    assert quadpy.line_segment.gauss_legendre(5) is not s0
+
+
+def test_read_only():
+    quadpy.helpers.scheme_cache.clear()
+    scheme = quadpy.nsimplex.grundmann_moeller(3, 2)
+    with pytest.raises(ValueError):
+        scheme.weights[0] = 1.0
+    with pytest.raises(ValueError):
+        scheme.points *= 2
+
+    # the scheme object itself is shared, too
+    scheme = quadpy.line_segment.gauss_legendre(5)
+    with pytest.raises(AttributeError):
+        scheme.degree = 3
+    with pytest.raises(AttributeError):
+        scheme.points = numpy.zeros(5)
+    with pytest.raises(AttributeError):
+        del scheme.name
+    assert quadpy.line_segment.gauss_legendre(5).degree == 9
+
+    # copies and pickles can be modified
+    modified = copy.copy(scheme)
+    modified.degree = 3
+    assert type(modified) is quadpy.line_segment._helpers.LineSegmentScheme
+    pickle.loads(pickle.dumps(scheme)).degree = 3
+    assert scheme.degree == 9
+
+
+def test_lru():
+    cache = quadpy.helpers.scheme_cache
+    maxsize = cache.maxsize
+    cache.clear()
+    cache.maxsize = 2
+
+    s1 = quadpy.line_segment.gauss_kronrod(1)
+    quadpy.line_segment.gauss_kronrod(2)
+    # touch 1, so 2 is the least recently used
+    quadpy.line_segment.gauss_kronrod(1)
+    quadpy.line_segment.gauss_kronrod(3)
+    assert cache.info().currsize == 2
+    assert quadpy.line_segment.gauss_kronrod(1) is s1
+    assert cache.info().hits == 2
+
+    cache.maxsize = 0
+    assert cache.info().currsize == 0
+    s1 = quadpy.line_segment.gauss_kronrod(1)
+    assert quadpy.line_segment.gauss_kronrod(1) is not s1
+
+    cache.maxsize = maxsize
+    cache.clear()
+
+
+def test_mpmath_precision():
+    quadpy.helpers.scheme_cache.clear()
+    with mp.workdps(15):
+        s15 = quadpy.line_segment.chebyshev_gauss_1(3, mode="mpmath")
+    with mp.workdps(50):
+        s50 = quadpy.line_segment.chebyshev_gauss_1(3, mode="mpmath")
+        assert s50 is not s15
+        assert abs(s50.points[0] - mp.sqrt(3) / 2) < mp.mpf(10) ** -49
+        assert quadpy.line_segment.chebyshev_gauss_1(3, mode="mpmath") is s50
+
+
+def test_unhashable():
+    class Scheme:
+        def __init__(self, points):
+            self.points = points
+
+    @quadpy.helpers.cached_scheme
+    def scheme(a):
+        return Scheme(a)
+
+    quadpy.helpers.scheme_cache.clear()
+    # array arguments bypass the cache
+    s = scheme(numpy.array([0.0]))
+    assert s.points.flags.writeable
+    assert quadpy.helpers.scheme_cache.info().currsize == 0
+
+
+if __name__ == "__main__":
+    test_lru()
@@ -2,7 +2,12 @@ import numpy
 import pytest
 
 import quadpy
-from helpers import check_degree, integrate_monomial_over_enr2
+from helpers import (
+    check_degree,
+    check_ridge_exactness,
+    enr2_ridge_moments,
+    integrate_monomial_over_enr2,
+)
 
 
 @pytest.mark.parametrize(
@@ -62,6 +67,38 @@ def test_scheme(scheme, tol=1.0e-14):
     return
 
 
+@pytest.mark.parametrize(
+    "scheme,n",
+    [
+        (scheme, n)
+        for scheme in [
+            quadpy.enr2.stroud_secrest_1,
+            quadpy.enr2.stroud_secrest_2,
+            quadpy.enr2.stroud_secrest_4,
+        ]
+        for n in range(10, 21)
+    ]
+    # These have O(2**n) points
+    + [
+        (scheme, n)
+        for scheme in [
+            quadpy.enr2.stroud_1967_7_4,
+            quadpy.enr2.stroud_enr2_5_3,
+            quadpy.enr2.stroud_enr2_5_4,
+            quadpy.enr2.stroud_enr2_5_5a,
+            quadpy.enr2.stroud_enr2_5_6,
+        ]
+        for n in range(10, 13)
+    ],
+)
+def test_numeric_construction(scheme, n, no_sympy):
+    # float64 all the way, without sympy, and still exact
+    scheme = scheme(n)
+    assert scheme.points.dtype == numpy.float64
+    assert scheme.weights.dtype == numpy.float64
+    check_ridge_exactness(scheme.integrate, enr2_ridge_moments, n, scheme.degree)
+
+
 if __name__ == "__main__":
     dim_ = 5
     # quadpy.e3r2.show(quadpy.enr2.Stroud(dim_, '5-1a'), backend='vtk')
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import quadpy
+
+
+def _run(code):
+    # run in a fresh interpreter so that nothing has been imported yet
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE, env=env
+    )
+    return out.stdout.decode().split()
+
+
+def test_heavy_modules_not_imported():
+    # the heavy dependencies are only loaded when needed
+    modules = _run("import sys, quadpy\nprint(*sys.modules)")
+    for module in ["sympy", "mpmath", "orthopy", "scipy", "matplotlib"]:
+        assert module not in modules
+
+
+def test_numeric_scheme_without_sympy():
+    code = (
+        "import sys, quadpy\n"
+        "quadpy.line_segment.gauss_legendre(5)\n"
+        "quadpy.line_segment.chebyshev_gauss_1(5)\n"
+        "print(*sys.modules)"
+    )
+    modules = _run(code)
+    assert "sympy" not in modules
+    assert "mpmath" not in modules
+
+
+@pytest.mark.parametrize("name", quadpy.__all__)
+def test_lazy_attributes(name):
+    obj = getattr(quadpy, name)
+    assert name in dir(quadpy)
+    # all names of the domain packages resolve
+    for attr in getattr(obj, "__all__", []):
+        assert getattr(obj, attr) is not None
+        assert attr in dir(obj)
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        quadpy.triangle.no_such_scheme
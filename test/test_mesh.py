@@ -0,0 +1,157 @@
+import itertools
+
+import numpy
+import pytest
+
+import quadpy
+
+
+def _grid(n, d):
+    # the points of a regular grid of [0, 1]^d and the corner indices of its cubes in
+    # VTK order
+    x = numpy.linspace(0.0, 1.0, n + 1)
+    points = numpy.array(list(itertools.product(*(d * [x]))))
+    idx = numpy.arange(len(points)).reshape(d * (n + 1,))
+    if d == 2:
+        corners = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    else:
+        corners = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+        corners += [(i, j, 1) for i, j, _ in corners]
+    cells = numpy.stack(
+        [idx[tuple(slice(c, c + n) for c in corner)].reshape(-1) for corner in corners],
+        axis=1,
+    )
+    return points, cells
+
+
+def _triangles(n):
+    points, quads = _grid(n, 2)
+    return points, numpy.concatenate([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]])
+
+
+def _tetrahedra(n):
+    # Kuhn triangulation of every cube
+    points, hexs = _grid(n, 3)
+    vtk = {(0, 0, 0): 0, (1, 0, 0): 1, (1, 1, 0): 2, (0, 1, 0): 3}
+    vtk.update({(i, j, 1): k + 4 for (i, j, _), k in list(vtk.items())})
+    cells = []
+    for perm in itertools.permutations(range(3)):
+        corner = numpy.zeros(3, dtype=int)
+        path = [vtk[tuple(corner)]]
+        for p in perm:
+            corner[p] = 1
+            path.append(vtk[tuple(corner)])
+        cells.append(hexs[:, path])
+    return points, numpy.concatenate(cells)
+
+
+def _wedges(n):
+    x = numpy.linspace(0.0, 1.0, n + 1)
+    points2d, triangles = _triangles(n)
+    points = numpy.concatenate(
+        [numpy.column_stack([points2d, numpy.full(len(points2d), z)]) for z in x]
+    )
+    k = len(points2d)
+    cells = [
+        numpy.column_stack([triangles + i * k, triangles + (i + 1) * k])
+        for i in range(n)
+    ]
+    return points, numpy.concatenate(cells)
+
+
+def _pyramids(n):
+    # every cube is split into six pyramids with their apex at the cube center
+    points, hexs = _grid(n, 3)
+    centers = numpy.mean(points[hexs], axis=1)
+    apex = len(points) + numpy.arange(len(hexs))
+    points = numpy.concatenate([points, centers])
+    faces = [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [0, 1, 5, 4],
+        [1, 2, 6, 5],
+        [2, 3, 7, 6],
+        [3, 0, 4, 7],
+    ]
+    cells = [numpy.column_stack([hexs[:, face], apex]) for face in faces]
+    return points, numpy.concatenate(cells)
+
+
+def _quadrilaterals(n):
+    return _grid(n, 2)
+
+
+def _hexahedra(n):
+    return _grid(n, 3)
+
+
+_cases = [
+    (quadpy.triangle, _triangles, quadpy.triangle.strang_fix_cowper_09()),
+    (quadpy.tetrahedron, _tetrahedra, quadpy.tetrahedron.keast_4()),
+    (quadpy.quadrilateral, _quadrilaterals, quadpy.quadrilateral.stroud_c2_5_4()),
+    (quadpy.hexahedron, _hexahedra, quadpy.hexahedron.hammer_stroud_6_3()),
+    (quadpy.wedge, _wedges, quadpy.wedge.felippa_3()),
+    (quadpy.pyramid, _pyramids, quadpy.pyramid.felippa_3()),
+]
+
+
+@pytest.mark.parametrize("domain,mesh,scheme", _cases)
+def test_integrate_mesh(domain, mesh, scheme):
+    points, cells = mesh(3)
+
+    def f(x):
+        return [x[0] ** 2, x[0] * x[1]]
+
+    # The union of all cells is the unit square/cube.
+    total = domain.integrate_mesh(f, points, cells, scheme, chunk_size=7, reduce="sum")
+    assert numpy.all(numpy.abs(total - [1 / 3, 1 / 4]) < 1.0e-12)
+
+    val = domain.integrate_mesh(f, points, cells, scheme, chunk_size=7)
+    assert val.shape == (2, len(cells))
+    assert numpy.all(numpy.abs(numpy.sum(val, axis=1) - total) < 1.0e-12)
+
+    # same as with all cells at once
+    ref = domain.integrate_mesh(f, points, cells, scheme, chunk_size=len(cells))
+    assert numpy.all(numpy.abs(val - ref) < 1.0e-14)
+
+
+def _f(x):
+    return numpy.sin(x[0]) * numpy.exp(x[1])
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+@pytest.mark.parametrize("reduce", ["cell", "sum"])
+def test_integrate_mesh_parallel(pool, reduce):
+    points, cells = _tetrahedra(4)
+    scheme = quadpy.tetrahedron.keast_4()
+    ref = quadpy.tetrahedron.integrate_mesh(
+        _f, points, cells, scheme, chunk_size=17, reduce=reduce
+    )
+    val = quadpy.tetrahedron.integrate_mesh(
+        _f, points, cells, scheme, chunk_size=17, reduce=reduce, workers=3, pool=pool
+    )
+    # identical, not only close
+    assert numpy.array_equal(val, ref)
+
+
+@pytest.mark.parametrize("domain,mesh,scheme", _cases)
+def test_precompute(domain, mesh, scheme):
+    points, cells = mesh(2)
+    # the cells in the layout of scheme.integrate()
+    order = {
+        quadpy.quadrilateral: [0, 3, 1, 2],
+        quadpy.hexahedron: [0, 4, 3, 7, 1, 5, 2, 6],
+    }
+    shape = {quadpy.quadrilateral: (2, 2), quadpy.hexahedron: (2, 2, 2)}
+    cells = points[cells[:, order.get(domain, slice(None))].T]
+    cells = cells.reshape(shape.get(domain, cells.shape[:1]) + cells.shape[1:])
+
+    mapped = scheme.precompute(cells)
+    for f in [_f, lambda x: [x[0] ** 2, x[0] * x[1]]]:
+        ref = scheme.integrate(f, cells)
+        assert numpy.all(numpy.abs(mapped.integrate(f) - ref) < 1.0e-14)
+
+    mapped = scheme.precompute(cells, dtype=numpy.float32)
+    assert mapped.weights.dtype == numpy.float32
+    ref = scheme.integrate(_f, cells)
+    assert numpy.all(numpy.abs(mapped.integrate(_f) - ref) < 1.0e-6)
@@ -2,7 +2,7 @@ import numpy
 import pytest
 
 import quadpy
-from helpers import check_degree
+from helpers import check_degree, check_ridge_exactness, nball_ridge_moments
 from quadpy.nball._helpers import integrate_monomial_over_unit_nball
 
 
@@ -53,6 +53,44 @@ def test_scheme(scheme):
     return
 
 
+@pytest.mark.parametrize(
+    "scheme,n",
+    [
+        (scheme, n)
+        for scheme in [
+            quadpy.nball.dobrodeev_1970,
+            quadpy.nball.stroud_1957,
+            quadpy.nball.stroud_sn_3_1,
+            quadpy.nball.stroud_sn_5_2,
+        ]
+        for n in range(10, 21)
+    ]
+    # These have O(2**n) points
+    + [
+        (scheme, n)
+        for scheme in [
+            quadpy.nball.stroud_1967_7_c,
+            quadpy.nball.stroud_1966_a,
+            quadpy.nball.stroud_1966_b,
+            quadpy.nball.stroud_1966_c,
+            quadpy.nball.stroud_1966_d,
+        ]
+        for n in range(10, 13)
+    ],
+)
+def test_numeric_construction(scheme, n, no_sympy):
+    # float64 all the way, without sympy, and still exact
+    scheme = scheme(n)
+    assert scheme.points.dtype == numpy.float64
+    assert scheme.weights.dtype == numpy.float64
+    check_ridge_exactness(
+        lambda f: scheme.integrate(f, numpy.zeros(n), 1.0),
+        nball_ridge_moments,
+        n,
+        scheme.degree,
+    )
+
+
 if __name__ == "__main__":
     n_ = 3
     scheme_ = quadpy.nball.Stroud(n_, "Sn 2-1", symbolic=True)
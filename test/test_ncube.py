@@ -5,7 +5,7 @@ import pytest
 
 import orthopy
 import quadpy
-from helpers import check_degree_ortho
+from helpers import check_degree_ortho, check_ridge_exactness, ncube_ridge_moments
 
 
 @pytest.mark.parametrize(
@@ -82,6 +82,120 @@ def test_scheme(scheme, tol=1.0e-11):
     return
 
 
+@pytest.mark.parametrize(
+    "scheme,n",
+    [
+        (scheme, n)
+        for scheme in [
+            quadpy.ncube.dobrodeev_1970,
+            quadpy.ncube.hammer_stroud_1n,
+            quadpy.ncube.hammer_stroud_2n,
+            quadpy.ncube.stroud_1957_2,
+            quadpy.ncube.stroud_1957_3,
+            quadpy.ncube.stroud_1968,
+            quadpy.ncube.stroud_cn_3_2,
+            quadpy.ncube.stroud_cn_7_1,
+            quadpy.ncube.thacher,
+            quadpy.ncube.tyler,
+        ]
+        for n in range(10, 21)
+    ]
+    # These have O(2**n) points
+    + [
+        (scheme, n)
+        for scheme in [
+            quadpy.ncube.ewing,
+            quadpy.ncube.mustard_lyness_blatt,
+            quadpy.ncube.stroud_1966_a,
+            quadpy.ncube.stroud_1966_b,
+            quadpy.ncube.stroud_1966_c,
+            quadpy.ncube.stroud_1966_d,
+        ]
+        for n in range(10, 13)
+    ],
+)
+def test_numeric_construction(scheme, n, no_sympy):
+    # float64 all the way, without sympy, and still exact
+    scheme = scheme(n)
+    assert scheme.points.dtype == numpy.float64
+    assert scheme.weights.dtype == numpy.float64
+    # The scheme lives on [-1, 1]^n already; mapping it through the 2^n corners of
+    # ncube_points() would need gigabytes for n close to 20.
+    check_ridge_exactness(
+        lambda f: numpy.dot(f(scheme.points.T), scheme.weights),
+        ncube_ridge_moments,
+        n,
+        scheme.degree,
+    )
+
+
+@pytest.mark.parametrize(
+    "scheme",
+    [
+        quadpy.ncube.dobrodeev_1970,
+        quadpy.ncube.dobrodeev_1978,
+        quadpy.ncube.phillips,
+        quadpy.ncube.stroud_1957_3,
+        quadpy.ncube.stroud_1966_b,
+        quadpy.ncube.stroud_1966_d,
+        quadpy.ncube.stroud_1968,
+    ],
+)
+def test_symbolic(scheme, n=5):
+    numeric = scheme(n)
+    symbolic = scheme(n, symbolic=True)
+    assert numeric.weights.dtype == numpy.float64
+    assert numpy.allclose(numeric.weights, symbolic.weights, rtol=1.0e-14, atol=0.0)
+    assert numpy.allclose(numeric.points, symbolic.points, rtol=1.0e-14, atol=1.0e-14)
+
+
+@pytest.mark.parametrize("d", [2, 3, 4])
+@pytest.mark.parametrize("affine", [False, True])
+def test_get_detJ(d, affine):
+    numpy.random.seed(0)
+    xi = numpy.random.uniform(-1.0, 1.0, (d, 7))
+    cube = quadpy.ncube.ncube_points(*(d * [[0.0, 1.0]]))
+    # 10 cubes, shape (2, ..., 2, 10, d)
+    A = numpy.random.rand(10, d, d)
+    cube = numpy.dot(cube, A)
+    if not affine:
+        cube = cube + 0.1 * numpy.random.rand(*cube.shape)
+
+    # The map is linear in every xi[k], so central differences are exact.
+    J = []
+    for k in range(d):
+        h = numpy.zeros((d, 1))
+        h[k] = 0.5
+        x0 = quadpy.ncube.transform(xi - h, cube)
+        x1 = quadpy.ncube.transform(xi + h, cube)
+        J.append(x1 - x0)
+    ref = numpy.linalg.det(numpy.stack(J, axis=-2)).T
+
+    detJ = quadpy.ncube._helpers.get_detJ(xi, cube)
+    assert detJ.shape == (10, 7)
+    assert numpy.all(numpy.abs(detJ - ref) < 1.0e-13)
+
+
+def _f(x):
+    # Only arithmetic: NumPy's sin(), exp() etc. may round differently depending on the
+    # memory alignment of their input.
+    return numpy.array([x[0] * x[1] / (1.0 + x[2]), x[2] ** 2])
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_integrate_parallel(pool):
+    # 100 hexahedra, shape (2, 2, 2, 100, 3)
+    cube = quadpy.ncube.ncube_points([0.0, 1.0], [0.0, 1.0], [0.0, 1.0])
+    cube = cube[..., None, :] + 0.1 * numpy.random.rand(2, 2, 2, 100, 3)
+    scheme = quadpy.ncube.stroud_cn_5_2(3)
+    ref = scheme.integrate(_f, cube, chunk_size=7)
+    val = scheme.integrate(_f, cube, chunk_size=7, workers=4, pool=pool)
+    assert val.shape == (2, 100)
+    # identical, not only close
+    assert numpy.array_equal(val, ref)
+    assert numpy.allclose(val, scheme.integrate(_f, cube), rtol=1.0e-14, atol=0.0)
+
+
 if __name__ == "__main__":
     n_ = 4
     scheme_ = quadpy.ncube.Stroud(n_, "Cn 7-1")
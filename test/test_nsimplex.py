@@ -1,8 +1,10 @@
+import math
+
 import numpy
 import pytest
 
 import quadpy
-from helpers import check_degree
+from helpers import check_degree, check_ridge_exactness, nsimplex_ridge_moments
 from quadpy.nsimplex._helpers import integrate_monomial_over_unit_simplex
 
 
@@ -57,6 +59,84 @@ def test_scheme(scheme):
     return
 
 
+@pytest.mark.parametrize("n", [2, 3, 4])
+@pytest.mark.parametrize("degree", [1, 5, 9])
+def test_get_good_scheme(n, degree, good_scheme_index):
+    scheme = quadpy.nsimplex.get_good_scheme(n, degree)
+    assert scheme.dim == n
+    assert scheme.degree >= degree
+
+
+@pytest.mark.parametrize(
+    "scheme",
+    [
+        lambda n: quadpy.nsimplex.grundmann_moeller(n, 3),
+        quadpy.nsimplex.stroud_tn_3_3,
+        quadpy.nsimplex.stroud_tn_3_2,
+        quadpy.nsimplex.stroud_tn_5_1,
+        quadpy.nsimplex.stroud_tn_5_2,
+        quadpy.nsimplex.walkington_3,
+    ],
+)
+@pytest.mark.parametrize("n", range(10, 21))
+def test_numeric_construction(scheme, n, no_sympy):
+    # float64 all the way, without sympy, and still exact
+    scheme = scheme(n)
+    assert scheme.points.dtype == numpy.float64
+    assert scheme.weights.dtype == numpy.float64
+    simplex = numpy.vstack([numpy.zeros(n), numpy.eye(n)])
+    check_ridge_exactness(
+        lambda f: scheme.integrate(f, simplex),
+        nsimplex_ridge_moments,
+        n,
+        scheme.degree,
+    )
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_symbolic(n):
+    numeric = quadpy.nsimplex.grundmann_moeller(n, 2)
+    symbolic = quadpy.nsimplex.grundmann_moeller(n, 2, symbolic=True)
+    assert numeric.weights.dtype == numpy.float64
+    assert numpy.allclose(numeric.weights, symbolic.weights, rtol=1.0e-14, atol=0.0)
+    assert numpy.allclose(numeric.points, symbolic.points, rtol=1.0e-14, atol=0.0)
+
+
+def test_get_vol():
+    # unit simplices of all dimensions, two at once
+    for n in range(1, 6):
+        simplex = numpy.zeros((n + 1, 2, n))
+        simplex[1:, :, :] = numpy.eye(n)[:, None, :]
+        simplex[:, 1] *= 2.0
+        ref = numpy.array([1.0, 2.0 ** n]) / math.factorial(n)
+        assert numpy.all(abs(quadpy.nsimplex.get_vol(simplex) - ref) < 1.0e-14 * ref)
+
+    # embedded in higher dimensions
+    triangle = numpy.array([[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0]])
+    assert abs(quadpy.nsimplex.get_vol(triangle) - 0.5) < 1.0e-14
+    tet = numpy.array([[0, 0, 0, 5], [1, 0, 0, 5], [0, 1, 0, 5], [0, 0, 1, 5]])
+    assert abs(quadpy.nsimplex.get_vol(tet) - 1.0 / 6.0) < 1.0e-14
+
+
+def _f(x):
+    # Only arithmetic: NumPy's sin(), exp() etc. may round differently depending on the
+    # memory alignment of their input.
+    return numpy.array([x[0] * x[1] / (1.0 + x[2]), x[2] ** 2])
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_integrate_parallel(pool):
+    # 100 tetrahedra, shape (4, 100, 3)
+    simplex = numpy.random.rand(4, 100, 3)
+    scheme = quadpy.nsimplex.grundmann_moeller(3, 2)
+    ref = scheme.integrate(_f, simplex, chunk_size=7)
+    val = scheme.integrate(_f, simplex, chunk_size=7, workers=4, pool=pool)
+    assert val.shape == (2, 100)
+    # identical, not only close
+    assert numpy.array_equal(val, ref)
+    assert numpy.allclose(val, scheme.integrate(_f, simplex), rtol=1.0e-14, atol=0.0)
+
+
 if __name__ == "__main__":
     n_ = 3
     scheme_ = quadpy.nsimplex.Stroud(n_, "Tn 5-1")
@@ -99,6 +99,13 @@ def test_show(scheme):
     return
 
 
+@pytest.mark.parametrize("degree", range(6))
+def test_get_good_scheme(degree, good_scheme_index):
+    scheme = quadpy.pyramid.get_good_scheme(degree)
+    assert scheme.degree >= degree
+    assert numpy.all(scheme.weights > 0)
+
+
 if __name__ == "__main__":
     scheme_ = quadpy.pyramid.Felippa(3)
     test_scheme(scheme_)
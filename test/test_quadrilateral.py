@@ -300,6 +300,14 @@ def test_show(scheme):
     return
 
 
+@pytest.mark.parametrize("degree", [1, 3, 5])
+def test_get_good_scheme(degree, good_scheme_index):
+    scheme = quadpy.quadrilateral.get_good_scheme(degree)
+    assert scheme.degree >= degree
+    assert numpy.all(scheme.weights > 0)
+    assert quadpy.quadrilateral.get_good_scheme(1000) is None
+
+
 if __name__ == "__main__":
     # scheme_ = Product(quadpy.line_segment.gauss_legendre(6))
     # scheme_ = quadpy.quadrilateral.HammerStroud("3-2")
@@ -22,3 +22,64 @@ def test_args():
 
     ref = -17.960170286650353
     assert abs(val - ref) < 1.0e-8 * abs(ref)
+
+
+def test_singular():
+    # Without extrapolation, these exceed the default limit of subintervals.
+    val, err = quadpy.quad(lambda x: 1 / numpy.sqrt(x), 0.0, 1.0)
+    assert abs(val - 2.0) < 1.0e-13
+    assert err < 1.0e-13
+
+    val, err = quadpy.quad(numpy.log, 0.0, 1.0)
+    assert abs(val + 1.0) < 1.0e-13
+    assert err < 1.0e-13
+
+    val, err = quadpy.quad(lambda x: 1 / (1 + x) ** 1.5, 0.0, numpy.inf)
+    assert abs(val - 2.0) < 1.0e-13
+    assert err < 1.0e-13
+
+
+def test_double_exponential():
+    for f, a, b, ref in [
+        (lambda x: 1 / (1 + x ** 2), 0.0, numpy.inf, numpy.pi / 2),
+        (lambda x: 1 / (1 + x ** 2), -numpy.inf, 1.0, 3 * numpy.pi / 4),
+        (lambda x: 1 / (1 + x ** 2), -numpy.inf, numpy.inf, numpy.pi),
+        (lambda x: 1 / (1 + x ** 2), 0.0, 1.0, numpy.pi / 4),
+    ]:
+        val, err = quadpy.quad(f, a, b, epsabs=1.0e-10, method="double_exponential")
+        assert abs(val - ref) < 1.0e-10
+        assert err < 1.0e-10
+
+
+def test_quad_vec():
+    # many parametrized integrands
+    k = numpy.linspace(1.0, 50.0, 1000)
+    val, err, info = quadpy.quad_vec(
+        lambda x: numpy.sin(numpy.multiply.outer(k, x)), 0.0, 1.0, full_output=True
+    )
+    ref = (1 - numpy.cos(k)) / k
+    assert val.shape == (1000,)
+    assert numpy.linalg.norm(val - ref) < 1.0e-8 * numpy.linalg.norm(ref)
+    assert info["num_evaluations"] > 0
+
+    # arrays of limits, per-component tolerances
+    a = numpy.array([0.0, 1.0, 2.0])
+    b = numpy.array([1.0, 3.0, 10.0])
+    val, err, info = quadpy.quad_vec(
+        lambda x: [numpy.exp(x), numpy.sin(10 * x)],
+        a,
+        b,
+        epsabs=[1.0e-13, 1.0e-5],
+        epsrel=0.0,
+        norm="max",
+        full_output=True,
+    )
+    ref = [numpy.exp(b) - numpy.exp(a), (numpy.cos(10 * a) - numpy.cos(10 * b)) / 10]
+    assert val.shape == (2, 3)
+    assert numpy.all(err[0] < 1.0e-13)
+    assert numpy.all(err[1] < 1.0e-5)
+    assert numpy.all(numpy.abs(val - ref)[0] < 1.0e-13)
+    assert numpy.all(numpy.abs(val - ref)[1] < 1.0e-5)
+    # the long interval needs more refinement than the short ones
+    assert info["num_evaluations"].shape == (3,)
+    assert info["num_evaluations"][2] > info["num_evaluations"][0]
@@ -0,0 +1,60 @@
+import json
+
+import numpy
+
+import quadpy
+
+
+def test_scheme():
+    scheme = quadpy.triangle.strang_fix_cowper_09()
+    triangles = numpy.array(
+        [[[0.0, 0.0], [1.0, 0.0]], [[1.0, 0.0], [1.0, 1.0]], [[0.0, 1.0], [0.0, 1.0]]]
+    )
+    with quadpy.helpers.collect_stats() as stats:
+        scheme.integrate(lambda x: numpy.exp(x[0]), triangles)
+
+    assert stats.num_integrations == 1
+    assert stats.num_f_calls == 1
+    assert stats.num_points == 2 * len(scheme.weights)
+    assert stats.levels == 0
+    times = stats.times
+    assert set(times) == {"map", "evaluate", "reduce", "total"}
+    assert times["map"] + times["evaluate"] + times["reduce"] <= times["total"] * 1.01
+
+    # not recorded anymore
+    scheme.integrate(lambda x: numpy.exp(x[0]), triangles)
+    assert stats.num_integrations == 1
+
+
+def test_adaptive():
+    with quadpy.helpers.collect_stats() as stats:
+        _, _, info = quadpy.line_segment.integrate_adaptive(
+            lambda x: numpy.sin(10 * x), [0.0, 2.0], 1.0e-10, full_output=True
+        )
+    assert stats.num_integrations == 1
+    assert stats.num_points == info["num_evaluations"]
+    assert stats.levels > 0
+
+    # nested integrations are part of the outer record
+    with quadpy.helpers.collect_stats() as stats:
+        quadpy.quad(lambda x: numpy.exp(-(x ** 2)), -numpy.inf, numpy.inf)
+    assert stats.num_integrations == 1
+    assert stats.records[0].name == "quadpy._scipy_compat.quad"
+
+
+def test_nested():
+    with quadpy.helpers.collect_stats() as outer:
+        quadpy.tanh_sinh(lambda x: numpy.exp(x), 0.0, 1.0, 1.0e-10)
+        with quadpy.helpers.collect_stats() as inner:
+            quadpy.tanh_sinh(lambda x: numpy.exp(x), 0.0, 1.0, 1.0e-10)
+    assert inner.num_integrations == 1
+    assert outer.num_integrations == 2
+    assert outer.num_points == 2 * inner.num_points
+
+    d = outer.as_dict()
+    json.dumps(d)
+    assert d["by_name"]["quadpy._tanh_sinh.tanh_sinh"]["num_integrations"] == 2
+
+
+if __name__ == "__main__":
+    test_scheme()
@@ -0,0 +1,85 @@
+import json
+
+import numpy
+import pytest
+
+import quadpy
+from quadpy.helpers import good_schemes, store
+
+_expand_src = """
+import numpy
+
+
+def _expand(data):
+    degree = data.pop("degree")
+    weights = numpy.array(data["weights"])
+    points = numpy.array(data["points"])
+    return degree, weights / numpy.sum(weights), points
+"""
+
+
+@pytest.fixture
+def tables(tmp_path, monkeypatch):
+    # a small fake package with JSON tables
+    root = tmp_path / "fakepkg"
+    (root / "_tables").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "_tables" / "__init__.py").write_text(_expand_src)
+    for k in range(1, 4):
+        data = {
+            "degree": k,
+            "weights": list(range(1, k + 2)),
+            "points": [[0.1 * i, 0.2 * i] for i in range(k + 1)],
+        }
+        (root / "_tables" / f"t{k}.json").write_text(json.dumps(data))
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(store, "_quadpy_dir", str(root))
+    monkeypatch.setattr(store, "_blob_file", str(root / "_scheme_store.npy"))
+    monkeypatch.setattr(store, "_index_file", str(root / "_scheme_store.json"))
+    store._load_store.cache_clear()
+    yield root
+    store._load_store.cache_clear()
+
+
+def test_store(tables):
+    from fakepkg._tables import _expand
+
+    filename = str(tables / "_tables" / "t3.json")
+    # without a store, the JSON file is parsed
+    degree0, weights0, points0 = store.read_table(filename, _expand)
+    assert degree0 == 3
+    assert weights0.flags.writeable
+
+    assert store.build_store() == 3
+
+    degree1, weights1, points1 = store.read_table(filename, _expand)
+    assert degree1 == 3
+    assert numpy.array_equal(weights0, weights1)
+    assert numpy.array_equal(points0, points1)
+    assert points1.shape == (4, 2)
+    # slices of the memory-mapped blob
+    assert not weights1.flags.writeable
+    assert not weights1.flags.owndata
+
+
+def test_good_scheme_index(tmp_path, monkeypatch):
+    # the lookup uses the prebuilt index and doesn't construct any other schemes
+    index_file = tmp_path / "_good_schemes.json"
+    index_file.write_text(json.dumps({"pyramid": {"None": [["felippa_2", []]] * 3}}))
+    monkeypatch.setattr(good_schemes, "_index_file", str(index_file))
+    good_schemes._load_index.cache_clear()
+    monkeypatch.setattr(good_schemes, "build_index", None)
+
+    assert quadpy.pyramid.get_good_scheme(2).name == "Felippa 2"
+    assert quadpy.pyramid.get_good_scheme(3) is None
+    good_schemes._load_index.cache_clear()
+
+    # no scan over the schemes if the index doesn't cover a domain or is missing
+    with pytest.raises(ValueError):
+        quadpy.wedge.get_good_scheme(2)
+    monkeypatch.setattr(good_schemes, "_index_file", str(tmp_path / "missing.json"))
+    good_schemes._load_index.cache_clear()
+    with pytest.raises(FileNotFoundError):
+        quadpy.pyramid.get_good_scheme(2)
+    good_schemes._load_index.cache_clear()
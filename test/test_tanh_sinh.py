@@ -1,7 +1,11 @@
+import concurrent.futures
+
+import mpmath
 import numpy
 import pytest
 import sympy
 from mpmath import mp
+from scipy.special import gamma
 
 import quadpy
 
@@ -122,6 +126,59 @@ def test_tanh_sinh_numpy_example():
     return
 
 
+def test_cached_levels():
+    from quadpy._tanh_sinh import _tables as tables
+
+    tables.clear()
+
+    def f(x):
+        return numpy.exp(x) * numpy.cos(x)
+
+    val0, _ = quadpy.tanh_sinh(f, 0.0, numpy.pi / 2, 1.0e-14)
+    misses = tables.info().misses
+    assert misses > 0
+    val1, _ = quadpy.tanh_sinh(f, 0.0, numpy.pi / 2, 1.0e-14)
+    assert val0 == val1
+    assert tables.info().misses == misses
+
+    # other intervals reuse the levels
+    hits = tables.info().hits
+    quadpy.tanh_sinh(f, -1.0, 1.0, 1.0e-14)
+    assert tables.info().hits > hits
+
+
+def test_vec():
+    a = numpy.linspace(0.0, 1.0, 4)
+    b = a + numpy.array([0.5, 1.0, 1.5, 2.0])
+
+    def f(x):
+        return numpy.array([numpy.exp(x), numpy.cos(x)])
+
+    with quadpy.helpers.collect_stats() as stats:
+        val, err, info = quadpy.tanh_sinh_vec(f, a, b, 1.0e-10, full_output=True)
+    assert val.shape == (2, 4)
+    assert numpy.all(numpy.abs(val[0] - (numpy.exp(b) - numpy.exp(a))) < 1.0e-10)
+    assert numpy.all(numpy.abs(val[1] - (numpy.sin(b) - numpy.sin(a))) < 1.0e-10)
+    assert numpy.all(err < 1.0e-10)
+    # integrals are retired individually
+    assert len(numpy.unique(info["levels"])) > 1
+    # one call per level
+    assert stats.num_f_calls == numpy.max(info["levels"]) + 1
+    assert stats.num_points == numpy.sum(info["num_evaluations"])
+
+    # same values as the scalar version
+    for k in range(len(a)):
+        ref, ref_err = quadpy.tanh_sinh(numpy.exp, a[k], b[k], 1.0e-10)
+        assert abs(val[0, k] - ref) < 1.0e-13
+        assert abs(err[0, k] - ref_err) < 1.0e-13
+
+
+def test_vec_singular():
+    b = numpy.array([[1.0, 2.0], [3.0, 4.0]])
+    val, _ = quadpy.tanh_sinh_vec(numpy.log, 0.0, b, 1.0e-10)
+    assert numpy.all(numpy.abs(val - (b * numpy.log(b) - b)) < 1.0e-10)
+
+
 # Test functions with singularities at both ends.
 @pytest.mark.parametrize(
     "f_left, f_right, b, exact",
@@ -209,6 +266,179 @@ def test_low_precision(f, a, b, exact):
     return
 
 
+def _f(t):
+    return mp.exp(t) * mp.cos(t)
+
+
+def _f1(t):
+    return mp.exp(t) * (mp.cos(t) - mp.sin(t))
+
+
+def _f2(t):
+    return -2 * mp.exp(t) * mp.sin(t)
+
+
+def test_workers():
+    from quadpy._tanh_sinh import _tables
+
+    mp.dps = 30
+    tol = 10 ** (-mp.dps)
+    exact = (mp.exp(mp.pi / 2) - 1) / 2
+    for f_derivatives in [None, {1: _f1, 2: _f2}]:
+        # the nodes are computed in the workers, too
+        _tables.clear()
+        val, err = quadpy.tanh_sinh(
+            _f, 0, mp.pi / 2, tol, f_derivatives=f_derivatives, mode="mpmath"
+        )
+        _tables.clear()
+        val2, err2 = quadpy.tanh_sinh(
+            _f,
+            0,
+            mp.pi / 2,
+            tol,
+            f_derivatives=f_derivatives,
+            mode="mpmath",
+            workers=2,
+        )
+        assert abs(val - exact) < 10 * tol
+        # identical to the serial results
+        assert val2 == val
+        assert err2 == err
+
+
+def test_executor():
+    # one pool for several integrations
+    mp.dps = 30
+    tol = 10 ** (-mp.dps)
+    val, err = quadpy.tanh_sinh(_f, 0, mp.pi / 2, tol, mode="mpmath")
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        for _ in range(2):
+            val2, err2 = quadpy.tanh_sinh(
+                _f, 0, mp.pi / 2, tol, mode="mpmath", executor=executor
+            )
+            assert val2 == val
+            assert err2 == err
+
+
+@pytest.mark.parametrize(
+    "f, exact",
+    [
+        (lambda x: numpy.exp(-x), 1.0),
+        (lambda x: 1 / (1 + x ** 2), numpy.pi / 2),
+        (lambda x: numpy.exp(-x) / numpy.sqrt(x), numpy.sqrt(numpy.pi)),
+        (lambda x: numpy.log(x) * numpy.exp(-x), -numpy.euler_gamma),
+    ],
+)
+def test_exp_sinh(f, exact):
+    val, err = quadpy.exp_sinh(f, 0.0, 1.0e-10)
+    assert abs(val - exact) < 1.0e-10
+    assert err < 1.0e-10
+
+
+@pytest.mark.parametrize(
+    "f, exact",
+    [
+        (lambda x: numpy.exp(-(x ** 2)), numpy.sqrt(numpy.pi)),
+        (lambda x: 1 / (1 + x ** 2), numpy.pi),
+        (lambda x: numpy.exp(-((x - 3) ** 2)), numpy.sqrt(numpy.pi)),
+    ],
+)
+def test_sinh_sinh(f, exact):
+    val, err = quadpy.sinh_sinh(f, 1.0e-10)
+    assert abs(val - exact) < 1.0e-10
+    assert err < 1.0e-10
+
+
+@pytest.mark.parametrize("p", [1.1, 1.2, 1.3, 1.4])
+def test_slow_decay(p):
+    # The tails beyond 1/eps**3 aren't negligible for these.
+    val, err = quadpy.exp_sinh(lambda x: (1 + x) ** -p, 0.0, 1.0e-10)
+    assert abs(val - 1 / (p - 1)) < 1.0e-10
+    assert err < 1.0e-10
+
+    val, err = quadpy.quad(
+        lambda x: (1 + x) ** -p, 0.0, numpy.inf, method="double_exponential"
+    )
+    assert abs(val - 1 / (p - 1)) < 1.0e-8
+
+    val, err = quadpy.sinh_sinh(lambda x: (1 + x ** 2) ** (-p / 2), 1.0e-10)
+    exact = numpy.sqrt(numpy.pi) * gamma((p - 1) / 2) / gamma(p / 2)
+    assert abs(val - exact) < 1.0e-10 * exact
+
+
+def test_not_converged():
+    # Even the longest range of nodes misses a part of the tail.
+    with pytest.warns(UserWarning, match="not reached"):
+        val, err = quadpy.exp_sinh(lambda x: (1 + x) ** -1.02, 0.0, 1.0e-10)
+    assert err > 1.0e-10
+
+
+def test_infinite_mpmath():
+    mp.dps = 50
+    tol = 10 ** (-mp.dps)
+    val, _ = quadpy.exp_sinh(lambda x: mp.exp(-x) / mp.sqrt(x), 0, tol, mode="mpmath")
+    assert abs(val - mp.sqrt(mp.pi)) < 10 * tol
+    val, _ = quadpy.sinh_sinh(lambda x: 1 / (1 + x ** 2), tol, mode="mpmath")
+    assert abs(val - mp.pi) < 10 * tol
+
+
+def test_private_context():
+    def integrate(dps):
+        ctx = mpmath.MPContext()
+        ctx.dps = dps
+        val, _ = quadpy.tanh_sinh(
+            lambda t: ctx.exp(t) * ctx.cos(t),
+            0,
+            ctx.pi / 2,
+            ctx.mpf(10) ** -dps,
+            mode="mpmath",
+            ctx=ctx,
+        )
+        assert ctx.dps == dps
+        return abs(val - (ctx.exp(ctx.pi / 2) - 1) / 2) < ctx.mpf(10) ** (1 - dps)
+
+    with mp.workdps(15):
+        assert integrate(40)
+        # the global precision isn't touched
+        assert mp.dps == 15
+
+        # concurrent integrations at different precisions
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            assert all(executor.map(integrate, 2 * [20, 30, 40, 50]))
+
+        ctx = mpmath.MPContext()
+        ctx.dps = 30
+        val, _ = quadpy.sinh_sinh(
+            lambda x: 1 / (1 + x ** 2), ctx.mpf(10) ** -30, mode="mpmath", ctx=ctx
+        )
+        assert abs(val - ctx.pi) < ctx.mpf(10) ** -29
+        assert mp.dps == 15
+
+
+def test_global_precision():
+    # Without ctx, integrands which use mp work at the requested precision.
+    with mp.workdps(15):
+        val, _ = quadpy.tanh_sinh(
+            lambda x: mp.exp(x), 0, 1, mp.mpf("1e-40"), mode="mpmath"
+        )
+        val2, _ = quadpy.exp_sinh(
+            lambda x: mp.exp(-x), 0, mp.mpf("1e-40"), mode="mpmath"
+        )
+        assert mp.dps == 15
+    with mp.workdps(50):
+        assert abs(val - (mp.e - 1)) < 1.0e-40
+        assert abs(val2 - 1) < 1.0e-40
+
+    # With ctx, they don't, and that is pointed out.
+    ctx = mpmath.MPContext()
+    ctx.dps = 40
+    with mp.workdps(15):
+        with pytest.warns(UserWarning, match="precision of ctx"):
+            quadpy.tanh_sinh(
+                lambda x: mp.exp(x), 0, 1, ctx.mpf("1e-40"), mode="mpmath", ctx=ctx
+            )
+
+
 if __name__ == "__main__":
     # test_tanh_sinh(
     #     lambda t: 1, 0, 1, 1
@@ -179,6 +179,14 @@ def test_show(scheme):
     return
 
 
+@pytest.mark.parametrize("degree", [1, 3, 5])
+def test_get_good_scheme(degree, good_scheme_index):
+    scheme = quadpy.tetrahedron.get_good_scheme(degree)
+    assert scheme.degree >= degree
+    assert numpy.all(scheme.weights > 0)
+    assert quadpy.tetrahedron.get_good_scheme(1000) is None
+
+
 if __name__ == "__main__":
     # scheme_ = quadpy.tetrahedron.Stroud("T3 7-1")
     # test_scheme(scheme_)
@@ -408,6 +408,14 @@ def test_multidim():
     # assert val.shape == (3,)
 
 
+@pytest.mark.parametrize("degree", [1, 3, 5])
+def test_get_good_scheme(degree, good_scheme_index):
+    scheme = quadpy.triangle.get_good_scheme(degree)
+    assert scheme.degree >= degree
+    assert numpy.all(scheme.weights > 0)
+    assert quadpy.triangle.get_good_scheme(1000) is None
+
+
 if __name__ == "__main__":
     test_multidim()
     # scheme_ = quadpy.triangle.WandzuraXiao(3)
@@ -127,6 +127,11 @@ def test_show(scheme):
     return
 
 
+def test_get_good_scheme(good_scheme_index):
+    assert quadpy.wedge.get_good_scheme(3).degree >= 3
+    assert quadpy.wedge.get_good_scheme(1000) is None
+
+
 if __name__ == "__main__":
     scheme_ = quadpy.wedge.Felippa(2)
     test_scheme(scheme_)
@@ -0,0 +1,29 @@
+"""
+Scaling of line_segment.integrate_adaptive with the number of simultaneous intervals.
+Every interval needs a few refinement steps. Needs perfplot.
+"""
+import numpy
+import perfplot
+
+import quadpy
+
+
+def setup(n):
+    a = 0.5 * numpy.arange(n, dtype=float)
+    return numpy.array([a, a + 1.0])
+
+
+def integrate(intervals):
+    val, _ = quadpy.line_segment.integrate_adaptive(
+        lambda x: numpy.sin(50 * x), intervals, eps_abs=1.0e-10, eps_rel=None
+    )
+    return val
+
+
+perfplot.show(
+    setup=setup,
+    kernels=[integrate],
+    n_range=[10 ** k for k in range(7)],
+    xlabel="number of intervals",
+    equality_check=None,
+)
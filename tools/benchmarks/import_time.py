@@ -0,0 +1,33 @@
+"""
+Time of `import quadpy` in a fresh interpreter, compared with loading all domain
+packages (what `import quadpy` did before the lazy imports). For the details, run
+`python -X importtime -c "import quadpy"`.
+"""
+import subprocess
+import sys
+
+TIMED = """
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(code, repeat=5):
+    # best of `repeat`, in ms
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMED.format(code)],
+            check=True,
+            stdout=subprocess.PIPE,
+        )
+        times.append(float(out.stdout))
+    return 1000 * min(times)
+
+
+lazy = import_time("import quadpy")
+eager = import_time("import quadpy\nfor name in quadpy.__all__: getattr(quadpy, name)")
+print(f"import quadpy:                     {lazy:7.1f} ms")
+print(f"import quadpy, all domains loaded: {eager:7.1f} ms")
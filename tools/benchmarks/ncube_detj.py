@@ -0,0 +1,50 @@
+"""
+Time of ncube.get_detJ for many quadrilaterals/hexahedra, general and affine, compared
+with the generic numpy.linalg.det() code it replaces. Needs perfplot.
+"""
+import numpy
+import perfplot
+
+import quadpy
+from quadpy.helpers import n_outer
+from quadpy.ncube._helpers import get_detJ
+
+
+def generic(xi, cube):
+    d = xi.shape[0]
+    one_mp_xi = numpy.stack([0.5 * (1.0 - xi), 0.5 * (1.0 + xi)], axis=1)
+    J = []
+    for k in range(d):
+        a = one_mp_xi.copy()
+        a[k, 0, :] = -0.5
+        a[k, 1, :] = +0.5
+        a0 = n_outer(a)
+        J.append(numpy.tensordot(a0, cube, axes=(range(d), range(d))).T)
+    J = numpy.array(J)
+    J = numpy.moveaxis(J, (0, 1), (-2, -1))
+    return numpy.linalg.det(J)
+
+
+def setup(k, d, affine):
+    cube = quadpy.ncube.ncube_points(*(d * [[0.0, 1.0]]))
+    # k copies of the unit cube, shape (2, ..., 2, k, d)
+    cube = numpy.moveaxis(numpy.multiply.outer(cube, numpy.ones(k)), -1, -2)
+    if not affine:
+        cube = cube + 0.1 * numpy.random.rand(*cube.shape)
+    return cube
+
+
+for d, scheme, name in [
+    (2, quadpy.quadrilateral.stroud_c2_7_2(), "quadrilaterals"),
+    (3, quadpy.hexahedron.product(quadpy.line_segment.gauss_legendre(3)), "hexahedra"),
+]:
+    xi = scheme.points.T
+    for affine in [False, True]:
+        perfplot.show(
+            setup=lambda k, d=d, affine=affine: setup(k, d, affine),
+            kernels=[lambda cube: generic(xi, cube), lambda cube: get_detJ(xi, cube)],
+            labels=["generic", "get_detJ"],
+            n_range=[2 ** k for k in range(20)],
+            xlabel=f"number of {'affine ' if affine else ''}{name}",
+            equality_check=numpy.allclose,
+        )
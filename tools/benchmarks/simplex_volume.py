@@ -0,0 +1,56 @@
+"""
+Time and peak memory of nsimplex.get_vol for many triangles/tetrahedra, compared with
+the Cayley-Menger determinant it replaces. Needs perfplot.
+"""
+import math
+import tracemalloc
+
+import numpy
+import perfplot
+
+import quadpy
+
+
+def cayley_menger(simplex):
+    edges = numpy.subtract(simplex[:, None], simplex[None, :])
+    ei_dot_ej = numpy.einsum("...k,...k->...", edges, edges)
+
+    j = simplex.shape[0] - 1
+    a = numpy.empty((j + 2, j + 2) + ei_dot_ej.shape[2:])
+    a[1:, 1:] = ei_dot_ej
+    a[0, 1:] = 1.0
+    a[1:, 0] = 1.0
+    a[0, 0] = 0.0
+
+    a = numpy.moveaxis(a, (0, 1), (-2, -1))
+    det = numpy.linalg.det(a)
+    return numpy.sqrt((-1.0) ** (j + 1) / 2 ** j / math.factorial(j) ** 2 * det)
+
+
+kernels = [cayley_menger, quadpy.nsimplex.get_vol]
+
+
+def peak_memory(fun, simplex):
+    tracemalloc.start()
+    fun(simplex)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+for n, d, name in [
+    (2, 2, "triangles in 2D"),
+    (2, 3, "triangles in 3D"),
+    (3, 3, "tets"),
+]:
+    simplex = numpy.random.rand(n + 1, 10 ** 6, d)
+    print(f"peak memory for 10^6 {name}:")
+    for fun in kernels:
+        print(f"  {fun.__name__}: {peak_memory(fun, simplex) / 2 ** 20:.1f} MiB")
+
+    perfplot.show(
+        setup=lambda k, n=n, d=d: numpy.random.rand(n + 1, k, d),
+        kernels=kernels,
+        n_range=[2 ** k for k in range(21)],
+        xlabel=f"number of {name}",
+    )
@@ -0,0 +1,27 @@
+"""
+Construction time of some of the dimension-parametrized schemes in 10 to 20 dimensions,
+exact (sympy) versus float64. Needs perfplot.
+"""
+import perfplot
+
+import quadpy
+
+for scheme in [
+    quadpy.ncube.stroud_cn_5_2,
+    quadpy.ncube.stroud_cn_7_1,
+    quadpy.nsimplex.stroud_1969,
+    quadpy.nball.stroud_sn_5_2,
+    quadpy.enr2.stroud_enr2_5_2,
+]:
+    perfplot.show(
+        setup=lambda n: n,
+        kernels=[
+            lambda n, scheme=scheme: scheme(n, symbolic=True),
+            lambda n, scheme=scheme: scheme(n, symbolic=False),
+        ],
+        labels=["symbolic=True", "symbolic=False"],
+        n_range=list(range(10, 21)),
+        xlabel=f"dimension ({scheme.__name__})",
+        equality_check=None,
+        logx=False,
+    )
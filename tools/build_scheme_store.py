@@ -0,0 +1,13 @@
+"""
+Expand all table-based schemes (JSON) into the binary scheme store
+quadpy/_scheme_store.{npy,json} and build the index for get_good_scheme()
+(quadpy/_good_schemes.json). Rerun after changing or adding schemes.
+"""
+from quadpy.helpers.good_schemes import build_good_scheme_index
+from quadpy.helpers.store import build_store
+
+n = build_store()
+print(f"Stored {n} tables.")
+
+index = build_good_scheme_index()
+print(f"Indexed {len(index)} domains.")